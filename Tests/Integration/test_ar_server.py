@@ -0,0 +1,121 @@
+"""
+ARBridgeServer protocol over a real asyncio socket
+
+Run with: python -m pytest Tests
+"""
+
+import asyncio
+import copy
+import json
+
+import pytest
+
+from ar_server import ARBridgeServer
+from unity_ar import UnityARBridge
+
+
+FIELD = {
+    "id": "field_ws",
+    "name": "Socket Field",
+    "epoch": "epoch_1",
+    "geometry_nodes": [
+        {"id": "anchor", "layer": "physical_reality",
+         "coordinates": {"lat": -37.8179, "lng": 144.9690}, "geometry_type": "circle"},
+        {"id": "drift", "layer": "digital_overlay",
+         "coordinates": {"x": 0.0, "y": 0.0, "z": 1.0}, "geometry_type": "spiral"}
+    ],
+    "physical_location": {"lat": -37.8179, "lng": 144.9690},
+    "sacred_pattern": "●-socket"
+}
+
+
+def moved(x: float):
+    field = copy.deepcopy(FIELD)
+    field["geometry_nodes"][1]["coordinates"]["x"] = x
+    return field
+
+
+async def receive(reader: asyncio.StreamReader):
+    return json.loads(await asyncio.wait_for(reader.readline(), timeout=5))
+
+
+async def send(writer: asyncio.StreamWriter, message):
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+def run_with_server(scenario, **kwargs):
+    async def main():
+        bridge = UnityARBridge()
+        bridge.create_field_scene(FIELD)
+        async with ARBridgeServer(bridge, port=0, batch_interval=None, **kwargs) as server:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            try:
+                return await scenario(server, reader, writer)
+            finally:
+                writer.close()
+    
+    return asyncio.run(main())
+
+
+def test_subscribe_delta_then_overflow_resync():
+    async def scenario(server, reader, writer):
+        await send(writer, {"op": "subscribe", "field_id": "field_ws"})
+        snapshot = await receive(reader)
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["version"] == 1
+        
+        server.update_field(moved(2.0))
+        assert server.flush() == {"field_ws": 2}
+        delta = await receive(reader)
+        assert delta["type"] == "delta"
+        assert (delta["base_version"], delta["version"]) == (1, 2)
+        assert [marker["id"] for marker in delta["updated"]] == ["drift"]
+        assert delta["added"] == [] and delta["removed"] == []
+        
+        # Three deltas queued before the send loop runs overflow max_queue=2:
+        # the queue is dropped and the client gets one fresh snapshot instead
+        for x in (3.0, 4.0, 5.0):
+            server.update_field(moved(x))
+            server.flush()
+        resync = await receive(reader)
+        assert resync["type"] == "snapshot"
+        assert resync["version"] == 5
+        assert resync["scene"] == server.bridge.export_for_unity("field_ws")
+        
+        await send(writer, {"op": "ping"})
+        assert await receive(reader) == {"type": "pong"}
+    
+    run_with_server(scenario, max_queue=2)
+
+
+def test_line_over_stream_limit_disconnects_the_client():
+    async def scenario(server, reader, writer):
+        await send(writer, {"op": "subscribe", "field_id": "field_ws"})
+        assert (await receive(reader))["type"] == "snapshot"
+        assert len(server.clients) == 1 and "field_ws" in server._subscribers
+        
+        # asyncio's default stream limit is 64 KiB
+        writer.write(b'{"op": "ping", "pad": "' + b"x" * (1 << 17) + b'"}\n')
+        await writer.drain()
+        assert await receive(reader) == {"type": "error", "message": "line too long"}
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b""
+        await asyncio.sleep(0)
+        assert server.clients == set()
+        assert server._subscribers == {}
+        
+        # The server keeps serving other clients
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        try:
+            await send(writer, {"op": "ping"})
+            assert await receive(reader) == {"type": "pong"}
+        finally:
+            writer.close()
+    
+    run_with_server(scenario)
+
+
+def test_publish_requires_the_running_loop():
+    server = ARBridgeServer(UnityARBridge())
+    with pytest.raises(RuntimeError):
+        server.publish("field_ws")
@@ -0,0 +1,131 @@
+"""
+MCPClient against a local stub DOJO server
+
+Run with: python -m pytest Tests
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from field_backend import DojoAPIEndpoint, FIELDConfig, MCPClient, MCPError
+
+
+async def start_stub(handler):
+    """Serve handler for every POST on an ephemeral localhost port"""
+    app = web.Application()
+    app.router.add_route("POST", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, FIELDConfig(dojo_base_url=f"http://127.0.0.1:{port}")
+
+
+def test_success_returns_response_payload():
+    seen = []
+    
+    async def handler(request):
+        seen.append((request.path, request.headers.get("X-DOJO-Access-Mode"),
+                     await request.json()))
+        return web.json_response({"pattern": "tetrahedron"})
+    
+    async def main():
+        runner, config = await start_stub(handler)
+        try:
+            async with MCPClient(config) as client:
+                return await client.request(DojoAPIEndpoint.FIELD_DISCOVERY, {"lat": -37.8})
+        finally:
+            await runner.cleanup()
+    
+    result = asyncio.run(main())
+    assert result["status"] == "complete"
+    assert result["method"] == "MCP"
+    assert result["lat"] == -37.8
+    assert result["response"] == {"pattern": "tetrahedron"}
+    assert seen == [(DojoAPIEndpoint.FIELD_DISCOVERY.value, "MCP_ONLY", {"lat": -37.8})]
+
+
+def test_http_error_raises_mcp_error():
+    async def handler(request):
+        return web.Response(status=503, text="unavailable")
+    
+    async def main():
+        runner, config = await start_stub(handler)
+        try:
+            async with MCPClient(config) as client:
+                await client.request(DojoAPIEndpoint.CHARACTER_GUIDANCE, {})
+        finally:
+            await runner.cleanup()
+    
+    with pytest.raises(MCPError) as error:
+        asyncio.run(main())
+    assert error.value.status == 503
+    assert error.value.endpoint.endswith(DojoAPIEndpoint.CHARACTER_GUIDANCE.value)
+
+
+def test_timeout_raises_mcp_error():
+    async def handler(request):
+        await asyncio.sleep(1.0)
+        return web.json_response({})
+    
+    async def main():
+        runner, config = await start_stub(handler)
+        try:
+            async with MCPClient(config, timeout=0.1) as client:
+                await client.request(DojoAPIEndpoint.EPOCH_TRANSITION, {})
+        finally:
+            await runner.cleanup()
+    
+    with pytest.raises(MCPError, match="timed out") as error:
+        asyncio.run(main())
+    assert error.value.status is None
+
+
+def test_requests_reuse_one_session_and_connection():
+    peers = set()
+    
+    async def handler(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"ok": True})
+    
+    async def main():
+        runner, config = await start_stub(handler)
+        try:
+            async with MCPClient(config) as client:
+                await client.request(DojoAPIEndpoint.CHARACTER_GUIDANCE, {"n": 0})
+                session = client._session
+                for n in range(1, 5):
+                    await client.request(DojoAPIEndpoint.CHARACTER_GUIDANCE, {"n": n})
+                assert client._session is session
+        finally:
+            await runner.cleanup()
+    
+    asyncio.run(main())
+    assert len(peers) == 1
+
+
+def test_client_rebuilds_loop_state_per_event_loop():
+    async def handler(request):
+        return web.json_response({"ok": True})
+    
+    client = MCPClient(FIELDConfig(), max_concurrency=2)
+    
+    async def main():
+        runner, config = await start_stub(handler)
+        client.config = config
+        try:
+            result = await client.gather_many(
+                [(DojoAPIEndpoint.CHARACTER_GUIDANCE, {"n": n}) for n in range(4)])
+            await client.close()
+            return result
+        finally:
+            await runner.cleanup()
+    
+    # Each asyncio.run is a new loop; the second must not reuse the first's state
+    assert len(asyncio.run(main())) == 4
+    first = client._semaphore
+    assert len(asyncio.run(main())) == 4
+    assert client._semaphore is not first
@@ -0,0 +1,42 @@
+"""
+Architecture character lookups by symbol
+
+Run with: python -m pytest Tests
+"""
+
+from architecture import Architecture, Character
+
+
+def character(name: str, symbol: str) -> Character:
+    return Character(name=name, symbol=symbol, role="guide", archetype="test",
+                     geometry_affinity="circle")
+
+
+def test_token_match_wins_over_an_earlier_substring_match():
+    architecture = Architecture()
+    for existing in list(architecture.characters):
+        architecture.remove_character(existing.name)
+    architecture.add_character(character("Ian", "◆ATLASIAN"))
+    architecture.add_character(character("Kiran", "▲ATLAS"))
+    
+    # "ATLAS" is a token of ▲ATLAS but only a substring of ◆ATLASIAN
+    assert architecture.get_character_by_symbol("ATLAS").name == "Kiran"
+    assert architecture.get_character_by_symbol("▲").name == "Kiran"
+    assert architecture.get_character_by_symbol("◆ATLASIAN").name == "Ian"
+    # Fragments that are no token still find the first character containing them
+    assert architecture.get_character_by_symbol("TLAS").name == "Ian"
+    assert architecture.get_character_by_symbol("SIAN").name == "Ian"
+    assert architecture.get_character_by_symbol("▼") is None
+
+
+def test_first_character_in_list_order_wins_among_token_matches():
+    architecture = Architecture()
+    architecture.add_character(character("Second", "●GUIDE"))
+    architecture.add_character(character("Third", "✦GUIDE"))
+    assert architecture.get_character_by_symbol("GUIDE").name == "Second"
+    
+    architecture.remove_character("Second")
+    assert architecture.get_character_by_symbol("GUIDE").name == "Third"
+    # ● still belongs to the built-in OBI-WAN character
+    assert architecture.get_character_by_symbol("●").symbol == "●OBI-WAN"
+    assert architecture.get_character_by_symbol("●GUIDE") is None
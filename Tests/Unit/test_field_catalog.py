@@ -0,0 +1,120 @@
+"""
+FieldCatalog lookups and the CatalogFieldList runtime view
+
+Run with: python -m pytest Tests
+"""
+
+import gc
+
+import pytest
+
+from architecture import Architecture, Epoch, Field
+from benchmarks.synthetic import synthetic_fields
+from field_catalog import CatalogFieldList, FieldCatalog, write_catalog
+
+
+FIELD_COUNT = 40
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = str(tmp_path / "fields.dfpc")
+    write_catalog(path, synthetic_fields(FIELD_COUNT, 4))
+    return path
+
+
+@pytest.fixture
+def catalog(catalog_path):
+    with FieldCatalog(catalog_path, cache_size=4) as opened:
+        yield opened
+
+
+def test_lookups_match_the_written_fields(catalog):
+    fields = {field.id: field for field in synthetic_fields(FIELD_COUNT, 4)}
+    assert len(catalog) == FIELD_COUNT
+    for field_id, field in fields.items():
+        assert field_id in catalog
+        assert catalog.get(field_id).to_dict() == field.to_dict()
+    assert catalog.get("missing") is None
+    assert "missing" not in catalog
+    # Entries are sorted by id bytes
+    assert [field.id for field in catalog] == sorted(fields, key=lambda i: i.encode("utf-8"))
+    for epoch in Epoch:
+        expected = sorted(i for i, field in fields.items() if field.epoch == epoch)
+        assert sorted(field.id for field in catalog.get_by_epoch(epoch)) == expected
+    locations = {field_id: (lat, lng) for field_id, lat, lng in catalog.locations()}
+    assert locations == {i: (f.physical_location["lat"], f.physical_location["lng"])
+                         for i, f in fields.items()}
+
+
+def test_fields_are_shared_while_referenced_and_rebuilt_after(catalog):
+    field_id = catalog.field_at(0).id
+    held = catalog.get(field_id)
+    for number in range(1, FIELD_COUNT):
+        catalog.field_at(number)
+    # Pushed out of the 4-entry LRU, but still referenced: the same object
+    assert catalog.get(field_id) is held
+    
+    # Unreferenced and out of the LRU: dropped, then rebuilt from the file
+    del held
+    for number in range(1, FIELD_COUNT):
+        catalog.field_at(number)
+    gc.collect()
+    assert len(catalog._recent) == 4
+    assert 0 not in catalog._fields
+    rebuilt = catalog.get(field_id)
+    assert rebuilt.id == field_id
+    assert catalog.field_at(0) is rebuilt
+
+
+def test_rejects_files_that_are_not_catalogs(tmp_path):
+    path = tmp_path / "not-a-catalog"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        FieldCatalog(str(path))
+
+
+def test_removed_catalog_fields_disappear_from_the_view(catalog):
+    view = CatalogFieldList(catalog)
+    ids = [field.id for field in view]
+    extra = Field.from_dict(dict(synthetic_fields(1, 2)[0].to_dict(), id="field_runtime"))
+    view.append(extra)
+    
+    removed = [ids[0], ids[7], ids[8], ids[-1]]
+    for field_id in removed:
+        view.remove(catalog.get(field_id))
+    live = [field_id for field_id in ids if field_id not in removed] + ["field_runtime"]
+    
+    assert len(view) == len(live)
+    assert [field.id for field in view] == live
+    # Indexing (including negative indexes and slices) skips the tombstones
+    assert [view[i].id for i in range(len(view))] == live
+    assert view[-1] is extra
+    assert view[-2].id == live[-2]
+    assert [field.id for field in view[2:6]] == live[2:6]
+    with pytest.raises(IndexError):
+        view[len(view)]
+    
+    for field_id in removed:
+        assert view.get_catalog_field(field_id) is None
+    assert view.removed_ids == set(removed)
+    with pytest.raises(ValueError):
+        view.remove(catalog.get(removed[0]))
+    
+    view.remove(extra)
+    assert [field.id for field in view] == live[:-1]
+
+
+def test_architecture_on_a_catalog_hides_removed_fields(catalog_path):
+    architecture = Architecture(catalog_path=catalog_path)
+    field = architecture.fields[3]
+    location = field.physical_location
+    assert architecture.get_field(field.id) is not None
+    
+    assert architecture.remove_field(field.id) is field
+    assert architecture.get_field(field.id) is None
+    assert field.id not in [f.id for f in architecture.fields]
+    assert field.id not in [f.id for f in architecture.get_fields_by_epoch(field.epoch)]
+    nearest = architecture.nearest_fields(location["lat"], location["lng"], k=3)
+    assert field.id not in [f.id for f in nearest]
+    assert len(architecture.fields) == FIELD_COUNT - 1
@@ -0,0 +1,59 @@
+"""
+Generated meshes: glTF winding on the arrays, Unity handedness in to_dict
+
+Run with: python -m pytest Tests
+"""
+
+import numpy as np
+import pytest
+
+from geometry_mesh import generate_mesh
+
+
+def face_normals(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    a, b, c = (vertices[triangles[:, i]] for i in range(3))
+    return np.cross(b - a, c - a)
+
+
+def centroids(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    return vertices[triangles].mean(axis=1)
+
+
+@pytest.mark.parametrize("lod", [0, 2])
+def test_sphere_faces_outward_counter_clockwise_in_gltf_space(lod):
+    mesh = generate_mesh("sphere", lod)
+    vertices = mesh.vertices.astype(np.float64)
+    normals = face_normals(vertices, mesh.indices)
+    areas = np.linalg.norm(normals, axis=1)
+    facing = np.einsum("ij,ij->i", normals, centroids(vertices, mesh.indices))
+    # Degenerate pole triangles have no direction; every other face points out
+    assert np.all(facing[areas > 1e-9] > 0)
+
+
+def test_to_dict_mirrors_x_and_keeps_faces_outward_in_unity_space():
+    mesh = generate_mesh("sphere", 1)
+    exported = mesh.to_dict()
+    vertices = np.array(exported["vertices"]).reshape(-1, 3)
+    normals = np.array(exported["normals"]).reshape(-1, 3)
+    triangles = np.array(exported["triangles"]).reshape(-1, 3)
+    
+    np.testing.assert_array_equal(vertices[:, 0], -mesh.vertices[:, 0])
+    np.testing.assert_array_equal(vertices[:, 1:], mesh.vertices[:, 1:])
+    np.testing.assert_array_equal(normals[:, 0], -mesh.normals[:, 0])
+    np.testing.assert_array_equal(triangles, mesh.indices[:, ::-1])
+    
+    # Unity's front faces are clockwise in its left-handed space, which
+    # gives the same cross(b - a, c - a) normal as glTF's counter-clockwise
+    # faces: after mirroring they must still point out of the sphere and
+    # agree with the exported vertex normals
+    face = face_normals(vertices, triangles)
+    solid = np.linalg.norm(face, axis=1) > 1e-9
+    assert np.all(np.einsum("ij,ij->i", face, centroids(vertices, triangles))[solid] > 0)
+    assert np.all(np.einsum("ij,ij->i", face, normals[triangles].mean(axis=1))[solid] > 0)
+
+
+def test_to_dict_leaves_cached_arrays_in_gltf_space():
+    mesh = generate_mesh("triangle_upward")
+    before = mesh.vertices.copy()
+    mesh.to_dict()
+    np.testing.assert_array_equal(mesh.vertices, before)
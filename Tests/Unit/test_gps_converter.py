@@ -0,0 +1,50 @@
+"""
+GPSToARConverter: WGS84 meters per degree at the origin's latitude
+
+Run with: python -m pytest Tests
+"""
+
+import numpy as np
+import pytest
+
+from unity_ar import GPSToARConverter, UnityARBridge, meters_per_degree
+
+
+FEDERATION_SQUARE = (-37.8179, 144.9690)
+
+
+def test_meters_per_degree_at_federation_square():
+    per_lat, per_lng = meters_per_degree(FEDERATION_SQUARE[0])
+    assert per_lat == pytest.approx(110993.008, abs=1e-3)
+    assert per_lng == pytest.approx(88049.173, abs=1e-3)
+    # The equator and the poles bound the formula
+    assert meters_per_degree(0.0) == pytest.approx((110574.3, 111319.5), abs=0.1)
+    assert meters_per_degree(90.0)[1] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_gps_to_unity_pins_the_wgs84_scale():
+    converter = GPSToARConverter(*FEDERATION_SQUARE)
+    position = converter.gps_to_unity(-37.8079, 144.9790, 2.0)
+    # 0.01° east and north of the origin; the old fixed constants gave
+    # (888.34, 2.0, 1113.20)
+    assert position.x == pytest.approx(880.4917, abs=1e-4)
+    assert position.y == 2.0
+    assert position.z == pytest.approx(1109.9301, abs=1e-4)
+    assert converter.unity_to_gps(position) == pytest.approx((-37.8079, 144.9790, 2.0))
+
+
+def test_batch_matches_scalar_conversion():
+    converter = GPSToARConverter(*FEDERATION_SQUARE)
+    coords = np.array([[-37.8179, 144.9690, 0.0], [-37.81, 144.97, 5.0], [-38.0, 145.2, -1.0]])
+    batch = converter.gps_to_unity_batch(coords)
+    scalar = [converter.gps_to_unity(*row).to_dict() for row in coords.tolist()]
+    np.testing.assert_allclose(batch, [[p["x"], p["y"], p["z"]] for p in scalar], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(converter.unity_to_gps_batch(batch), coords, rtol=0, atol=1e-12)
+
+
+def test_default_bridge_scene_uses_the_pinned_scale():
+    field = {"id": "field_gps", "geometry_nodes": [
+        {"id": "east", "layer": "physical_reality",
+         "coordinates": {"lat": -37.8179, "lng": 144.9790}, "geometry_type": "circle"}]}
+    marker = UnityARBridge().create_field_scene(field).to_dict()["markers"][0]
+    assert marker["transform"]["position"]["x"] == pytest.approx(880.4917, abs=1e-4)
@@ -0,0 +1,60 @@
+"""
+Metrics registry: counters stay monotonic when their owners go away
+
+Run with: python -m pytest Tests
+"""
+
+import gc
+
+import pytest
+
+from architecture import Architecture
+from metrics import MetricsRegistry
+from prefetch import EpochPrefetcher
+from unity_ar import UnityARBridge
+
+
+def sample(registry: MetricsRegistry, name: str) -> float:
+    samples = registry.get(name).samples()
+    return sum(value for _, _, value in samples)
+
+
+def test_counter_keeps_count_after_owner_is_collected():
+    registry = MetricsRegistry()
+    architecture = Architecture()
+    field_id = architecture.fields[0].id
+    
+    prefetcher = EpochPrefetcher(architecture, UnityARBridge(), metrics=registry)
+    prefetcher.scene_for(field_id)
+    prefetcher.scene_for(field_id)
+    assert sample(registry, "dfp_prefetch_scene_misses_total") == 1
+    assert sample(registry, "dfp_prefetch_scene_hits_total") == 1
+    
+    del prefetcher
+    gc.collect()
+    assert sample(registry, "dfp_prefetch_scene_misses_total") == 1
+    assert sample(registry, "dfp_prefetch_scene_hits_total") == 1
+    
+    # A second owner adds to the retained count
+    EpochPrefetcher(architecture, UnityARBridge(), metrics=registry).scene_for(field_id)
+    assert sample(registry, "dfp_prefetch_scene_misses_total") == 2
+
+
+def test_tracked_gauge_sums_live_owners_only():
+    registry = MetricsRegistry()
+    architecture = Architecture()
+    bridges = [UnityARBridge(metrics=registry) for _ in range(2)]
+    for bridge in bridges:
+        bridge.create_field_scene(architecture.fields[0].to_dict())
+    assert sample(registry, "dfp_bridge_active_scenes") == 2
+    
+    del bridges[0]
+    gc.collect()
+    assert sample(registry, "dfp_bridge_active_scenes") == 1
+
+
+def test_only_gauges_can_be_tracked():
+    registry = MetricsRegistry()
+    assert not hasattr(registry.counter("events_total", "Events"), "track")
+    with pytest.raises(ValueError):
+        registry.gauge("labelled", "Labelled", ["kind"]).track(object(), lambda owner: 0)
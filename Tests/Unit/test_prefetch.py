@@ -0,0 +1,46 @@
+"""
+EpochPrefetcher shutdown: close() must not block the event loop
+
+Run with: python -m pytest Tests
+"""
+
+import asyncio
+import time
+
+from architecture import Architecture, Epoch
+from prefetch import EpochPrefetcher
+from unity_ar import UnityARBridge
+
+
+def test_close_waits_for_a_running_build_without_blocking_the_loop(monkeypatch):
+    def slow_build(builder, known, fields):
+        time.sleep(0.3)
+        return []
+    
+    monkeypatch.setattr(EpochPrefetcher, "_build_scenes", staticmethod(slow_build))
+    
+    async def main():
+        prefetcher = EpochPrefetcher(Architecture(), UnityARBridge())
+        prefetcher.schedule(Epoch.EPOCH_1)
+        # Let the first chunk reach the executor thread
+        await asyncio.sleep(0.05)
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        ticking = asyncio.ensure_future(ticker())
+        start = time.perf_counter()
+        await prefetcher.close()
+        elapsed = time.perf_counter() - start
+        ticking.cancel()
+        return prefetcher, elapsed, ticks
+    
+    prefetcher, elapsed, ticks = asyncio.run(main())
+    # close() waited for the build (~0.25 s left) while the loop kept ticking
+    assert elapsed > 0.15
+    assert ticks >= 5
+    assert prefetcher._executor is None
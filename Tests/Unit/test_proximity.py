@@ -0,0 +1,88 @@
+"""
+ProximityEngine geofences: enter/exit hysteresis and update ordering
+
+Run with: python -m pytest Tests
+"""
+
+import pytest
+
+from proximity import ProximityEngine, ProximityEventType
+from unity_ar import GPSToARConverter
+
+
+ORIGIN = (-37.8179, 144.9690)
+ENTER, EXIT = ProximityEventType.ENTER, ProximityEventType.EXIT
+
+
+@pytest.fixture
+def engine():
+    converter = GPSToARConverter(*ORIGIN)
+    engine = ProximityEngine(converter, enter_radius_m=20.0, exit_radius_m=30.0)
+    engine.add_node("field_a", "gate", *ORIGIN)
+    return engine
+
+
+def east(engine: ProximityEngine, meters: float):
+    """(lat, lng) of a point meters east of the node"""
+    return ORIGIN[0], ORIGIN[1] + meters / engine.converter.meters_per_lng
+
+
+def walk(engine: ProximityEngine, player: str, distances, start_t: float = 0.0):
+    """Events for one update per distance, each in its own batch"""
+    events = []
+    for step, meters in enumerate(distances):
+        lat, lng = east(engine, meters)
+        events.append([(event.event_type, event.node_id)
+                       for event in engine.update([player], [lat], [lng], [start_t + step])])
+    return events
+
+
+def test_jitter_inside_the_hysteresis_band_does_not_flap(engine):
+    # Approaching: nothing until within 20 m
+    assert walk(engine, "p1", [45.0, 25.0, 20.5]) == [[], [], []]
+    assert walk(engine, "p1", [19.5], 3) == [[(ENTER, "gate")]]
+    # Jitter between 19 and 29.9 m stays inside: no events
+    assert walk(engine, "p1", [21.0, 19.0, 29.9, 24.0, 29.0, 20.1], 4) == [[]] * 6
+    assert engine.inside("p1") == [("field_a", "gate")]
+    # Only beyond 30 m is an exit, and re-entry needs 20 m again
+    assert walk(engine, "p1", [30.5], 10) == [[(EXIT, "gate")]]
+    assert walk(engine, "p1", [29.0, 21.0, 25.0], 11) == [[], [], []]
+    assert walk(engine, "p1", [18.0], 14) == [[(ENTER, "gate")]]
+
+
+def test_event_distances_and_boundaries(engine):
+    lat, lng = east(engine, 12.0)
+    [event] = engine.update(["p1"], [lat], [lng], [1.0])
+    assert (event.player_id, event.field_id, event.t) == ("p1", "field_a", 1.0)
+    assert event.distance_m == pytest.approx(12.0, abs=1e-6)
+    lat, lng = east(engine, 31.0)
+    [event] = engine.update(["p1"], [lat], [lng], [2.0])
+    assert event.event_type is EXIT
+    assert event.distance_m == pytest.approx(31.0, abs=1e-6)
+
+
+def test_batched_updates_apply_in_time_order_and_stale_ones_are_ignored(engine):
+    far, near = east(engine, 40.0), east(engine, 5.0)
+    # One batch, out of order: t=1 near, t=2 far -> enter then exit
+    events = engine.update(["p1", "p1"], [far[0], near[0]], [far[1], near[1]], [2.0, 1.0])
+    assert [(event.event_type, event.t) for event in events] == [(ENTER, 1.0), (EXIT, 2.0)]
+    # Older than the last accepted update: ignored
+    assert engine.update(["p1"], [near[0]], [near[1]], [1.5]) == []
+    assert engine.inside("p1") == []
+
+
+def test_removing_a_player_or_field_reports_exits(engine):
+    lat, lng = east(engine, 3.0)
+    engine.update(["p1", "p2"], [lat, lat], [lng, lng], [0.0, 0.0])
+    [exit_event] = engine.remove_player("p1", t=5.0)
+    assert (exit_event.event_type, exit_event.player_id, exit_event.t) == (EXIT, "p1", 5.0)
+    assert engine.inside("p1") == []
+    
+    [field_exit] = engine.remove_field("field_a")
+    assert (field_exit.event_type, field_exit.player_id) == (EXIT, "p2")
+    assert engine.update(["p2"], [lat], [lng], [1.0]) == []
+
+
+def test_exit_radius_below_enter_radius_is_rejected():
+    with pytest.raises(ValueError):
+        ProximityEngine(GPSToARConverter(*ORIGIN), enter_radius_m=30.0, exit_radius_m=20.0)
@@ -0,0 +1,68 @@
+"""
+UnityARBridge.rebuild_changed: content-hash dirty tracking
+
+Run with: python -m pytest Tests
+"""
+
+import copy
+
+from architecture import Architecture
+from unity_ar import UnityARBridge, field_content_hash
+
+
+def field_dicts():
+    return [field.to_dict() for field in Architecture().fields]
+
+
+def test_unchanged_fields_are_not_rebuilt():
+    bridge = UnityARBridge()
+    fields = field_dicts()
+    assert bridge.rebuild_changed(fields) == [field["id"] for field in fields]
+    scenes = dict(bridge.active_scenes)
+    versions = dict(bridge.scene_versions)
+    
+    assert bridge.rebuild_changed(copy.deepcopy(fields)) == []
+    for field_id, scene in scenes.items():
+        assert bridge.get_scene(field_id) is scene
+    assert bridge.scene_versions == versions
+
+
+def test_only_the_changed_field_is_rebuilt():
+    bridge = UnityARBridge()
+    fields = field_dicts()
+    bridge.rebuild_changed(fields)
+    untouched = bridge.get_scene(fields[0]["id"])
+    
+    node = fields[1]["geometry_nodes"][0]
+    original = node["geometry_type"]
+    node["geometry_type"] = "mandala" if original != "mandala" else "spiral"
+    assert bridge.rebuild_changed(fields) == [fields[1]["id"]]
+    assert bridge.get_scene(fields[0]["id"]) is untouched
+    assert bridge.scene_versions[fields[1]["id"]] == 2
+    assert bridge.scene_hashes[fields[1]["id"]] == field_content_hash(fields[1])
+    # Changing it back is a change too
+    node["geometry_type"] = original
+    assert bridge.rebuild_changed(fields) == [fields[1]["id"]]
+
+
+def test_hash_ignores_key_order():
+    field = field_dicts()[0]
+    reordered = {key: field[key] for key in reversed(list(field))}
+    assert field_content_hash(reordered) == field_content_hash(field)
+    
+    bridge = UnityARBridge()
+    bridge.rebuild_changed([field])
+    assert bridge.rebuild_changed([reordered]) == []
+
+
+def test_scenes_built_outside_rebuild_changed_are_rebuilt_once():
+    bridge = UnityARBridge()
+    field = field_dicts()[0]
+    bridge.create_field_scene(field)
+    # Its content hash is unknown, so the first pass rebuilds it
+    assert bridge.rebuild_changed([field]) == [field["id"]]
+    assert bridge.rebuild_changed([field]) == []
+    
+    bridge.create_field_scene(field)
+    assert field["id"] not in bridge.scene_hashes
+    assert bridge.rebuild_changed([field]) == [field["id"]]
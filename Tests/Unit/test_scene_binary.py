@@ -0,0 +1,101 @@
+"""
+Binary scene round trip: BinarySceneReader.to_dict must rebuild export_for_unity
+
+Run with: python -m pytest Tests
+"""
+
+import pytest
+
+from architecture import Architecture
+from benchmarks.synthetic import synthetic_fields
+from scene_binary import BinarySceneReader
+from unity_ar import ARMarker, ARMarkerType, ARScene, Quaternion, UnityARBridge, Vector3
+
+
+NON_ASCII_FIELD = {
+    "id": "field_☉_Māori_東京",
+    "name": "Tāmaki Makaurau",
+    "epoch": "epoch_1",
+    "geometry_nodes": [
+        {"id": "節点_▲", "layer": "physical_reality",
+         "coordinates": {"lat": -36.8485, "lng": 174.7633}, "geometry_type": "triangle_upward"},
+        {"id": "nœud_●", "layer": "digital_overlay",
+         "coordinates": {"x": 1.5, "y": -2.25, "z": 3.0}, "geometry_type": "circle"}
+    ],
+    "physical_location": {"lat": -36.8485, "lng": 174.7633},
+    "sacred_pattern": "●-wharenui"
+}
+
+EMPTY_FIELD = {"id": "field_empty", "name": "Empty", "epoch": "epoch_1", "geometry_nodes": []}
+
+
+def field_dicts():
+    fields = Architecture().fields + synthetic_fields(6, 40)
+    return [field.to_dict() for field in fields] + [NON_ASCII_FIELD, EMPTY_FIELD]
+
+
+def build_bridge(compact: bool) -> UnityARBridge:
+    bridge = UnityARBridge(compact_markers=compact)
+    for field in field_dicts():
+        bridge.create_field_scene(field)
+    # A scene whose markers carry no prefabs
+    bridge.active_scenes["field_no_prefabs"] = ARScene(
+        field_id="field_no_prefabs",
+        markers=[ARMarker(id="marker_ö", marker_type=ARMarkerType.FIELD_PORTAL,
+                          position=Vector3(0.5, 1.0, -2.0), rotation=Quaternion(0, 0, 0, 1),
+                          scale=Vector3(1, 1, 1), metadata={"note": "ūnique"})],
+        ambient_lighting={"intensity": 0.5, "color": "#000000", "ambient_mode": "Flat"},
+        geometry_prefabs=[]
+    )
+    return bridge
+
+
+def decoded(bridge: UnityARBridge, field_id: str, double_precision: bool) -> dict:
+    data = bridge.export_binary(field_id, double_precision=double_precision)
+    return BinarySceneReader(data).to_dict()
+
+
+def expected(bridge: UnityARBridge, field_id: str) -> dict:
+    return bridge.export_for_unity(field_id)
+
+
+@pytest.mark.parametrize("compact,double_precision", [
+    (False, True),
+    # Compact markers are float32 already, so both encodings are exact
+    (True, False),
+    (True, True),
+])
+def test_round_trip_is_exact(compact, double_precision):
+    bridge = build_bridge(compact)
+    assert len(bridge.active_scenes) == len(field_dicts()) + 1
+    for field_id in bridge.active_scenes:
+        assert decoded(bridge, field_id, double_precision) == expected(bridge, field_id), field_id
+
+
+def test_float32_round_trip_matches_up_to_precision():
+    bridge = build_bridge(compact=False)
+    for field_id in bridge.active_scenes:
+        want, got = expected(bridge, field_id), decoded(bridge, field_id, False)
+        markers, got_markers = want["scene"].pop("markers"), got["scene"].pop("markers")
+        assert got == want, field_id
+        assert len(got_markers) == len(markers)
+        for a, b in zip(markers, got_markers):
+            assert {**a, "transform": None} == {**b, "transform": None}
+            for part, axes in a["transform"].items():
+                assert b["transform"][part] == pytest.approx(axes, rel=1e-6, abs=1e-6)
+
+
+def test_empty_and_non_ascii_scenes():
+    bridge = build_bridge(compact=False)
+    empty = decoded(bridge, "field_empty", True)
+    assert empty["scene"]["markers"] == []
+    assert empty["scene"]["geometry_prefabs"] == []
+    assert empty["version"] == bridge.scene_versions["field_empty"]
+    
+    non_ascii = decoded(bridge, NON_ASCII_FIELD["id"], True)
+    assert non_ascii["scene"]["field_id"] == NON_ASCII_FIELD["id"]
+    assert [marker["id"] for marker in non_ascii["scene"]["markers"]] == ["節点_▲", "nœud_●"]
+    
+    no_prefabs = decoded(bridge, "field_no_prefabs", True)
+    assert no_prefabs["scene"]["geometry_prefabs"] == []
+    assert no_prefabs["scene"]["markers"][0]["metadata"] == {"note": "ūnique"}
@@ -0,0 +1,100 @@
+"""
+diff_for_unity: marker/prefab patches between scene versions
+
+Run with: python -m pytest Tests
+"""
+
+import copy
+
+from unity_ar import UnityARBridge
+
+
+FIELD = {
+    "id": "field_diff",
+    "name": "Diff Field",
+    "epoch": "epoch_1",
+    "geometry_nodes": [
+        {"id": "keep", "layer": "physical_reality",
+         "coordinates": {"lat": -37.8179, "lng": 144.9690}, "geometry_type": "circle"},
+        {"id": "move", "layer": "digital_overlay",
+         "coordinates": {"x": 1.0, "y": 0.0, "z": 2.0}, "geometry_type": "circle"},
+        {"id": "drop", "layer": "digital_overlay",
+         "coordinates": {"x": -1.0, "y": 0.0, "z": 0.5}, "geometry_type": "hexagon"}
+    ],
+    "physical_location": {"lat": -37.8179, "lng": 144.9690},
+    "sacred_pattern": "●-diff"
+}
+
+
+def edited_field():
+    field = copy.deepcopy(FIELD)
+    nodes = field["geometry_nodes"]
+    nodes[1]["coordinates"]["x"] = 4.0
+    del nodes[2]
+    nodes.append({"id": "new", "layer": "digital_overlay",
+                  "coordinates": {"x": 0.0, "y": 1.0, "z": 3.0}, "geometry_type": "spiral"})
+    return field
+
+
+def test_patch_lists_added_updated_and_removed_markers():
+    bridge = UnityARBridge()
+    bridge.create_field_scene(FIELD)
+    bridge.create_field_scene(edited_field())
+    patch = bridge.diff_for_unity("field_diff", 1)
+    
+    assert patch["full"] is False
+    assert (patch["version"], patch["base_version"]) == (2, 1)
+    assert [marker["id"] for marker in patch["markers"]["added"]] == ["new"]
+    assert [marker["id"] for marker in patch["markers"]["updated"]] == ["move"]
+    assert patch["markers"]["removed"] == ["drop"]
+    assert [prefab["geometry_type"] for prefab in patch["prefabs"]["added"]] == ["spiral"]
+    assert patch["prefabs"]["removed"] == ["hexagon"]
+    assert "ambient_lighting" not in patch
+    
+    current = bridge.diff_for_unity("field_diff", 2)
+    assert current["markers"] == {"added": [], "updated": [], "removed": []}
+    assert bridge.diff_for_unity("unknown", 0) == {}
+
+
+def test_changing_a_returned_patch_leaves_later_patches_alone():
+    bridge = UnityARBridge()
+    bridge.create_field_scene(FIELD)
+    bridge.create_field_scene(edited_field())
+    first = bridge.diff_for_unity("field_diff", 1)
+    expected = copy.deepcopy(first)
+    
+    first["type"] = "delta"
+    first["markers"]["added"][0]["id"] = "tampered"
+    first["prefabs"]["added"][0]["color"] = "#000000"
+    first["markers"]["removed"].clear()
+    
+    assert bridge.diff_for_unity("field_diff", 1) == expected
+    assert bridge.diff_for_unity("field_diff", 1) is not bridge.diff_for_unity("field_diff", 1)
+    assert bridge.get_scene("field_diff").geometry_prefabs[-1]["color"] != "#000000"
+
+
+def test_evicted_base_version_gives_a_full_snapshot():
+    bridge = UnityARBridge(history_size=2)
+    for _ in range(3):
+        bridge.create_field_scene(FIELD)
+    patch = bridge.diff_for_unity("field_diff", 1)
+    
+    assert patch["full"] is True
+    assert patch["version"] == 3
+    assert patch["snapshot"] == bridge.export_for_unity("field_diff")
+    assert bridge.diff_for_unity("field_diff", 2)["full"] is False
+    # Versions that were never issued cannot be diffed against either
+    assert bridge.diff_for_unity("field_diff", 99)["full"] is True
+
+
+def test_origin_change_gives_a_full_snapshot():
+    bridge = UnityARBridge()
+    bridge.create_field_scene(FIELD)
+    # A regional origin at the field itself: the rebuilt scene moves frame
+    bridge.add_origin("site", -37.8180, 144.9691)
+    bridge.create_field_scene(FIELD)
+    assert bridge.get_scene("field_diff").origin == "site"
+    
+    patch = bridge.diff_for_unity("field_diff", 1)
+    assert patch["full"] is True
+    assert patch["snapshot"]["converter_origin"]["name"] == "site"
@@ -0,0 +1,336 @@
+"""
+AR Bridge Server
+
+asyncio server for the ar_bridge service (FIELDConfig port 8002). Clients
+subscribe to fields, receive one snapshot, then only marker-level deltas
+as scenes change instead of re-downloading export_for_unity payloads.
+
+Protocol: newline-delimited JSON over TCP.
+    client → server   {"op": "subscribe", "field_id": "field_01"}
+                      {"op": "unsubscribe", "field_id": "field_01"}
+                      {"op": "ping"}
+    server → client   {"type": "snapshot", "field_id", "version", "scene": <export_for_unity>}
+                      {"type": "delta", "field_id", "version", "base_version",
+                       "added": [marker], "updated": [marker], "removed": [marker id],
+                       "prefabs": {added, updated, removed}, plus "ambient_lighting"
+                       when it changed}
+                      {"type": "pong"}, {"type": "error", "message"}
+
+Versions are the bridge's scene_versions and deltas are its
+diff_for_unity patches. Updates arriving within batch_interval are
+coalesced into one delta per field, encoded once and shared by every
+subscriber. When the bridge no longer holds the base version, subscribers
+get a fresh snapshot instead. Each client has a
+bounded send queue; a client that falls behind has its queue dropped and
+is resent snapshots of its fields once it catches up. A client that sends
+a line longer than the stream limit gets an error and is disconnected.
+
+Like the rest of the server, update_field, publish and flush must be
+called from the event loop the server runs on.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+import asyncio
+import json
+import time
+
+from field_backend import FIELDConfig
+from metrics import MetricsRegistry
+from unity_ar import UnityARBridge
+
+
+def _encode(message: Dict) -> bytes:
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class _ClientConnection:
+    """Send side of one connected client"""
+    
+    def __init__(self, writer: asyncio.StreamWriter, max_queue: int):
+        self.writer = writer
+        self.max_queue = max_queue
+        self.fields: Set[str] = set()
+        self.queue: Deque[bytes] = deque()
+        # Fields owed a snapshot (new subscriptions, or after an overflow)
+        self.resync: Set[str] = set()
+        self.wakeup = asyncio.Event()
+        self.closed = False
+
+
+class ARBridgeServer:
+    """Pushes scene snapshots and marker deltas to subscribed AR clients"""
+    
+    def __init__(self, bridge: UnityARBridge, host: str = "127.0.0.1", port: int = 8002,
+                 batch_interval: Optional[float] = 0.05, max_queue: int = 64,
+                 metrics: Optional[MetricsRegistry] = None):
+        """Initialize around a bridge
+        
+        batch_interval: seconds to coalesce updates before publishing
+            (None publishes only on explicit flush())
+        max_queue: per-client pending messages before it is resynced
+        """
+        self.bridge = bridge
+        self.host = host
+        self.port = port
+        self.batch_interval = batch_interval
+        self.max_queue = max_queue
+        self.clients: Set[_ClientConnection] = set()
+        self._subscribers: Dict[str, Set[_ClientConnection]] = {}
+        # field_id -> bridge scene version subscribers were last brought to
+        self._published: Dict[str, int] = {}
+        # field_id -> (version, encoded snapshot) shared by resyncing clients
+        self._snapshots: Dict[str, Tuple[int, bytes]] = {}
+        self._dirty: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Set[asyncio.Task] = set()
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.gauge("ar_server_clients", "Connected AR clients").track(
+                self, lambda server: len(server.clients))
+            self._messages_sent = metrics.counter(
+                "ar_server_messages_total", "Messages queued to AR clients", ["type"])
+            self._resyncs = metrics.counter(
+                "ar_server_resyncs_total", "Clients resynced after overflowing their queue")
+            self._flush_seconds = metrics.histogram(
+                "ar_server_flush_seconds", "Time to diff and fan out pending updates")
+    
+    @classmethod
+    def from_config(cls, bridge: UnityARBridge, config: FIELDConfig, **kwargs) -> "ARBridgeServer":
+        """Server on the port reserved for the ar_bridge service"""
+        return cls(bridge, port=config.services["ar_bridge"]["port"], **kwargs)
+    
+    async def start(self) -> "ARBridgeServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+    
+    async def stop(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for client in list(self.clients):
+            self._disconnect(client)
+        # Closed transports end each handler's read loop
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+    
+    async def __aenter__(self) -> "ARBridgeServer":
+        return await self.start()
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+    
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+    
+    def update_field(self, field_data: Dict):
+        """Rebuild a field's scene and publish the change with the next batch
+        
+        Call from the server's event loop, like publish.
+        """
+        self.bridge.create_field_scene(field_data)
+        self.publish(field_data.get("id", ""))
+    
+    def publish(self, field_id: str):
+        """Mark a field whose scene changed in the bridge for the next batch
+        
+        Must be called from the server's event loop (raises RuntimeError
+        with none running); from another thread use
+        loop.call_soon_threadsafe(server.publish, field_id).
+        """
+        loop = asyncio.get_running_loop()
+        self._dirty.add(field_id)
+        if self._flush_handle is None and self.batch_interval is not None:
+            self._flush_handle = loop.call_later(self.batch_interval, self.flush)
+    
+    def flush(self) -> Dict[str, int]:
+        """Publish pending changes now; returns the new version of each changed field"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        start = time.perf_counter()
+        dirty, self._dirty = self._dirty, set()
+        versions = {}
+        for field_id in dirty:
+            if field_id not in self._published:
+                # Nobody has a copy yet; the first snapshot will carry it
+                continue
+            version = self._publish(field_id)
+            if version is not None:
+                versions[field_id] = version
+        if self.metrics is not None:
+            self._flush_seconds.observe(time.perf_counter() - start)
+        return versions
+    
+    def _publish(self, field_id: str) -> Optional[int]:
+        """Send subscribers the bridge's patch since the published version
+        
+        Returns the version they were brought to, or None if the scene did
+        not change (or is gone).
+        """
+        since = self._published[field_id]
+        patch = self.bridge.diff_for_unity(field_id, since)
+        if not patch or patch["version"] == since:
+            return None
+        version = self._published[field_id] = patch["version"]
+        if patch["full"]:
+            # Base version evicted from the bridge's history: resend snapshots
+            self._snapshots[field_id] = (version, self._encode_snapshot(
+                field_id, version, patch["snapshot"]))
+            for client in self._subscribers.get(field_id, ()):
+                client.resync.add(field_id)
+                client.wakeup.set()
+            return version
+        message = {"type": "delta", "field_id": field_id,
+                   "version": version, "base_version": since}
+        message.update(patch["markers"])
+        message["prefabs"] = patch["prefabs"]
+        if "ambient_lighting" in patch:
+            message["ambient_lighting"] = patch["ambient_lighting"]
+        self._fan_out(field_id, _encode(message), "delta")
+        return version
+    
+    @staticmethod
+    def _encode_snapshot(field_id: str, version: int, scene: Dict) -> bytes:
+        return _encode({"type": "snapshot", "field_id": field_id, "version": version,
+                        "scene": scene})
+    
+    def _snapshot(self, field_id: str) -> Optional[bytes]:
+        """Encoded snapshot of the current scene, shared by all subscribers"""
+        version = self.bridge.scene_versions.get(field_id)
+        if version is None or self.bridge.get_scene(field_id) is None:
+            return None
+        published = self._published.get(field_id)
+        if published is not None and published != version:
+            # Bring existing subscribers up to this version first, so the
+            # snapshot and every later delta share one version sequence
+            self._publish(field_id)
+        self._published[field_id] = version
+        # Anything pending is now part of the snapshot
+        self._dirty.discard(field_id)
+        cached = self._snapshots.get(field_id)
+        if cached is None or cached[0] != version:
+            cached = self._snapshots[field_id] = (version, self._encode_snapshot(
+                field_id, version, self.bridge.export_for_unity(field_id)))
+        return cached[1]
+    
+    def _fan_out(self, field_id: str, data: bytes, message_type: str):
+        for client in self._subscribers.get(field_id, ()):
+            if field_id in client.resync:
+                # The pending snapshot will already include this change
+                continue
+            self._enqueue(client, data, message_type)
+    
+    def _enqueue(self, client: _ClientConnection, data: bytes, message_type: str):
+        if len(client.queue) >= client.max_queue:
+            # Slow consumer: drop what it hasn't read and resend fresh snapshots
+            client.queue.clear()
+            client.resync.update(client.fields)
+            if self.metrics is not None:
+                self._resyncs.inc()
+        else:
+            client.queue.append(data)
+            if self.metrics is not None:
+                self._messages_sent.labels(message_type).inc()
+        client.wakeup.set()
+    
+    def _subscribe(self, client: _ClientConnection, field_id: str) -> bool:
+        if self.bridge.get_scene(field_id) is None:
+            return False
+        client.fields.add(field_id)
+        client.resync.add(field_id)
+        self._subscribers.setdefault(field_id, set()).add(client)
+        client.wakeup.set()
+        return True
+    
+    def _unsubscribe(self, client: _ClientConnection, field_id: str):
+        client.fields.discard(field_id)
+        client.resync.discard(field_id)
+        subscribers = self._subscribers.get(field_id)
+        if subscribers is not None:
+            subscribers.discard(client)
+            if not subscribers:
+                del self._subscribers[field_id]
+    
+    def _disconnect(self, client: _ClientConnection):
+        if client.closed:
+            return
+        client.closed = True
+        for field_id in list(client.fields):
+            self._unsubscribe(client, field_id)
+        self.clients.discard(client)
+        client.wakeup.set()
+        client.writer.close()
+    
+    async def _send_loop(self, client: _ClientConnection):
+        """Write queued messages and owed snapshots, batching whatever is pending"""
+        try:
+            while not client.closed:
+                await client.wakeup.wait()
+                client.wakeup.clear()
+                chunks: List[bytes] = list(client.queue)
+                client.queue.clear()
+                for field_id in list(client.resync):
+                    snapshot = self._snapshot(field_id)
+                    if snapshot is not None:
+                        chunks.append(snapshot)
+                        if self.metrics is not None:
+                            self._messages_sent.labels("snapshot").inc()
+                client.resync.clear()
+                if chunks:
+                    client.writer.write(b"".join(chunks))
+                    await client.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._disconnect(client)
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = _ClientConnection(writer, self.max_queue)
+        self.clients.add(client)
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        sender = asyncio.ensure_future(self._send_loop(client))
+        try:
+            while not client.closed:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Over the stream limit; the rest of the stream can't be
+                    # framed, so say why and drop the connection
+                    writer.write(_encode({"type": "error", "message": "line too long"}))
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    op = request.get("op")
+                except (ValueError, AttributeError):
+                    self._enqueue(client, _encode({"type": "error", "message": "invalid JSON"}), "error")
+                    continue
+                if op == "subscribe":
+                    field_id = request.get("field_id", "")
+                    if not self._subscribe(client, field_id):
+                        self._enqueue(client, _encode(
+                            {"type": "error", "message": f"unknown field: {field_id}"}), "error")
+                elif op == "unsubscribe":
+                    self._unsubscribe(client, request.get("field_id", ""))
+                elif op == "ping":
+                    self._enqueue(client, _encode({"type": "pong"}), "pong")
+                else:
+                    self._enqueue(client, _encode({"type": "error", "message": f"unknown op: {op}"}),
+                                  "error")
+        except ConnectionError:
+            pass
+        finally:
+            self._disconnect(client)
+            sender.cancel()
+            self._handlers.discard(handler)
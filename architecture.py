@@ -10,9 +10,15 @@ Philosophy: Story=OS, geometry=grammar
 Layers exist simultaneously, not as replacements.
 """
 
+import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Set
+
+from spatial_index import GeoGridIndex
+
+# Names (letters, digits, inner hyphens) and single glyphs of a character symbol
+_SYMBOL_TOKEN = re.compile(r"\w+(?:-\w+)*|[^\w\s]")
 
 
 class Layer(Enum):
@@ -45,6 +51,15 @@ class GeometryNode:
             "coordinates": self.coordinates,
             "geometry_type": self.geometry_type
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GeometryNode':
+        return cls(
+            id=data["id"],
+            layer=Layer(data["layer"]),
+            coordinates=data["coordinates"],
+            geometry_type=data["geometry_type"]
+        )
 
 
 @dataclass
@@ -66,6 +81,17 @@ class Field:
             "physical_location": self.physical_location,
             "sacred_pattern": self.sacred_pattern
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Field':
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            epoch=Epoch(data["epoch"]),
+            geometry_nodes=[GeometryNode.from_dict(node) for node in data["geometry_nodes"]],
+            physical_location=data["physical_location"],
+            sacred_pattern=data["sacred_pattern"]
+        )
 
 
 @dataclass
@@ -90,7 +116,12 @@ class Character:
 class Architecture:
     """Main architecture managing the 3-layer system"""
     
-    def __init__(self):
+    def __init__(self, catalog_path: Optional[str] = None):
+        """Initialize the architecture
+        
+        catalog_path: load fields lazily from a memory-mapped field catalog
+            (see field_catalog.write_catalog) instead of the built-in fields
+        """
         self.layers = {
             Layer.PHYSICAL_REALITY: {
                 "location": "Melbourne",
@@ -109,7 +140,28 @@ class Architecture:
             }
         }
         self.characters = self._initialize_characters()
-        self.fields = self._initialize_fields()
+        self.catalog = None
+        if catalog_path is not None:
+            from field_catalog import CatalogFieldList, FieldCatalog
+            self.catalog = FieldCatalog(catalog_path)
+            self.fields = CatalogFieldList(self.catalog)
+            in_memory_fields = []
+        else:
+            self.fields = self._initialize_fields()
+            in_memory_fields = self.fields
+        # Fields held in memory (built-in or added at runtime), by id
+        self._fields_by_id: Dict[str, Field] = {}
+        # Lookup indexes; dicts keyed by field id keep insertion order
+        self._fields_by_epoch: Dict[Epoch, Dict[str, Field]] = {}
+        self._fields_by_geometry: Optional[Dict[str, Dict[str, Field]]] = None
+        self._fields_by_pattern_symbol: Optional[Dict[str, Dict[str, Field]]] = None
+        self._spatial_index: Optional[GeoGridIndex] = None
+        for field in in_memory_fields:
+            self._index_in_memory_field(field)
+        # Symbol tokens to the characters carrying them, in character order
+        self._characters_by_token: Dict[str, List[Character]] = {}
+        for char in self.characters:
+            self._index_character_symbol(char)
     
     def _initialize_characters(self) -> List[Character]:
         """Initialize the three main characters"""
@@ -285,12 +337,173 @@ class Architecture:
         """Get information about a specific layer"""
         return self.layers.get(layer, {})
     
+    @staticmethod
+    def pattern_symbols(sacred_pattern: str) -> Set[str]:
+        """Glyphs in a sacred pattern's symbol prefix, e.g. "▲▼-axis" → {"▲", "▼"}"""
+        prefix = sacred_pattern.split("-", 1)[0]
+        return {glyph for glyph in prefix if not glyph.isspace()}
+    
+    @staticmethod
+    def _add_to_index(index: Dict, keys: Iterable, field: Field):
+        for key in keys:
+            index.setdefault(key, {})[field.id] = field
+    
+    @staticmethod
+    def _remove_from_index(index: Dict, keys: Iterable, field_id: str):
+        for key in keys:
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(field_id, None)
+                if not bucket:
+                    del index[key]
+    
+    @staticmethod
+    def _geometry_types(field: Field) -> Set[str]:
+        return {node.geometry_type for node in field.geometry_nodes}
+    
+    def _index_in_memory_field(self, field: Field):
+        self._fields_by_id[field.id] = field
+        self._add_to_index(self._fields_by_epoch, [field.epoch], field)
+    
+    def _content_indexes(self):
+        """Geometry and pattern indexes, built on first use
+        
+        With a catalog this deserializes every field once; afterwards
+        add_field/remove_field keep the indexes current.
+        """
+        if self._fields_by_geometry is None:
+            by_geometry: Dict[str, Dict[str, Field]] = {}
+            by_symbol: Dict[str, Dict[str, Field]] = {}
+            for field in self.fields:
+                self._add_to_index(by_geometry, self._geometry_types(field), field)
+                self._add_to_index(by_symbol, self.pattern_symbols(field.sacred_pattern), field)
+            self._fields_by_geometry = by_geometry
+            self._fields_by_pattern_symbol = by_symbol
+        return self._fields_by_geometry, self._fields_by_pattern_symbol
+    
     def get_fields_by_epoch(self, epoch: Epoch) -> List[Field]:
         """Get all fields for a specific epoch"""
-        return [field for field in self.fields if field.epoch == epoch]
+        fields = list(self._fields_by_epoch.get(epoch, {}).values())
+        if self.catalog is not None:
+            return self.fields.catalog_fields(self.catalog.epoch_entries(epoch)) + fields
+        return fields
+    
+    def get_fields_by_geometry_type(self, geometry_type: str) -> List[Field]:
+        """Get all fields with at least one node of a geometry type"""
+        by_geometry, _ = self._content_indexes()
+        return list(by_geometry.get(geometry_type, {}).values())
+    
+    def get_fields_by_pattern_symbol(self, symbol: str) -> List[Field]:
+        """Get all fields whose sacred pattern carries a symbol (▲, ▼, ●, ...)"""
+        _, by_symbol = self._content_indexes()
+        return list(by_symbol.get(symbol, {}).values())
+    
+    def get_field(self, field_id: str) -> Optional[Field]:
+        """Get a field by id"""
+        field = self._fields_by_id.get(field_id)
+        if field is None and self.catalog is not None:
+            field = self.fields.get_catalog_field(field_id)
+        return field
+    
+    @property
+    def spatial_index(self) -> GeoGridIndex:
+        """Spatial index over field locations, built on first use"""
+        if self._spatial_index is None:
+            index = GeoGridIndex()
+            if self.catalog is not None:
+                for field_id, lat, lng in self.catalog.locations():
+                    if field_id not in self.fields.removed_ids:
+                        index.insert(field_id, lat, lng)
+            for field in self._fields_by_id.values():
+                location = field.physical_location
+                index.insert(field.id, location["lat"], location["lng"])
+            self._spatial_index = index
+        return self._spatial_index
+    
+    def add_field(self, field: Field):
+        """Add a field and update every index incrementally"""
+        if self.get_field(field.id) is not None:
+            raise ValueError(f"Field {field.id} already exists")
+        self.fields.append(field)
+        self._index_in_memory_field(field)
+        if self._fields_by_geometry is not None:
+            self._add_to_index(self._fields_by_geometry, self._geometry_types(field), field)
+            self._add_to_index(self._fields_by_pattern_symbol,
+                               self.pattern_symbols(field.sacred_pattern), field)
+        if self._spatial_index is not None:
+            location = field.physical_location
+            self._spatial_index.insert(field.id, location["lat"], location["lng"])
+    
+    def remove_field(self, field_id: str) -> Optional[Field]:
+        """Remove a field from the architecture and every index"""
+        field = self.get_field(field_id)
+        if field is None:
+            return None
+        self.fields.remove(field)
+        if self._fields_by_id.pop(field_id, None) is not None:
+            self._remove_from_index(self._fields_by_epoch, [field.epoch], field_id)
+        if self._fields_by_geometry is not None:
+            self._remove_from_index(self._fields_by_geometry, self._geometry_types(field), field_id)
+            self._remove_from_index(self._fields_by_pattern_symbol,
+                                    self.pattern_symbols(field.sacred_pattern), field_id)
+        if self._spatial_index is not None:
+            self._spatial_index.remove(field_id)
+        return field
+    
+    def nearest_fields(self, lat: float, lng: float, k: int = 1) -> List[Field]:
+        """Get the k fields nearest to a GPS point, closest first"""
+        return [self.get_field(field_id)
+                for _, field_id in self.spatial_index.nearest(lat, lng, k)]
+    
+    def fields_within(self, lat: float, lng: float, radius_m: float) -> List[Field]:
+        """Get all fields within radius_m meters of a GPS point, closest first"""
+        return [self.get_field(field_id)
+                for _, field_id in self.spatial_index.within(lat, lng, radius_m)]
+    
+    @staticmethod
+    def _symbol_tokens(symbol: str) -> Set[str]:
+        """The whole symbol, its glyphs and its names (e.g. "●", "OBI-WAN")"""
+        tokens = set(_SYMBOL_TOKEN.findall(symbol))
+        tokens.add(symbol)
+        return tokens
+    
+    def _index_character_symbol(self, char: Character):
+        # Characters are indexed in list order, so each token's first
+        # character is the one a scan would find
+        for token in self._symbol_tokens(char.symbol):
+            self._characters_by_token.setdefault(token, []).append(char)
+    
+    def add_character(self, character: Character):
+        """Add a character and index its symbol"""
+        self.characters.append(character)
+        self._index_character_symbol(character)
+    
+    def remove_character(self, name: str) -> Optional[Character]:
+        """Remove a character by name and drop its symbol tokens"""
+        for i, char in enumerate(self.characters):
+            if char.name == name:
+                del self.characters[i]
+                for token in self._symbol_tokens(char.symbol):
+                    chars = self._characters_by_token[token]
+                    chars[:] = [other for other in chars if other is not char]
+                    if not chars:
+                        del self._characters_by_token[token]
+                return char
+        return None
     
     def get_character_by_symbol(self, symbol: str) -> Optional[Character]:
-        """Get character by their symbol"""
+        """Get character by their symbol (or any part of it, e.g. "▲" or "ATLAS")
+        
+        Whole symbols, glyphs and names are index lookups; other fragments
+        fall back to a substring scan of the characters. An exact token
+        wins over an earlier character that only contains the text: with
+        "◆ATLASIAN" listed before "▲ATLAS", "ATLAS" finds "▲ATLAS" (a
+        plain scan would stop at "◆ATLASIAN"). Among token matches, and
+        among substring matches, the first character in list order wins.
+        """
+        chars = self._characters_by_token.get(symbol)
+        if chars:
+            return chars[0]
         for char in self.characters:
             if symbol in char.symbol:
                 return char
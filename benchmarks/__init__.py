@@ -0,0 +1 @@
+"""Performance benchmarks for the AR discovery system (run each module as a script)"""
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ARBridgeServer push latency with thousands of local clients
+
+Starts the server on a free local port, connects simulated clients that
+each subscribe to one field, then repeatedly moves field nodes and
+measures the time from publishing a batch to each subscriber receiving
+its delta. Clients run in the same process, so on a single core the
+numbers include client-side parsing.
+
+Usage: python benchmarks/bench_ar_server.py [clients] [fields] [rounds]
+"""
+
+import asyncio
+import json
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import UnityARBridge  # noqa: E402
+from ar_server import ARBridgeServer  # noqa: E402
+from benchmarks.synthetic import synthetic_fields  # noqa: E402
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def client(port: int, field_id: str, ready: asyncio.Event, latencies: list,
+                 publish_times: dict, snapshots: list):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(json.dumps({"op": "subscribe", "field_id": field_id}).encode() + b"\n")
+    await writer.drain()
+    markers = {}
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            received = time.perf_counter()
+            if message["type"] == "snapshot":
+                markers = {m["id"]: m for m in message["scene"]["scene"]["markers"]}
+                snapshots.append(field_id)
+                if not ready.is_set():
+                    ready.set()
+            elif message["type"] == "delta":
+                for marker in message["added"] + message["updated"]:
+                    markers[marker["id"]] = marker
+                for marker_id in message["removed"]:
+                    markers.pop(marker_id, None)
+                published = publish_times.get((field_id, message["version"]))
+                if published is not None:
+                    latencies.append(received - published)
+    finally:
+        writer.close()
+
+
+async def run(clients: int, field_count: int, rounds: int):
+    fields = [field.to_dict() for field in synthetic_fields(field_count, nodes_per_field=8)]
+    bridge = UnityARBridge()
+    for field_data in fields:
+        bridge.create_field_scene(field_data)
+    
+    # Publishing is driven by flush() below so each batch can be timed
+    server = ARBridgeServer(bridge, port=0, batch_interval=None, max_queue=256)
+    await server.start()
+    
+    latencies = []
+    snapshots = []
+    publish_times = {}
+    ready_events = []
+    tasks = []
+    start = time.perf_counter()
+    for i in range(clients):
+        ready = asyncio.Event()
+        ready_events.append(ready)
+        field_id = fields[i % field_count]["id"]
+        tasks.append(asyncio.ensure_future(
+            client(server.port, field_id, ready, latencies, publish_times, snapshots)))
+    await asyncio.gather(*(ready.wait() for ready in ready_events))
+    print(f"{clients} clients connected and snapshotted in {time.perf_counter() - start:.2f} s")
+    
+    rng = random.Random(3)
+    expected = 0
+    for _ in range(rounds):
+        # Several rapid updates per field between batches, coalesced into one delta
+        for _ in range(3):
+            for field_data in rng.sample(fields, max(1, field_count // 4)):
+                node = rng.choice(field_data["geometry_nodes"])
+                coords = node["coordinates"]
+                if "lat" in coords:
+                    coords["lat"] += rng.uniform(-1e-5, 1e-5)
+                else:
+                    coords["x"] += rng.uniform(-0.5, 0.5)
+                server.update_field(field_data)
+        publish_start = time.perf_counter()
+        versions = server.flush()
+        for field_id, version in versions.items():
+            publish_times[(field_id, version)] = publish_start
+            expected += len(server._subscribers.get(field_id, ()))
+        await asyncio.sleep(0.2)
+    
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await server.stop()
+    
+    print(f"{rounds} batches, {len(latencies)}/{expected} deltas delivered, "
+          f"{len(snapshots) - clients} resync snapshots")
+    if latencies:
+        print(f"publish→receive latency: p50 {percentile(latencies, 0.5) * 1e3:.1f} ms, "
+              f"p95 {percentile(latencies, 0.95) * 1e3:.1f} ms, "
+              f"p99 {percentile(latencies, 0.99) * 1e3:.1f} ms, "
+              f"max {max(latencies) * 1e3:.1f} ms")
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    field_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    # Each client holds two sockets (both ends are in this process)
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    needed = 2 * clients + 64
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+    asyncio.run(run(clients, field_count, rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start of each main.py command
+
+Runs every CLI command in a fresh interpreter (inside a scratch directory,
+so exports don't land in the repo) and reports the median wall time, plus
+which heavy modules each command ended up importing. A command that only
+writes a config file should never load numpy or aiohttp.
+
+Usage:
+    python benchmarks/bench_cli_startup.py [--repeat 5] [--budget 1.0]
+
+Exits with status 1 when any command's median exceeds --budget seconds.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "main.py")
+
+COMMANDS = [
+    ["--help"],
+    ["export-field"],
+    ["export-arch"],
+    ["overview"],
+    ["discover", "field_01"],
+    ["export-unity"],
+]
+
+HEAVY_MODULES = ("numpy", "aiohttp", "http.server")
+
+# Prints which heavy modules main() imported, after the command ran
+PROBE = (
+    "import sys, runpy; sys.path.insert(0, {root!r}); sys.argv = [{main!r}] + {argv!r}; "
+    "code = 0\n"
+    "try:\n"
+    "    runpy.run_path({main!r}, run_name='__main__')\n"
+    "except SystemExit as exc:\n"
+    "    code = exc.code or 0\n"
+    "print('LOADED', ','.join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)\n"
+    "sys.exit(code)\n"
+)
+
+
+def time_command(argv, cwd: str, repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, MAIN] + argv, cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    probe = subprocess.run(
+        [sys.executable, "-c", PROBE.format(root=ROOT, main=MAIN, argv=argv, heavy=HEAVY_MODULES)],
+        cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    loaded = [line.split(" ", 1)[1] for line in probe.stderr.splitlines()
+              if line.startswith("LOADED ")]
+    return times, (loaded[-1] if loaded else "") or "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None,
+                        help="fail when a command's median exceeds this many seconds")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    interpreter = time.perf_counter() - start
+    print(f"bare interpreter start: {interpreter * 1e3:.0f} ms\n")
+    
+    print(f"{'command':<24} {'median':>9} {'min':>9}  heavy imports")
+    over_budget = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for argv in COMMANDS:
+            times, loaded = time_command(argv, tmp, args.repeat)
+            median = statistics.median(times)
+            label = " ".join(argv)
+            print(f"{label:<24} {median * 1e3:>7.0f}ms {min(times) * 1e3:>7.0f}ms  {loaded}")
+            if args.budget is not None and median > args.budget:
+                over_budget.append(label)
+    
+    if over_budget:
+        print(f"\nOver the {args.budget:.2f} s budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Architecture startup from a memory-mapped field catalog
+
+Writes catalogs of growing size and measures Architecture(catalog_path)
+startup time and Python heap growth, plus id and epoch lookups. Startup
+cost should stay flat as the catalog grows.
+
+Usage: python benchmarks/bench_field_catalog.py [max_fields]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from architecture import Architecture, Epoch  # noqa: E402
+from field_catalog import write_catalog  # noqa: E402
+from benchmarks.synthetic import synthetic_fields  # noqa: E402
+
+
+def main():
+    max_fields = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sizes = [n for n in (1000, 10000, 100000, 1000000) if n <= max_fields]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"catalog_{size}.dfpc")
+            write_catalog(path, synthetic_fields(size, nodes_per_field=4))
+            file_mb = os.path.getsize(path) / 2**20
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            arch = Architecture(catalog_path=path)
+            startup = time.perf_counter() - start
+            heap, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            probe = f"synth_{size // 2:07d}"
+            start = time.perf_counter()
+            for _ in range(1000):
+                arch.get_field(probe)
+            by_id = (time.perf_counter() - start) / 1000
+            assert arch.get_field(probe).id == probe
+
+            start = time.perf_counter()
+            epoch_fields = arch.get_fields_by_epoch(Epoch.EPOCH_2)
+            by_epoch = time.perf_counter() - start
+
+            print(f"{size:>8d} fields ({file_mb:7.1f} MiB file): "
+                  f"startup {startup * 1e3:6.2f} ms, heap {heap / 1024:7.1f} KiB, "
+                  f"get_field {by_id * 1e6:6.1f} µs, "
+                  f"epoch_2 ({len(epoch_fields)} fields) {by_epoch * 1e3:8.1f} ms")
+            arch.catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark: procedural geometry meshes, built vs cached
+
+Builds every geometry type at every LOD level, then serves a stream of
+(type, LOD, scale) requests like a scene export would: once rebuilding
+each mesh, and once through MeshGenerator's cache.
+
+Usage: python benchmarks/bench_geometry_mesh.py [requests]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geometry_mesh import LOD_LEVELS, MeshGenerator, generate_mesh  # noqa: E402
+from unity_ar import GeometryRenderer  # noqa: E402
+
+
+def main():
+    request_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    types = list(GeometryRenderer.GEOMETRY_COLORS)
+    
+    print(f"{'geometry':18}" + "".join(f" {'LOD ' + str(lod) + ' verts/tris':>17}"
+                                       for lod in range(LOD_LEVELS)) + f" {'build':>9}")
+    for geometry_type in types:
+        start = time.perf_counter()
+        meshes = [generate_mesh(geometry_type, lod) for lod in range(LOD_LEVELS)]
+        elapsed = time.perf_counter() - start
+        counts = "".join(f" {f'{m.vertex_count}/{m.triangle_count}':>17}" for m in meshes)
+        print(f"{geometry_type:18}{counts} {elapsed / LOD_LEVELS * 1e6:>7.0f}µs")
+    
+    rng = random.Random(5)
+    scales = [0.5, 1.0, 1.5, 2.0]
+    requests = [(rng.choice(types), rng.randrange(LOD_LEVELS), rng.choice(scales))
+                for _ in range(request_count)]
+    
+    start = time.perf_counter()
+    for geometry_type, lod, scale in requests:
+        generate_mesh(geometry_type, lod, scale)
+    uncached = time.perf_counter() - start
+    
+    generator = MeshGenerator()
+    start = time.perf_counter()
+    for geometry_type, lod, scale in requests:
+        generator.mesh(geometry_type, lod, scale)
+    cached = time.perf_counter() - start
+    stats = generator.stats()
+    
+    print(f"\n{request_count} requests over {len(types) * LOD_LEVELS * len(scales)} keys")
+    print(f"  rebuilt every time: {uncached:.2f} s ({uncached / request_count * 1e6:.1f}µs each)")
+    print(f"  MeshGenerator:      {cached:.3f} s ({cached / request_count * 1e6:.2f}µs each), "
+          f"hit rate {stats['hit_rate']:.1%}, {uncached / cached:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
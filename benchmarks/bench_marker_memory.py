@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory of ARMarker dataclasses vs MarkerBuffer
+
+Builds the same N markers both ways and reports traced allocations
+per marker, plus the cost of producing Unity JSON from each layout.
+
+Usage: python benchmarks/bench_marker_memory.py [marker_count]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import (  # noqa: E402
+    ARMarker, ARMarkerType, MarkerBuffer, Quaternion, Vector3
+)
+from benchmarks.synthetic import GEOMETRY_TYPES  # noqa: E402
+
+
+def marker_rows(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield (f"region_node_{i:07d}",
+               (rng.uniform(-5000, 5000), rng.uniform(0, 50), rng.uniform(-5000, 5000)),
+               GEOMETRY_TYPES[i % len(GEOMETRY_TYPES)],
+               "physical_reality" if i % 2 == 0 else "digital_overlay")
+
+
+def build_dataclasses(count: int):
+    return [
+        ARMarker(
+            id=marker_id,
+            marker_type=ARMarkerType.GEOMETRY_NODE,
+            position=Vector3(*position),
+            rotation=Quaternion(0, 0, 0, 1),
+            scale=Vector3(1, 1, 1),
+            metadata={"geometry_type": geometry_type, "layer": layer}
+        )
+        for marker_id, position, geometry_type, layer in marker_rows(count)
+    ]
+
+
+def build_buffer(count: int):
+    buffer = MarkerBuffer(count)
+    for marker_id, position, geometry_type, layer in marker_rows(count):
+        buffer.append(marker_id, ARMarkerType.GEOMETRY_NODE, position,
+                      geometry_type=geometry_type, layer=layer)
+    return buffer
+
+
+def measure(builder, count: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = builder(count)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    markers, dc_bytes, dc_build = measure(build_dataclasses, count)
+    buffer, buf_bytes, buf_build = measure(build_buffer, count)
+
+    start = time.perf_counter()
+    dc_json = [m.to_unity_json() for m in markers]
+    dc_export = time.perf_counter() - start
+    start = time.perf_counter()
+    buf_json = buffer.to_unity_json()
+    buf_export = time.perf_counter() - start
+    assert [m["id"] for m in dc_json] == [m["id"] for m in buf_json]
+
+    print(f"{count} markers")
+    print(f"dataclasses:  {dc_bytes / 2**20:8.1f} MiB  ({dc_bytes / count:6.0f} B/marker)  "
+          f"build {dc_build:.3f} s  json {dc_export:.3f} s")
+    print(f"MarkerBuffer: {buf_bytes / 2**20:8.1f} MiB  ({buf_bytes / count:6.0f} B/marker)  "
+          f"build {buf_build:.3f} s  json {buf_export:.3f} s")
+    print(f"memory reduction: {dc_bytes / buf_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
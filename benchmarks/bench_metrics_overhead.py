@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of metrics instrumentation on the bridge hot paths
+
+Times scene building and JSON export three ways: the uninstrumented
+internals (_build_field_scene, _export_scene), the public methods with
+metrics disabled (metrics=None), and the public methods recording into a
+MetricsRegistry. Disabled metrics are meant to cost one None check.
+
+Each variant is timed with timeit (garbage collection off) over
+--repeats interleaved repeats; overheads compare the minimum, and the
+median is shown alongside it as a check on noise.
+
+Usage:
+    python benchmarks/bench_metrics_overhead.py [--fields 200] [--nodes 50] [--repeats 50] [--budget 2.0]
+
+Exits with status 1 when disabled metrics add more than --budget percent
+over the uninstrumented path.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import MetricsRegistry  # noqa: E402
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import synthetic_fields  # noqa: E402
+
+
+def timer(fn, items) -> timeit.Timer:
+    def run():
+        for item in items:
+            fn(item)
+    return timeit.Timer(run)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fields", type=int, default=200)
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--budget", type=float, default=None,
+                        help="fail when disabled metrics add more than this many percent")
+    args = parser.parse_args()
+    
+    fields = [field.to_dict() for field in synthetic_fields(args.fields, args.nodes)]
+    ids = [field["id"] for field in fields]
+    disabled = UnityARBridge()
+    enabled = UnityARBridge(metrics=MetricsRegistry())
+    
+    paths = {
+        "build": {
+            "uninstrumented": (disabled._build_field_scene, fields),
+            "disabled": (disabled.create_field_scene, fields),
+            "enabled": (enabled.create_field_scene, fields),
+        },
+        "export": {
+            "uninstrumented": (disabled._export_scene, ids),
+            "disabled": (disabled.export_for_unity, ids),
+            "enabled": (enabled.export_for_unity, ids),
+        },
+    }
+    for field in fields:
+        enabled.create_field_scene(field)
+    
+    print(f"{args.fields} fields x {args.nodes} nodes, {args.repeats} repeats "
+          f"(min / median per op)\n")
+    print(f"{'path':<8} {'uninstrumented':>21} {'disabled':>21} {'enabled':>21}")
+    over_budget = []
+    for path, variants in paths.items():
+        timers = {name: timer(fn, items) for name, (fn, items) in variants.items()}
+        times = {name: [] for name in variants}
+        # Interleave variants so drift affects them equally
+        for _ in range(args.repeats):
+            for name, run in timers.items():
+                times[name].extend(run.repeat(repeat=1, number=1))
+        best = {name: min(samples) for name, samples in times.items()}
+        median = {name: statistics.median(samples) for name, samples in times.items()}
+        cells = [f"{best[name] / len(fields) * 1e6:.1f} / {median[name] / len(fields) * 1e6:.1f} us"
+                 for name in variants]
+        print(f"{path:<8} " + " ".join(f"{cell:>21}" for cell in cells))
+        base = best["uninstrumented"]
+        overhead = (best["disabled"] / base - 1.0) * 100.0
+        print(f"{'':<8} disabled overhead {overhead:+.2f}% "
+              f"(median {(median['disabled'] / median['uninstrumented'] - 1.0) * 100.0:+.2f}%), "
+              f"enabled overhead {(best['enabled'] / base - 1.0) * 100.0:+.2f}%")
+        if args.budget is not None and overhead > args.budget:
+            over_budget.append(path)
+    
+    if over_budget:
+        print(f"\nDisabled metrics over the {args.budget:.1f}% budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
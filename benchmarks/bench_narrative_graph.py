@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: NarrativeGraph load and query at synthetic ontology scale
+
+Writes an ontology CSV with the NarrativeOntology.csv columns, streams
+it into a NarrativeGraph, then times reachability, k-hop, shortest path
+and filter queries. The load is reported against TARGET_ROWS_PER_SECOND
+(a million rows in a few seconds) next to the time the csv module alone
+needs to parse the file, which bounds what the loader can reach.
+
+Usage: python benchmarks/bench_narrative_graph.py [rows] [related_per_row]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from narrative_graph import load_ontology  # noqa: E402
+
+
+# Multi-million-row ontologies should load in seconds
+TARGET_ROWS_PER_SECOND = 250000
+
+
+PREFIXES = [("H", "HOME"), ("S", "SPACE"), ("O", "OBJECT"), ("A", "ACTOR"), ("E", "EVENT"),
+            ("SG", "SIGNAL"), ("M", "MEMORY"), ("T", "THRESHOLD"), ("F", "FIELD"), ("V", "VOID")]
+STATUSES = ["Active", "Pending", "Conditional", "Locked", "Mystery"]
+
+
+def write_ontology(path: str, rows: int, related_per_row: int, seed: int = 11):
+    """Write a synthetic ontology; ids are spread across the 10 Bit prefixes"""
+    rng = random.Random(seed)
+    ids = [f"{PREFIXES[i % 10][0]}{i:07d}" for i in range(rows)]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["ID", "Name", "BitType", "Description", "Location", "Epoch",
+                         "RelatedIDs", "Status"])
+        for i, bit_id in enumerate(ids):
+            # Mostly local links plus a few long jumps, like a story web
+            related = {ids[(i + rng.randint(1, 50)) % rows] for _ in range(related_per_row - 1)}
+            related.add(ids[rng.randrange(rows)])
+            writer.writerow([bit_id, f"Bit {i}", PREFIXES[i % 10][1],
+                             "Synthetic narrative element", "-37.8179, 144.9690",
+                             rng.choice(["Present", "Past", "Future"]),
+                             ",".join(sorted(related)), rng.choice(STATUSES)])
+    return ids
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    related_per_row = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ontology.csv")
+        start = time.perf_counter()
+        ids = write_ontology(path, rows, related_per_row)
+        print(f"wrote {rows} rows ({os.path.getsize(path) / 2**20:.1f} MiB) "
+              f"in {time.perf_counter() - start:.1f} s")
+        
+        start = time.perf_counter()
+        with open(path, newline="", encoding="utf-8") as f:
+            for _ in csv.reader(f):
+                pass
+        parse = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        graph = load_ontology(path)
+        load = time.perf_counter() - start
+        csr_bytes = graph.indptr.nbytes + graph.indices.nbytes
+        print(f"load: {load:.2f} s ({rows / load:,.0f} rows/s), "
+              f"{len(graph)} Bits, {graph.edge_count} edges, CSR {csr_bytes / 2**20:.1f} MiB")
+        print(f"csv parse alone: {parse:.2f} s ({rows / parse:,.0f} rows/s)")
+        verdict = "met" if rows / load >= TARGET_ROWS_PER_SECOND else "MISSED"
+        print(f"target {TARGET_ROWS_PER_SECOND:,} rows/s: {verdict} "
+              f"({rows / load / TARGET_ROWS_PER_SECOND:.0%} of target)\n")
+        
+        probe = ids[rows // 3]
+        goal = ids[(rows // 3 + rows // 2) % rows]
+        for label, query in (
+            ("k_hop(3)", lambda: graph.k_hop(probe, 3)),
+            ("reachable(Active)", lambda: graph.reachable(probe, statuses=["Active"])),
+            ("shortest_path", lambda: graph.shortest_path(probe, goal)),
+            ("filter(THRESHOLD, Locked)",
+             lambda: graph.filter(bit_types=["THRESHOLD"], statuses=["Locked"])),
+            ("reachable(all)", lambda: graph.reachable(probe)),
+        ):
+            start = time.perf_counter()
+            result = query()
+            elapsed = time.perf_counter() - start
+            size = len(result) if result is not None else 0
+            print(f"{label:28s} {elapsed * 1e3:9.2f} ms  ({size} results)")
+
+
+if __name__ == "__main__":
+    main()
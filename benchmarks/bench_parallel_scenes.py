@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial vs pooled scene generation
+
+Times UnityARBridge.create_field_scene in a serial loop against
+create_field_scenes on process and thread pools for 1..N workers.
+
+Usage: python benchmarks/bench_parallel_scenes.py [field_count] [nodes_per_field]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import synthetic_fields  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    nodes_per_field = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    field_dicts = [f.to_dict() for f in synthetic_fields(count, nodes_per_field)]
+    cores = os.cpu_count() or 1
+
+    bridge = UnityARBridge()
+    start = time.perf_counter()
+    serial = [bridge.create_field_scene(fd) for fd in field_dicts]
+    serial_s = time.perf_counter() - start
+    expected = [scene.to_dict() for scene in serial]
+
+    print(f"{count} fields × {nodes_per_field} nodes, {cores} cores available")
+    print(f"serial:              {serial_s:8.3f} s")
+
+    worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    for executor in ("process", "thread"):
+        for workers in worker_counts:
+            bridge = UnityARBridge()
+            start = time.perf_counter()
+            scenes = bridge.create_field_scenes(field_dicts, workers=workers, executor=executor)
+            elapsed = time.perf_counter() - start
+            assert [scene.to_dict() for scene in scenes] == expected, "parallel result mismatch"
+            assert list(bridge.active_scenes) == [fd["id"] for fd in field_dicts]
+            print(f"{executor:7s} workers={workers:<3d} {elapsed:8.3f} s   "
+                  f"speedup {serial_s / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
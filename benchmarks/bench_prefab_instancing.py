@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-node prefab dicts vs interned prefabs and instance batches
+
+Builds synthetic scenes and compares export_for_unity (one prefab dict
+per node, one draw call per marker) with export_instanced (each prefab
+listed once, markers grouped into DrawMeshInstanced batches): payload
+size, export time and the number of draw calls a device would issue.
+
+Usage: python benchmarks/bench_prefab_instancing.py [fields] [nodes_per_field]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import synthetic_fields  # noqa: E402
+
+
+def main():
+    field_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    nodes_per_field = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    
+    fields = [field.to_dict() for field in synthetic_fields(field_count, nodes_per_field)]
+    bridge = UnityARBridge(compact_markers=True)
+    bridge.create_field_scenes(fields, executor="thread")
+    ids = [field["id"] for field in fields]
+    
+    results = {}
+    for label, export in (("export_for_unity", bridge.export_for_unity),
+                          ("export_instanced", bridge.export_instanced)):
+        start = time.perf_counter()
+        exported = [export(field_id) for field_id in ids]
+        elapsed = time.perf_counter() - start
+        size = sum(len(json.dumps(scene, separators=(",", ":"))) for scene in exported)
+        if label == "export_instanced":
+            draw_calls = sum(len(scene["scene"]["batches"]) for scene in exported)
+            prefabs = sum(len(scene["scene"]["prefabs"]) for scene in exported)
+        else:
+            draw_calls = sum(len(scene["scene"]["markers"]) for scene in exported)
+            prefabs = sum(len(scene["scene"]["geometry_prefabs"]) for scene in exported)
+        results[label] = (elapsed, size, draw_calls, prefabs)
+    
+    print(f"{field_count} scenes x {nodes_per_field} nodes, "
+          f"{len(bridge.prefabs)} distinct prefabs in the registry\n")
+    print(f"{'':18} {'export':>9} {'JSON':>10} {'prefab defs':>12} {'draw calls':>11}")
+    for label, (elapsed, size, draw_calls, prefabs) in results.items():
+        print(f"{label:18} {elapsed * 1e3:>7.0f}ms {size / 2**20:>8.2f}MB {prefabs:>12} {draw_calls:>11}")
+    base, inst = results["export_for_unity"], results["export_instanced"]
+    print(f"\nJSON {base[1] / inst[1]:.1f}x smaller, export {base[0] / inst[0]:.1f}x faster, "
+          f"{base[2] / inst[2]:.0f}x fewer draw calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: epoch transition stalls with and without prefetching
+
+Runs a local stand-in for DOJO (aiohttp, fixed latency per request) and a
+synthetic world, then has players enter every field of the next epoch
+right after the transition: once cold, and once with EpochPrefetcher
+having warmed that epoch while players were still in the previous one.
+Reports the first player's stall and the scene and MCP cache hit rates.
+
+Usage: python benchmarks/bench_prefetch.py [fields] [dojo_latency_ms]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from architecture import Epoch  # noqa: E402
+from field_backend import FIELDConfig, MCPClient  # noqa: E402
+from prefetch import EpochPrefetcher, default_field_requests  # noqa: E402
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import synthetic_architecture  # noqa: E402
+
+
+async def start_dojo(latency: float):
+    async def handle(request):
+        await asyncio.sleep(latency)
+        return web.json_response({"ok": True})
+    
+    app = web.Application()
+    app.router.add_route("POST", "/{tail:.*}", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def enter_epoch(prefetcher: EpochPrefetcher, client: MCPClient, epoch: Epoch):
+    """A player arrives at each field of epoch in turn; returns the stalls"""
+    stalls = []
+    for field in prefetcher.architecture.get_fields_by_epoch(epoch):
+        start = time.perf_counter()
+        prefetcher.scene_for(field.id)
+        await asyncio.gather(*(client.request(endpoint, payload)
+                               for endpoint, payload in default_field_requests(field)))
+        stalls.append(time.perf_counter() - start)
+    return stalls
+
+
+async def run(field_count: int, latency: float):
+    runner, base_url = await start_dojo(latency)
+    architecture = synthetic_architecture(field_count, nodes_per_field=20)
+    config = FIELDConfig(dojo_base_url=base_url)
+    try:
+        for warm in (False, True):
+            bridge = UnityARBridge()
+            async with MCPClient(config, max_concurrency=32) as client:
+                prefetcher = EpochPrefetcher(architecture, bridge, client, max_concurrency=8)
+                start = time.perf_counter()
+                if warm:
+                    # Players entered epoch 1 earlier; epoch 2 warmed in the background
+                    summary = await prefetcher.schedule_next(Epoch.EPOCH_1)
+                    print(f"prefetched {summary['fields']} fields "
+                          f"({summary['requests']} DOJO requests) in {summary['seconds']:.2f} s")
+                    start = time.perf_counter()
+                    await prefetcher.transition_epoch(Epoch.EPOCH_1, Epoch.EPOCH_2)
+                else:
+                    await client.transition_epoch(Epoch.EPOCH_1.value, Epoch.EPOCH_2.value)
+                transition = time.perf_counter() - start
+                before = client.cache_stats()
+                stalls = await enter_epoch(prefetcher, client, Epoch.EPOCH_2)
+                after = client.cache_stats()
+                hits = after["hits"] - before["hits"]
+                lookups = hits + after["misses"] - before["misses"] + after["coalesced"] - before["coalesced"]
+                stats = prefetcher.stats()
+                label = "prefetched" if warm else "cold"
+                print(f"{label:>10}: transition {transition * 1e3:6.1f} ms, first arrival "
+                      f"{stalls[0] * 1e3:6.1f} ms, mean {sum(stalls) / len(stalls) * 1e3:5.1f} ms, "
+                      f"scene hit rate {stats['scene_hit_rate']:.0%}, "
+                      f"MCP hit rate {hits / lookups:.0%}")
+                await prefetcher.close()
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    field_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) / 1e3 if len(sys.argv) > 2 else 0.02
+    asyncio.run(run(field_count, latency))
+
+
+if __name__ == "__main__":
+    main()
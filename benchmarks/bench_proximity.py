@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ProximityEngine throughput on a high-rate player GPS stream
+
+Geofences the GPS nodes of synthetic fields around Melbourne, then feeds
+batches of random-walk player updates and reports sustained updates per
+second. The target is 100k updates/s on one core.
+
+Usage: python benchmarks/bench_proximity.py [players] [batch_size] [seconds]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import GPSToARConverter  # noqa: E402
+from proximity import ProximityEngine  # noqa: E402
+
+
+ORIGIN = (-37.8179, 144.9690)
+TARGET_UPDATES_PER_S = 100000
+
+
+def main():
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+    rng = np.random.default_rng(42)
+    
+    engine = ProximityEngine(GPSToARConverter(*ORIGIN), enter_radius_m=20.0, exit_radius_m=30.0)
+    # ~10k nodes over a 4 km × 4 km area: dense enough that players
+    # regularly cross geofences
+    node_lat = ORIGIN[0] + rng.uniform(-0.018, 0.018, 10000)
+    node_lng = ORIGIN[1] + rng.uniform(-0.023, 0.023, 10000)
+    for i, (lat, lng) in enumerate(zip(node_lat.tolist(), node_lng.tolist())):
+        engine.add_node(f"field_{i // 4:05d}", f"node_{i:05d}", lat, lng)
+    
+    player_ids = [f"player_{i:06d}" for i in range(players)]
+    lat = ORIGIN[0] + rng.uniform(-0.018, 0.018, players)
+    lng = ORIGIN[1] + rng.uniform(-0.023, 0.023, players)
+    t = 0.0
+    
+    updates = 0
+    events = 0
+    busy = 0.0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        chosen = rng.integers(0, players, batch_size)
+        # ~1.5 m GPS steps with jitter
+        lat[chosen] += rng.normal(0.0, 0.0000135, batch_size)
+        lng[chosen] += rng.normal(0.0, 0.000017, batch_size)
+        t += 1.0
+        ids = [player_ids[i] for i in chosen.tolist()]
+        batch_lat = lat[chosen]
+        batch_lng = lng[chosen]
+        ts = np.full(batch_size, t)
+        
+        start = time.perf_counter()
+        events += len(engine.update(ids, batch_lat, batch_lng, ts))
+        busy += time.perf_counter() - start
+        updates += batch_size
+    
+    rate = updates / busy
+    print(f"{engine.node_count} nodes, {players} players, batches of {batch_size}")
+    print(f"{updates} updates in {busy:.2f} s engine time: {rate:,.0f} updates/s, "
+          f"{events} events ({events / updates:.3f} per update)")
+    print(("✓" if rate >= TARGET_UPDATES_PER_S else "✗")
+          + f" target {TARGET_UPDATES_PER_S:,} updates/s")
+
+
+if __name__ == "__main__":
+    main()
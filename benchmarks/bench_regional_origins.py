@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one AR origin vs nearest regional origins
+
+Builds scenes for synthetic fields in several cities, once around the
+single default origin (Melbourne) and once with an origin per city.
+For each city it reports how far Unity-space distances between a field's
+GPS nodes are from the WGS84 distance at the field's own latitude, and
+the float32 resolution at the size of the Unity coordinates. It also
+reports the cost of the nearest-origin lookup in scene build time.
+
+Usage: python benchmarks/bench_regional_origins.py [fields] [nodes_per_field]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import UnityARBridge, meters_per_degree  # noqa: E402
+from benchmarks.synthetic import CITIES, synthetic_fields  # noqa: E402
+
+
+def city_errors(bridge: UnityARBridge, fields):
+    """Per city: (worst relative distance error, worst float32 spacing in m)"""
+    errors = {}
+    for i, field in enumerate(fields):
+        city = CITIES[i % len(CITIES)][0]
+        scene = bridge.get_scene(field["id"])
+        rows = [j for j, node in enumerate(field["geometry_nodes"]) if "lat" in node["coordinates"]]
+        positions = scene.markers.positions[rows].astype(np.float64)
+        gps = [field["geometry_nodes"][j]["coordinates"] for j in rows]
+        worst = 0.0
+        for a in range(len(rows) - 1):
+            per_lat, per_lng = meters_per_degree((gps[a]["lat"] + gps[a + 1]["lat"]) / 2.0)
+            true = float(np.hypot((gps[a + 1]["lat"] - gps[a]["lat"]) * per_lat,
+                                  (gps[a + 1]["lng"] - gps[a]["lng"]) * per_lng))
+            local = float(np.linalg.norm((positions[a] - positions[a + 1])[[0, 2]]))
+            if true > 1.0:
+                worst = max(worst, abs(local - true) / true)
+        spacing = float(np.spacing(np.abs(scene.markers.positions).max()))
+        previous = errors.get(city, (0.0, 0.0))
+        errors[city] = (max(previous[0], worst), max(previous[1], spacing))
+    return errors
+
+
+def main():
+    field_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    nodes_per_field = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    fields = [field.to_dict() for field in synthetic_fields(field_count, nodes_per_field)]
+    origins = {name: (lat, lng) for name, lat, lng in CITIES}
+    
+    results = {}
+    for label, kwargs in (("single origin", {}), ("regional", {"origins": origins})):
+        bridge = UnityARBridge(compact_markers=True, **kwargs)
+        start = time.perf_counter()
+        for field in fields:
+            bridge.create_field_scene(field)
+        elapsed = time.perf_counter() - start
+        results[label] = (elapsed, city_errors(bridge, fields))
+    
+    print(f"{field_count} fields x {nodes_per_field} nodes across {len(CITIES)} cities\n")
+    print(f"{'city':10} {'single: dist error':>19} {'float32 step':>13} "
+          f"{'regional: dist error':>21} {'float32 step':>13}")
+    single, regional = results["single origin"][1], results["regional"][1]
+    for city, _, _ in CITIES:
+        print(f"{city:10} {single[city][0]:>18.3%} {single[city][1] * 100:>11.2f}cm "
+              f"{regional[city][0]:>20.4%} {regional[city][1] * 100:>11.3f}cm")
+    base, regional_time = results["single origin"][0], results["regional"][0]
+    print(f"\nscene build: {base / field_count * 1e6:.0f} µs/field single origin, "
+          f"{regional_time / field_count * 1e6:.0f} µs/field with nearest-origin lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: binary scene format vs export_for_unity JSON
+
+Round-trips every scene through export_binary / BinarySceneReader and
+compares payload size and parse time against the JSON export.
+
+Usage: python benchmarks/bench_scene_binary.py [field_count] [nodes_per_field]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from architecture import Architecture  # noqa: E402
+from scene_binary import BinarySceneReader  # noqa: E402
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import synthetic_fields  # noqa: E402
+
+
+def check_round_trip(expected, decoded):
+    """Binary decode must match JSON export up to float32 precision"""
+    assert decoded["version"] == expected["version"]
+    assert decoded["converter_origin"] == expected["converter_origin"]
+    assert decoded["unity_settings"] == expected["unity_settings"]
+    scene, other = expected["scene"], decoded["scene"]
+    for key in ("field_id", "ambient_lighting", "geometry_prefabs"):
+        assert scene[key] == other[key], key
+    assert len(scene["markers"]) == len(other["markers"])
+    for a, b in zip(scene["markers"], other["markers"]):
+        assert (a["id"], a["type"], a["metadata"]) == (b["id"], b["type"], b["metadata"])
+        for part, axes in a["transform"].items():
+            for axis, value in axes.items():
+                assert abs(value - b["transform"][part][axis]) <= 1e-3 * max(1.0, abs(value))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    nodes_per_field = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    bridge = UnityARBridge()
+    fields = Architecture().fields + synthetic_fields(count, nodes_per_field)
+    for field in fields:
+        bridge.create_field_scene(field.to_dict())
+
+    json_payloads = []
+    binary_payloads = []
+    for field in fields:
+        export = bridge.export_for_unity(field.id)
+        binary = bridge.export_binary(field.id)
+        check_round_trip(export, BinarySceneReader(binary).to_dict())
+        json_payloads.append(json.dumps(export, separators=(",", ":")).encode("utf-8"))
+        binary_payloads.append(binary)
+    print(f"round-tripped {len(fields)} scenes")
+
+    json_size = sum(len(p) for p in json_payloads)
+    binary_size = sum(len(p) for p in binary_payloads)
+
+    start = time.perf_counter()
+    for payload in json_payloads:
+        json.loads(payload)
+    json_parse = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for payload in binary_payloads:
+        reader = BinarySceneReader(payload)
+        np.asarray(reader.transforms)
+    binary_open = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for payload in binary_payloads:
+        BinarySceneReader(payload).to_dict()
+    binary_decode = time.perf_counter() - start
+
+    print(f"size:  json {json_size / 2**20:8.2f} MiB   binary {binary_size / 2**20:8.2f} MiB   "
+          f"({json_size / binary_size:.1f}x smaller)")
+    print(f"parse: json.loads {json_parse * 1e3:8.1f} ms   "
+          f"binary zero-copy open {binary_open * 1e3:8.1f} ms "
+          f"({json_parse / binary_open:.0f}x faster)")
+    print(f"       binary full decode to dicts {binary_decode * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON scene export vs GLB export
+
+Builds synthetic scenes and compares export_for_unity serialized to JSON
+with export_glb: export time, bytes per scene, and the time a client
+needs to get at the marker transforms (json.loads of the whole document
+vs reading the GLB JSON chunk and mapping the transform buffer views).
+The GLB files also carry the generated meshes, which JSON does not.
+
+Usage: python benchmarks/bench_scene_glb.py [fields] [nodes_per_field]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scene_gltf import INSTANCING_EXTENSION, read_glb  # noqa: E402
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import synthetic_fields  # noqa: E402
+
+
+def glb_transforms(data: bytes) -> int:
+    """Map every instance translation of a GLB file; returns the instance count"""
+    gltf, binary = read_glb(data)
+    count = 0
+    for node in gltf.get("nodes", []):
+        accessor = gltf["accessors"][node["extensions"][INSTANCING_EXTENSION]
+                                     ["attributes"]["TRANSLATION"]]
+        view = gltf["bufferViews"][accessor["bufferView"]]
+        translations = np.frombuffer(binary, dtype="<f4", count=accessor["count"] * 3,
+                                     offset=view["byteOffset"] + accessor["byteOffset"])
+        count += len(translations) // 3
+    return count
+
+
+def json_transforms(text: str) -> int:
+    scene = json.loads(text)["scene"]
+    return len([marker["transform"]["position"] for marker in scene["markers"]])
+
+
+def main():
+    field_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    nodes_per_field = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    
+    fields = [field.to_dict() for field in synthetic_fields(field_count, nodes_per_field)]
+    bridge = UnityARBridge(compact_markers=True)
+    bridge.create_field_scenes(fields, executor="thread")
+    ids = [field["id"] for field in fields]
+    bridge.export_glb(ids[0])  # generate the meshes once
+    
+    start = time.perf_counter()
+    texts = [json.dumps(bridge.export_for_unity(field_id), separators=(",", ":"))
+             for field_id in ids]
+    json_export = time.perf_counter() - start
+    start = time.perf_counter()
+    files = [bridge.export_glb(field_id) for field_id in ids]
+    glb_export = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    json_markers = sum(json_transforms(text) for text in texts)
+    json_load = time.perf_counter() - start
+    start = time.perf_counter()
+    glb_markers = sum(glb_transforms(data) for data in files)
+    glb_load = time.perf_counter() - start
+    assert json_markers == glb_markers
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        for field_id in ids:
+            bridge.write_glb(field_id, os.path.join(tmp, f"{field_id}.glb"))
+        write = time.perf_counter() - start
+    
+    json_size = sum(len(text.encode("utf-8")) for text in texts)
+    glb_size = sum(len(data) for data in files)
+    print(f"{field_count} scenes x {nodes_per_field} nodes ({json_markers} markers)\n")
+    print(f"{'':6} {'export':>9} {'size':>10} {'client load':>12}")
+    print(f"{'JSON':6} {json_export * 1e3:>7.0f}ms {json_size / 2**20:>8.2f}MB {json_load * 1e3:>10.0f}ms")
+    print(f"{'GLB':6} {glb_export * 1e3:>7.0f}ms {glb_size / 2**20:>8.2f}MB {glb_load * 1e3:>10.0f}ms")
+    print(f"\nGLB {json_size / glb_size:.1f}x smaller, client load {json_load / glb_load:.0f}x faster; "
+          f"writing every .glb file took {write * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scene tile pyramid over a regional Melbourne scene
+
+Builds scenes for many synthetic Melbourne fields, tiles all of their
+markers, then measures camera queries at several view radii and the bulk
+export of every tile. Compares the bytes a device loads for one view
+against exporting every scene in full.
+
+Usage: python benchmarks/bench_scene_tiles.py [fields] [nodes_per_field]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import CITIES, synthetic_fields  # noqa: E402
+
+
+def main():
+    field_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    nodes_per_field = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    
+    # synthetic_fields cycles through the cities; keep Melbourne only
+    fields = synthetic_fields(field_count * len(CITIES), nodes_per_field)[::len(CITIES)]
+    bridge = UnityARBridge(compact_markers=True)
+    bridge.create_field_scenes([field.to_dict() for field in fields], executor="thread")
+    
+    start = time.perf_counter()
+    pyramid = bridge.build_tiles()
+    build = time.perf_counter() - start
+    print(f"{pyramid.marker_count} markers from {len(fields)} fields: pyramid built in "
+          f"{build * 1e3:.0f} ms (extent {pyramid.extent:.0f} m, zoom 0-{pyramid.max_zoom})")
+    print("tiles per zoom:", pyramid.tileset()["tile_counts"])
+    
+    full_bytes = sum(len(json.dumps(bridge.export_for_unity(field.id), separators=(",", ":")))
+                     for field in fields)
+    rng = random.Random(11)
+    print(f"\n{'view radius':>12} {'zoom':>5} {'tiles':>6} {'markers':>8} {'query':>9} {'payload':>10}")
+    for radius in (100.0, 500.0, 2000.0, 10000.0):
+        cameras = [(rng.uniform(-15000, 15000), rng.uniform(-15000, 15000)) for _ in range(2000)]
+        start = time.perf_counter()
+        results = [pyramid.query(x, z, radius) for x, z in cameras]
+        per_query = (time.perf_counter() - start) / len(cameras)
+        # Payload for a sample of views
+        tiles = markers = payload = 0
+        for zoom, visible in results[:50]:
+            tiles += len(visible)
+            for tile in visible:
+                data = pyramid.tile(*tile)
+                markers += len(data["markers"])
+                payload += len(json.dumps(data, separators=(",", ":")))
+        print(f"{radius:>10.0f} m {results[0][0]:>5} {tiles / 50:>6.1f} {markers / 50:>8.0f} "
+              f"{per_query * 1e6:>7.1f}µs {payload / 50 / 1024:>8.1f}KB")
+    print(f"(all scenes in full: {full_bytes / 2**20:.1f} MB)")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        tileset = pyramid.export(tmp)
+        export = time.perf_counter() - start
+        print(f"\nexported {tileset['tiles_written']} tiles in {export:.2f} s "
+              f"({tileset['tiles_written'] / export:.0f} tiles/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: spatial index vs linear scan for field proximity queries
+
+Scatters synthetic fields around several cities and compares
+Architecture.nearest_fields / fields_within against scanning every
+Field.physical_location.
+
+Usage: python benchmarks/bench_spatial_index.py [field_count]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from architecture import Architecture  # noqa: E402
+from spatial_index import haversine_m  # noqa: E402
+from benchmarks.synthetic import CITIES, synthetic_fields  # noqa: E402
+
+
+def linear_nearest(fields, lat, lng, k):
+    ranked = sorted(
+        fields,
+        key=lambda f: haversine_m(lat, lng, f.physical_location["lat"], f.physical_location["lng"])
+    )
+    return ranked[:k]
+
+
+def linear_within(fields, lat, lng, radius_m):
+    return [
+        f for f in fields
+        if haversine_m(lat, lng, f.physical_location["lat"], f.physical_location["lng"]) <= radius_m
+    ]
+
+
+def timed(fn, queries):
+    start = time.perf_counter()
+    results = [fn(*q) for q in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(11)
+
+    arch = Architecture()
+    arch.spatial_index  # build now so the adds below update it incrementally
+    start = time.perf_counter()
+    for field in synthetic_fields(count):
+        arch.add_field(field)
+    build_s = time.perf_counter() - start
+
+    queries = []
+    for i in range(200):
+        _, lat0, lng0 = CITIES[i % len(CITIES)]
+        queries.append((lat0 + rng.uniform(-0.15, 0.15), lng0 + rng.uniform(-0.15, 0.15)))
+
+    k = 10
+    radius_m = 1500.0
+    lin_nn, lin_nn_res = timed(lambda la, ln: linear_nearest(arch.fields, la, ln, k), queries)
+    idx_nn, idx_nn_res = timed(lambda la, ln: arch.nearest_fields(la, ln, k), queries)
+    lin_in, lin_in_res = timed(lambda la, ln: linear_within(arch.fields, la, ln, radius_m), queries)
+    idx_in, idx_in_res = timed(lambda la, ln: arch.fields_within(la, ln, radius_m), queries)
+
+    for a, b in zip(lin_nn_res, idx_nn_res):
+        assert [f.id for f in a] == [f.id for f in b], "nearest_fields mismatch"
+    for a, b in zip(lin_in_res, idx_in_res):
+        assert {f.id for f in a} == {f.id for f in b}, "fields_within mismatch"
+
+    print(f"fields indexed: {len(arch.fields)} (incremental build {build_s * 1000:.1f} ms)")
+    print(f"nearest_fields k={k}:   linear {lin_nn * 1e3:8.3f} ms   "
+          f"index {idx_nn * 1e3:8.3f} ms   speedup {lin_nn / idx_nn:6.1f}x")
+    print(f"fields_within {radius_m:.0f} m: linear {lin_in * 1e3:8.3f} ms   "
+          f"index {idx_in * 1e3:8.3f} ms   speedup {lin_in / idx_in:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
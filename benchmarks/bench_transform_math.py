@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-marker transform math, scalar vs batched
+
+Orients N markers toward a character anchor, moves them by a field-level
+transform, interpolates their rotations and measures distances. The
+scalar column is a per-object Python loop over the pure-Python
+Vector3/Quaternion methods, i.e. what callers did before the batched
+kernels. The batched column makes one transform_math call per operation.
+Reports the cost per marker of each.
+
+Usage: python benchmarks/bench_transform_math.py [markers]
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import transform_math  # noqa: E402
+from unity_ar import Quaternion, Vector3  # noqa: E402
+
+
+def field_transform(rotation: Quaternion, offset: Vector3, v: Vector3) -> Vector3:
+    rotated = rotation.rotate(v)
+    return Vector3(rotated.x + offset.x, rotated.y + offset.y, rotated.z + offset.z)
+
+
+def timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = np.random.default_rng(3)
+    positions = rng.uniform(-500.0, 500.0, size=(count, 3))
+    anchor = np.array([12.0, 1.5, -40.0])
+    field_rotation = np.array([0.0, math.sin(math.pi / 8), 0.0, math.cos(math.pi / 8)])
+    field_offset = np.array([100.0, 0.0, -250.0])
+    
+    vectors = [Vector3(*row) for row in positions.tolist()]
+    anchor_vector = Vector3(*anchor.tolist())
+    field_quaternion = Quaternion(*field_rotation.tolist())
+    offset_vector = Vector3(*field_offset.tolist())
+    identity = Quaternion(0.0, 0.0, 0.0, 1.0)
+    rotations = [Quaternion.look_rotation(Vector3(anchor_vector.x - v.x, anchor_vector.y - v.y,
+                                                  anchor_vector.z - v.z)) for v in vectors]
+    batch_rotations = transform_math.look_at(positions, anchor)
+    
+    operations = [
+        ("look at anchor",
+         lambda: [Quaternion.look_rotation(Vector3(anchor_vector.x - v.x, anchor_vector.y - v.y,
+                                                   anchor_vector.z - v.z)) for v in vectors],
+         lambda: transform_math.look_at(positions, anchor)),
+        ("field transform",
+         lambda: [(field_transform(field_quaternion, offset_vector, v), field_quaternion * q)
+                  for v, q in zip(vectors, rotations)],
+         lambda: transform_math.apply_transform(positions, batch_rotations, np.ones((count, 3)),
+                                                field_offset, field_rotation)),
+        ("slerp to identity",
+         lambda: [q.slerp(identity, 0.25) for q in rotations],
+         lambda: transform_math.quat_slerp(batch_rotations, transform_math.IDENTITY, 0.25)),
+        ("distance to anchor",
+         lambda: [v.distance_to(anchor_vector) for v in vectors],
+         lambda: transform_math.distances(positions, anchor)),
+    ]
+    
+    print(f"{count} markers\n")
+    print(f"{'operation':20} {'scalar':>12} {'batched':>12} {'speedup':>8}")
+    for label, scalar, batched in operations:
+        scalar_time = timed(scalar)
+        batched_time = timed(batched)
+        print(f"{label:20} {scalar_time / count * 1e6:>9.2f}µs {batched_time / count * 1e6:>9.3f}µs "
+              f"{scalar_time / batched_time:>7.0f}x")
+    
+    sample = positions[:2000]
+    start = time.perf_counter()
+    matrix = transform_math.pairwise_distances(sample)
+    elapsed = time.perf_counter() - start
+    print(f"\npairwise distances {len(sample)}x{len(sample)}: {elapsed * 1e3:.1f} ms "
+          f"({elapsed / matrix.size * 1e9:.1f} ns per pair)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Pipeline benchmark suite
+
+Times and memory-profiles each pipeline stage on synthetic worlds of
+growing size, writes machine-readable JSON results, and compares them
+against a stored baseline to flag regressions.
+
+Stages:
+    architecture_build   Architecture() plus adding the synthetic fields/characters
+    create_field_scene   UnityARBridge.create_field_scene for every field
+    export_for_unity     UnityARBridge.export_for_unity for every field
+    architecture_to_dict Architecture.to_dict
+
+Usage:
+    python benchmarks/suite.py                          # sizes 10..10000
+    python benchmarks/suite.py --sizes 10,1000,1000000 --nodes-per-field 4
+    python benchmarks/suite.py --save-baseline          # record the baseline
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --tolerance 0.25
+
+Exits with status 1 when any stage regresses past the tolerance.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unity_ar import UnityARBridge  # noqa: E402
+from benchmarks.synthetic import synthetic_architecture  # noqa: E402
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def measure(fn: Callable, repeat: int, profile_memory: bool) -> Dict:
+    """Best-of-repeat wall time, then one traced run for peak memory"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if profile_memory:
+        gc.collect()
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak, "result": result}
+
+
+def run_size(size: int, nodes_per_field: int, character_count: int,
+             repeat: int, profile_memory: bool) -> List[Dict]:
+    """Run every stage for one world size"""
+    rows = []
+    
+    def record(stage: str, measured: Dict):
+        rows.append({
+            "stage": stage,
+            "size": size,
+            "seconds": measured["seconds"],
+            "peak_bytes": measured["peak_bytes"]
+        })
+    
+    build = measure(
+        lambda: synthetic_architecture(size, nodes_per_field, character_count),
+        repeat, profile_memory
+    )
+    record("architecture_build", build)
+    arch = build["result"]
+    field_dicts = [field.to_dict() for field in arch.fields]
+    
+    def create_scenes():
+        bridge = UnityARBridge()
+        for field_data in field_dicts:
+            bridge.create_field_scene(field_data)
+        return bridge
+    
+    scenes = measure(create_scenes, repeat, profile_memory)
+    record("create_field_scene", scenes)
+    bridge = scenes["result"]
+    
+    record("export_for_unity", measure(
+        lambda: [bridge.export_for_unity(field_data["id"]) for field_data in field_dicts],
+        repeat, profile_memory
+    ))
+    record("architecture_to_dict", measure(arch.to_dict, repeat, profile_memory))
+    return rows
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """Regression messages for stages slower or larger than baseline × (1 + tolerance)"""
+    previous = {(row["stage"], row["size"]): row for row in baseline.get("results", [])}
+    regressions = []
+    for row in results:
+        base = previous.get((row["stage"], row["size"]))
+        if base is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            now, then = row.get(metric), base.get(metric)
+            if now is None or not then:
+                continue
+            if now > then * (1.0 + tolerance):
+                regressions.append(
+                    f"{row['stage']} @ {row['size']}: {metric} {then:.6g} -> {now:.6g} "
+                    f"(+{(now / then - 1.0) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="comma-separated field counts (default: %(default)s)")
+    parser.add_argument("--nodes-per-field", type=int, default=2)
+    parser.add_argument("--characters-per-field", type=float, default=0.1,
+                        help="synthetic characters generated per field (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per stage")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc runs")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown/growth before flagging (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write these results to the baseline path")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    sizes = [int(n) for n in args.sizes.split(",") if n.strip()]
+    
+    results = []
+    for size in sizes:
+        character_count = int(size * args.characters_per_field)
+        for row in run_size(size, args.nodes_per_field, character_count,
+                            args.repeat, not args.no_memory):
+            results.append(row)
+            peak = row["peak_bytes"]
+            peak_text = f"{peak / 2**20:9.2f} MiB" if peak is not None else "        -"
+            print(f"{row['stage']:22s} size={size:<8d} {row['seconds'] * 1e3:11.2f} ms  "
+                  f"peak {peak_text}")
+    
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "nodes_per_field": args.nodes_per_field,
+            "characters_per_field": args.characters_per_field,
+            "repeat": args.repeat
+        },
+        "results": results
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nREGRESSIONS (tolerance {args.tolerance:.0%}):")
+        for message in regressions:
+            print(f"  ✗ {message}")
+        return 1
+    print(f"\n✓ No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Synthetic world data shared by the benchmarks
+
+Scatters generated fields around several cities so benchmarks can
+run at sizes far beyond the 10 hand-built Melbourne fields.
+"""
+
+import random
+from typing import List
+
+from architecture import Architecture, Character, Epoch, Field, GeometryNode, Layer
+from unity_ar import GeometryRenderer
+
+
+CITIES = [
+    ("Melbourne", -37.8136, 144.9631),
+    ("Sydney", -33.8688, 151.2093),
+    ("Brisbane", -27.4698, 153.0251),
+    ("Perth", -31.9505, 115.8605),
+    ("Auckland", -36.8485, 174.7633),
+]
+
+GEOMETRY_TYPES = sorted(GeometryRenderer.GEOMETRY_COLORS)
+
+
+def synthetic_fields(count: int, nodes_per_field: int = 2, seed: int = 7) -> List[Field]:
+    """Generate fields scattered within ~20 km of each city
+    
+    Nodes alternate between physical (GPS) and digital (Unity) layers,
+    mirroring the hand-built fields.
+    """
+    rng = random.Random(seed)
+    epochs = list(Epoch)
+    fields = []
+    for i in range(count):
+        _, lat0, lng0 = CITIES[i % len(CITIES)]
+        lat = lat0 + rng.uniform(-0.18, 0.18)
+        lng = lng0 + rng.uniform(-0.22, 0.22)
+        geometry_type = GEOMETRY_TYPES[i % len(GEOMETRY_TYPES)]
+        nodes = []
+        for j in range(nodes_per_field):
+            node_id = f"synth_{i:07d}_{j:03d}"
+            if j % 2 == 0:
+                nodes.append(GeometryNode(
+                    node_id, Layer.PHYSICAL_REALITY,
+                    {"lat": lat + rng.uniform(-0.001, 0.001),
+                     "lng": lng + rng.uniform(-0.001, 0.001)},
+                    geometry_type
+                ))
+            else:
+                nodes.append(GeometryNode(
+                    node_id, Layer.DIGITAL_OVERLAY,
+                    {"x": rng.uniform(-500, 500), "y": rng.uniform(0, 100),
+                     "z": rng.uniform(-500, 500)},
+                    geometry_type
+                ))
+        fields.append(Field(
+            id=f"synth_{i:07d}",
+            name=f"Synthetic Field {i}",
+            epoch=epochs[i % len(epochs)],
+            geometry_nodes=nodes,
+            physical_location={"lat": lat, "lng": lng},
+            sacred_pattern="●-synthetic"
+        ))
+    return fields
+
+
+def synthetic_characters(count: int, seed: int = 5) -> List[Character]:
+    """Generate characters with unique glyph-prefixed symbols"""
+    rng = random.Random(seed)
+    glyphs = "▲▼●"
+    affinities = ["triangles_upward", "triangles_downward", "circles"]
+    characters = []
+    for i in range(count):
+        characters.append(Character(
+            name=f"Synth{i}",
+            symbol=f"{glyphs[i % 3]}SYN{i:07d}",
+            role=rng.choice(["Descender", "Ascender", "Centerer"]),
+            archetype="Synthetic Walker",
+            geometry_affinity=affinities[i % 3]
+        ))
+    return characters
+
+
+def synthetic_architecture(field_count: int, nodes_per_field: int = 2,
+                           character_count: int = 0, seed: int = 7) -> Architecture:
+    """Architecture with the built-in world plus generated fields and characters"""
+    arch = Architecture()
+    for field in synthetic_fields(field_count, nodes_per_field, seed):
+        arch.add_field(field)
+    for character in synthetic_characters(character_count, seed):
+        arch.add_character(character)
+    return arch
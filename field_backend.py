@@ -7,9 +7,20 @@ Media storage: ~/Pictures/FIELD/
 Intelligence: DOJO via MCP APIs only - NEVER direct access
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 from enum import Enum
+import json
+import time
+
+from metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    # Both are imported where MCPClient uses them: together they are most of
+    # the import time, and config-only callers (export-field) never need them
+    import asyncio
+    import aiohttp
 
 
 class DojoAPIEndpoint(Enum):
@@ -57,6 +68,11 @@ class FIELDConfig:
                     "description": "DOJO intelligence connector (MCP only)",
                     "port": 8004,
                     "access_mode": "MCP_ONLY"
+                },
+                "metrics": {
+                    "enabled": False,
+                    "description": "Prometheus metrics endpoint (localhost)",
+                    "port": 8005
                 }
             }
     
@@ -83,66 +99,308 @@ class FIELDConfig:
         }
 
 
+class MCPError(Exception):
+    """Raised when a DOJO request over MCP fails"""
+    
+    def __init__(self, message: str, endpoint: str = "", status: Optional[int] = None):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.status = status
+
+
+class ResponseCache:
+    """LRU cache with per-entry TTL for DOJO responses"""
+    
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict]]" = OrderedDict()
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Return a live entry and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: Dict):
+        """Store an entry, evicting the least recently used beyond max_entries"""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        self._entries.clear()
+
+
+def canonical_request_key(url: str, payload: Dict) -> Tuple[str, str]:
+    """Cache key for a request: endpoint URL plus key-order independent payload"""
+    return (url, json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str))
+
+
 class MCPClient:
-    """MCP (Message Control Protocol) Client for DOJO intelligence access"""
+    """MCP (Message Control Protocol) Client for DOJO intelligence access
+    
+    All calls share one aiohttp session (and so one connection pool).
+    A semaphore bounds how many requests are in flight at once. Use as
+    ``async with MCPClient(config) as client:`` or call ``close()``.
+    
+    Responses from CACHEABLE_ENDPOINTS are cached by endpoint plus
+    canonical payload (TTL + LRU), and concurrent identical requests
+    share one in-flight call. Cached responses are shared between
+    callers; treat them as read-only.
     
-    def __init__(self, config: FIELDConfig):
+    Pass a MetricsRegistry to record per-endpoint request latency and
+    outcomes plus the cache counters.
+    
+    The session, semaphore and in-flight table belong to one event loop.
+    A client used from a new loop (e.g. a second asyncio.run) rebuilds
+    them; close() it before its loop ends, since a session it created on
+    the old loop is dropped rather than closed. A session passed in is
+    never replaced and must belong to the loop the client runs on.
+    """
+    
+    # Read-only analysis endpoints; transitions and guidance are not cached
+    CACHEABLE_ENDPOINTS = frozenset({
+        DojoAPIEndpoint.GEOMETRY_ANALYSIS,
+        DojoAPIEndpoint.SACRED_MAPPING,
+    })
+    
+    def __init__(self, config: FIELDConfig, max_concurrency: int = 16,
+                 timeout: float = 30.0, connection_limit: int = 64,
+                 session: Optional["aiohttp.ClientSession"] = None,
+                 cache_size: int = 1024, cache_ttl: float = 300.0,
+                 metrics: Optional[MetricsRegistry] = None):
         self.config = config
         if not config.validate_dojo_access():
             raise ValueError("DOJO must be accessed via MCP only")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.connection_limit = connection_limit
+        self._session = session
+        self._owns_session = session is None
+        # Created lazily and rebuilt per event loop (see _bind_loop)
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._semaphore: Optional["asyncio.Semaphore"] = None
+        self.cache = ResponseCache(cache_size, cache_ttl)
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future"] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.coalesced = 0
+        self.metrics = metrics
+        if metrics is not None:
+            self._request_seconds = metrics.histogram(
+                "mcp_request_seconds", "DOJO request latency over MCP", ["endpoint"])
+            self._requests_total = metrics.counter(
+                "mcp_requests_total", "DOJO requests sent over MCP", ["endpoint", "outcome"])
+            self._cache_hits_total = metrics.counter(
+                "mcp_cache_hits_total", "Responses served from the cache")
+            self._cache_misses_total = metrics.counter(
+                "mcp_cache_misses_total", "Cacheable requests sent to DOJO")
+            self._cache_coalesced_total = metrics.counter(
+                "mcp_cache_coalesced_total", "Requests that joined an in-flight call")
+            self._cache_evictions_total = metrics.counter(
+                "mcp_cache_evictions_total", "Responses evicted from the cache")
+            metrics.gauge("mcp_inflight_requests", "Coalesced requests in flight").track(
+                self, lambda client: len(client._inflight))
     
-    async def analyze_geometry(self, geometry_data: Dict) -> Dict:
-        """Analyze sacred geometry patterns via MCP"""
-        endpoint = self.config.get_dojo_endpoint(DojoAPIEndpoint.GEOMETRY_ANALYSIS)
-        # Implementation would use MCP protocol
+    async def __aenter__(self) -> "MCPClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Shared session with a pooled connector"""
+        if self._session is None or self._session.closed:
+            import aiohttp
+            
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"X-DOJO-Access-Mode": self.config.dojo_access_mode}
+            )
+            self._owns_session = True
+        return self._session
+    
+    def _bind_loop(self):
+        """Rebuild loop-bound state when called from a different event loop"""
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._inflight = {}
+        if self._owns_session:
+            self._session = None
+    
+    async def close(self):
+        """Close the shared session if this client created it"""
+        if self._session is not None and self._owns_session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def request(self, endpoint: DojoAPIEndpoint, payload: Dict) -> Dict:
+        """POST a payload to a DOJO endpoint over MCP
+        
+        Cacheable endpoints are served from the response cache when
+        possible, and identical concurrent requests are coalesced.
+        """
+        import asyncio
+        
+        self._bind_loop()
+        if endpoint not in self.CACHEABLE_ENDPOINTS or self.cache.max_entries <= 0:
+            return await self._send(endpoint, payload)
+        
+        key = canonical_request_key(self.config.get_dojo_endpoint(endpoint), payload)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            if self.metrics is not None:
+                self._cache_hits_total.inc()
+            return dict(cached)
+        
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            if self.metrics is not None:
+                self._cache_coalesced_total.inc()
+        else:
+            self.cache_misses += 1
+            if self.metrics is not None:
+                self._cache_misses_total.inc()
+            task = asyncio.ensure_future(self._send_and_cache(key, endpoint, payload))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._request_done(key, done))
+        # Shield so one cancelled caller doesn't cancel everyone's request
+        return dict(await asyncio.shield(task))
+    
+    def _request_done(self, key: Tuple[str, str], task: "asyncio.Future"):
+        self._inflight.pop(key, None)
+        # Every caller may have been cancelled; don't log the error as unretrieved
+        if not task.cancelled():
+            task.exception()
+    
+    async def _send_and_cache(self, key: Tuple[str, str], endpoint: DojoAPIEndpoint,
+                              payload: Dict) -> Dict:
+        result = await self._send(endpoint, payload)
+        evictions = self.cache.evictions
+        self.cache.put(key, result)
+        if self.metrics is not None and self.cache.evictions > evictions:
+            self._cache_evictions_total.inc(self.cache.evictions - evictions)
+        return result
+    
+    async def _send(self, endpoint: DojoAPIEndpoint, payload: Dict) -> Dict:
+        """Perform one uncached request"""
+        if self.metrics is None:
+            return await self._post(endpoint, payload)
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await self._post(endpoint, payload)
+            outcome = "ok"
+            return result
+        finally:
+            self._request_seconds.labels(endpoint.name).observe(time.perf_counter() - start)
+            self._requests_total.labels(endpoint.name, outcome).inc()
+    
+    async def _post(self, endpoint: DojoAPIEndpoint, payload: Dict) -> Dict:
+        import asyncio
+        import aiohttp
+        
+        url = self.config.get_dojo_endpoint(endpoint)
+        session = self._get_session()
+        async with self._semaphore:
+            try:
+                async with session.post(url, json=payload) as response:
+                    if response.status >= 400:
+                        raise MCPError(
+                            f"DOJO returned HTTP {response.status} for {endpoint.name}",
+                            endpoint=url,
+                            status=response.status
+                        )
+                    data = await response.json(content_type=None)
+            except asyncio.TimeoutError as exc:
+                raise MCPError(f"DOJO request timed out: {endpoint.name}", endpoint=url) from exc
+            except aiohttp.ClientError as exc:
+                raise MCPError(f"DOJO request failed: {exc}", endpoint=url) from exc
+        
+        result = {"endpoint": url, "method": "MCP"}
+        result.update(payload)
+        result["status"] = "complete"
+        result["response"] = data
+        return result
+    
+    def cache_stats(self) -> Dict:
+        """Cache counters for sizing: hits, misses, coalesced, evictions"""
+        lookups = self.cache_hits + self.cache_misses + self.coalesced
         return {
-            "endpoint": endpoint,
-            "method": "MCP",
-            "geometry_data": geometry_data,
-            "status": "pending"
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "coalesced": self.coalesced,
+            "evictions": self.cache.evictions,
+            "entries": len(self.cache),
+            "max_entries": self.cache.max_entries,
+            "hit_rate": (self.cache_hits + self.coalesced) / lookups if lookups else 0.0
         }
     
+    async def gather_many(self, requests: Iterable[Tuple[DojoAPIEndpoint, Dict]],
+                          return_exceptions: bool = False) -> List:
+        """Issue many (endpoint, payload) requests concurrently
+        
+        Results come back in input order; concurrency stays bounded by
+        max_concurrency.
+        """
+        import asyncio
+        
+        return await asyncio.gather(
+            *(self.request(endpoint, payload) for endpoint, payload in requests),
+            return_exceptions=return_exceptions
+        )
+    
+    async def analyze_geometry(self, geometry_data: Dict) -> Dict:
+        """Analyze sacred geometry patterns via MCP"""
+        return await self.request(DojoAPIEndpoint.GEOMETRY_ANALYSIS,
+                                  {"geometry_data": geometry_data})
+    
     async def discover_field(self, location: Dict) -> Dict:
         """Discover new field via MCP"""
-        endpoint = self.config.get_dojo_endpoint(DojoAPIEndpoint.FIELD_DISCOVERY)
-        return {
-            "endpoint": endpoint,
-            "method": "MCP",
-            "location": location,
-            "status": "pending"
-        }
+        return await self.request(DojoAPIEndpoint.FIELD_DISCOVERY,
+                                  {"location": location})
     
     async def map_sacred_pattern(self, pattern: str) -> Dict:
         """Map sacred pattern via MCP"""
-        endpoint = self.config.get_dojo_endpoint(DojoAPIEndpoint.SACRED_MAPPING)
-        return {
-            "endpoint": endpoint,
-            "method": "MCP",
-            "pattern": pattern,
-            "status": "pending"
-        }
+        return await self.request(DojoAPIEndpoint.SACRED_MAPPING,
+                                  {"pattern": pattern})
     
     async def get_character_guidance(self, character_symbol: str, context: Dict) -> Dict:
         """Get character guidance via MCP"""
-        endpoint = self.config.get_dojo_endpoint(DojoAPIEndpoint.CHARACTER_GUIDANCE)
-        return {
-            "endpoint": endpoint,
-            "method": "MCP",
-            "character": character_symbol,
-            "context": context,
-            "status": "pending"
-        }
+        return await self.request(DojoAPIEndpoint.CHARACTER_GUIDANCE,
+                                  {"character": character_symbol, "context": context})
     
     async def transition_epoch(self, current_epoch: str, next_epoch: str) -> Dict:
         """Manage epoch transition via MCP"""
-        endpoint = self.config.get_dojo_endpoint(DojoAPIEndpoint.EPOCH_TRANSITION)
-        return {
-            "endpoint": endpoint,
-            "method": "MCP",
-            "current_epoch": current_epoch,
-            "next_epoch": next_epoch,
-            "status": "pending"
-        }
+        return await self.request(DojoAPIEndpoint.EPOCH_TRANSITION,
+                                  {"current_epoch": current_epoch, "next_epoch": next_epoch})
 
 
 @dataclass
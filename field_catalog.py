@@ -0,0 +1,286 @@
+"""
+Field Catalog
+
+Indexed, memory-mapped on-disk store of Fields for the Physical Reality
+layer. Opening a catalog maps the file and reads only its header; Field
+objects are deserialized on first access, and lookups by id (binary
+search) or epoch (precomputed index) touch only the records they return.
+
+Layout (little endian):
+    header          HEADER struct
+    meta            JSON: epoch values in ordinal order
+    ids             UTF-8 field ids, concatenated in sorted byte order
+    entries         field_count × ENTRY, sorted by id bytes
+    epoch index     epoch_count × (start, count) uint32, then entry numbers
+    records         compact JSON of each Field.to_dict()
+"""
+
+import bisect
+import json
+import mmap
+import struct
+import weakref
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from architecture import Epoch, Field
+
+
+MAGIC = b"DFPC"
+VERSION = 1
+
+# magic, version, reserved, field_count, epoch_count, meta offset, meta size,
+# ids offset, entries offset, epoch index offset, records offset
+HEADER = struct.Struct("<4sHHIIQIQQQQ")
+# record offset, record size, id offset, id size, epoch ordinal, lat, lng
+ENTRY = struct.Struct("<QIIII4xdd")
+EPOCH_SPAN = struct.Struct("<II")
+
+
+def write_catalog(path: str, fields: Iterable[Field]):
+    """Write fields to a catalog file at path"""
+    epochs = list(Epoch)
+    epoch_ordinals = {epoch: i for i, epoch in enumerate(epochs)}
+
+    rows = []
+    for field in fields:
+        record = json.dumps(field.to_dict(), separators=(",", ":"),
+                            ensure_ascii=False).encode("utf-8")
+        rows.append((field.id.encode("utf-8"), epoch_ordinals[field.epoch],
+                     field.physical_location["lat"], field.physical_location["lng"],
+                     record))
+    rows.sort(key=lambda row: row[0])
+    for previous, current in zip(rows, rows[1:]):
+        if previous[0] == current[0]:
+            raise ValueError(f"duplicate field id in catalog: {current[0].decode('utf-8')}")
+
+    meta = json.dumps({"epochs": [epoch.value for epoch in epochs]}).encode("utf-8")
+    ids = b"".join(row[0] for row in rows)
+
+    by_epoch: List[List[int]] = [[] for _ in epochs]
+    for number, row in enumerate(rows):
+        by_epoch[row[1]].append(number)
+
+    meta_offset = HEADER.size
+    ids_offset = meta_offset + len(meta)
+    entries_offset = (ids_offset + len(ids) + 7) // 8 * 8
+    epoch_index_offset = entries_offset + ENTRY.size * len(rows)
+    records_offset = epoch_index_offset + EPOCH_SPAN.size * len(epochs) + 4 * len(rows)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(rows), len(epochs),
+                            meta_offset, len(meta), ids_offset, entries_offset,
+                            epoch_index_offset, records_offset))
+        f.write(meta)
+        f.write(ids)
+        f.write(b"\0" * (entries_offset - ids_offset - len(ids)))
+
+        id_offset = 0
+        record_offset = records_offset
+        for id_bytes, ordinal, lat, lng, record in rows:
+            f.write(ENTRY.pack(record_offset, len(record), id_offset, len(id_bytes),
+                               ordinal, lat, lng))
+            id_offset += len(id_bytes)
+            record_offset += len(record)
+
+        start = 0
+        for numbers in by_epoch:
+            f.write(EPOCH_SPAN.pack(start, len(numbers)))
+            start += len(numbers)
+        for numbers in by_epoch:
+            f.write(struct.pack(f"<{len(numbers)}I", *numbers))
+
+        for row in rows:
+            f.write(row[4])
+
+
+class FieldCatalog:
+    """Read-only view of a catalog file
+
+    Fields are built on first access and reused while anything still
+    references them, so repeated lookups return the same Field object.
+    The cache_size most recently used fields are also kept alive; other
+    unreferenced fields are dropped and rebuilt from the file on demand.
+    """
+
+    def __init__(self, path: str, cache_size: int = 1024):
+        self.path = path
+        self.cache_size = cache_size
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, self._count, epoch_count, meta_offset, meta_size,
+         self._ids_offset, self._entries_offset, self._epoch_index_offset,
+         _) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a field catalog (bad magic)")
+        if version != VERSION:
+            self._map.close()
+            raise ValueError(f"unsupported field catalog version {version}")
+        meta = json.loads(self._map[meta_offset:meta_offset + meta_size].decode("utf-8"))
+        self._epochs = [Epoch(value) for value in meta["epochs"]]
+        self._epoch_ordinals = {epoch: i for i, epoch in enumerate(self._epochs)}
+        self._fields: "weakref.WeakValueDictionary[int, Field]" = weakref.WeakValueDictionary()
+        self._recent: "OrderedDict[int, Field]" = OrderedDict()
+
+    def __enter__(self) -> "FieldCatalog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, number: int) -> Tuple[int, int, int, int, int, float, float]:
+        return ENTRY.unpack_from(self._map, self._entries_offset + number * ENTRY.size)
+
+    def _id_bytes(self, number: int) -> bytes:
+        _, _, id_offset, id_size, _, _, _ = self._entry(number)
+        start = self._ids_offset + id_offset
+        return self._map[start:start + id_size]
+
+    def _find(self, field_id: str) -> int:
+        """Entry number for field_id via binary search, or -1"""
+        target = field_id.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id_bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._id_bytes(lo) == target:
+            return lo
+        return -1
+
+    def field_at(self, number: int) -> Field:
+        """Field for an entry number (entries are sorted by id)"""
+        field = self._fields.get(number)
+        if field is None:
+            if not 0 <= number < self._count:
+                raise IndexError("catalog entry out of range")
+            record_offset, record_size = self._entry(number)[:2]
+            data = json.loads(self._map[record_offset:record_offset + record_size].decode("utf-8"))
+            field = Field.from_dict(data)
+            self._fields[number] = field
+        if self.cache_size > 0:
+            self._recent[number] = field
+            self._recent.move_to_end(number)
+            if len(self._recent) > self.cache_size:
+                self._recent.popitem(last=False)
+        return field
+
+    def index_of(self, field_id: str) -> int:
+        """Entry number of field_id, or -1 if absent"""
+        return self._find(field_id)
+
+    def __contains__(self, field_id: str) -> bool:
+        return self._find(field_id) >= 0
+
+    def get(self, field_id: str) -> Optional[Field]:
+        """Field by id, or None"""
+        number = self._find(field_id)
+        return self.field_at(number) if number >= 0 else None
+
+    def epoch_entries(self, epoch: Epoch) -> List[int]:
+        """Entry numbers of the fields in an epoch"""
+        ordinal = self._epoch_ordinals.get(epoch)
+        if ordinal is None:
+            return []
+        start, count = EPOCH_SPAN.unpack_from(
+            self._map, self._epoch_index_offset + ordinal * EPOCH_SPAN.size)
+        numbers_offset = self._epoch_index_offset + len(self._epochs) * EPOCH_SPAN.size + 4 * start
+        return list(struct.unpack_from(f"<{count}I", self._map, numbers_offset))
+
+    def get_by_epoch(self, epoch: Epoch) -> List[Field]:
+        """Fields of an epoch, building only those"""
+        return [self.field_at(number) for number in self.epoch_entries(epoch)]
+
+    def locations(self) -> Iterator[Tuple[str, float, float]]:
+        """(field_id, lat, lng) for every entry without deserializing records"""
+        for number in range(self._count):
+            _, _, id_offset, id_size, _, lat, lng = self._entry(number)
+            start = self._ids_offset + id_offset
+            yield self._map[start:start + id_size].decode("utf-8"), lat, lng
+
+    def __iter__(self) -> Iterator[Field]:
+        for number in range(self._count):
+            yield self.field_at(number)
+
+
+class CatalogFieldList(Sequence):
+    """List-like view of catalog fields plus fields added at runtime
+
+    Catalog fields removed at runtime are hidden by tombstones; the file
+    itself is never modified.
+    """
+
+    def __init__(self, catalog: FieldCatalog):
+        self.catalog = catalog
+        self.added: List[Field] = []
+        self.removed_ids: Set[str] = set()
+        self._removed_entries: Set[int] = set()
+        # The same entry numbers, sorted, to map list indexes past them
+        self._removed_sorted: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.catalog) - len(self._removed_entries) + len(self.added)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("field index out of range")
+        live_catalog = len(self.catalog) - len(self._removed_entries)
+        if index >= live_catalog:
+            return self.added[index - live_catalog]
+        # Live entry index sits after the k removed entries r_j with
+        # r_j - j <= index (r_j - j is non-decreasing); binary search for k
+        removed = self._removed_sorted
+        lo, hi = 0, len(removed)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if removed[mid] - mid <= index:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self.catalog.field_at(index + lo)
+
+    def __iter__(self) -> Iterator[Field]:
+        for number in range(len(self.catalog)):
+            if number not in self._removed_entries:
+                yield self.catalog.field_at(number)
+        yield from self.added
+
+    def catalog_fields(self, numbers: Iterable[int]) -> List[Field]:
+        """Live catalog fields for a list of entry numbers"""
+        return [self.catalog.field_at(number) for number in numbers
+                if number not in self._removed_entries]
+
+    def get_catalog_field(self, field_id: str) -> Optional[Field]:
+        """Live catalog field by id, or None"""
+        number = self.catalog.index_of(field_id)
+        if number < 0 or number in self._removed_entries:
+            return None
+        return self.catalog.field_at(number)
+
+    def append(self, field: Field):
+        self.added.append(field)
+
+    def remove(self, field: Field):
+        for i, added in enumerate(self.added):
+            if added is field:
+                del self.added[i]
+                return
+        number = self.catalog.index_of(field.id)
+        if number < 0 or number in self._removed_entries:
+            raise ValueError(f"{field.id} is not in the field list")
+        self._removed_entries.add(number)
+        bisect.insort(self._removed_sorted, number)
+        self.removed_ids.add(field.id)
@@ -0,0 +1,379 @@
+"""
+Geometry Meshes
+
+Procedural meshes for the sacred geometry types of GeometryRenderer, so
+devices can load ready-made vertex, normal and index buffers instead of
+building the shapes themselves every time a scene loads.
+
+Meshes are built with NumPy in one pass per shape (no per-vertex Python
+loops). They are right-handed and y-up with counter-clockwise front
+faces (the glTF convention), centred on the origin and about two units
+across at scale 1. LOD 0 is the most detailed, and each further level
+halves the segment counts of curved shapes. Flat-sided shapes (triangles,
+hexagon, mirror plane) are the same at every LOD.
+
+Mesh.to_dict converts to Unity's left-handed space for devices that fill
+a UnityEngine.Mesh directly: x is mirrored and each triangle's winding
+reversed, so front faces stay clockwise as Unity expects. The arrays
+themselves stay in glTF space (scene_gltf writes them unchanged).
+
+MeshGenerator memoizes meshes in a bounded LRU cache keyed by
+(geometry_type, lod, scale). Cached arrays are read-only and shared.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import math
+import threading
+
+import numpy as np
+
+
+LOD_LEVELS = 4
+
+# Segments around a full turn at LOD 0
+BASE_SEGMENTS = 48
+
+
+@dataclass
+class Mesh:
+    """Triangle mesh: N×3 float32 vertices and normals, M×3 uint32 indices"""
+    geometry_type: str
+    lod: int
+    scale: float
+    vertices: np.ndarray
+    normals: np.ndarray
+    indices: np.ndarray
+    
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices)
+    
+    @property
+    def triangle_count(self) -> int:
+        return len(self.indices)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.vertices.nbytes + self.normals.nbytes + self.indices.nbytes
+    
+    def bounds(self) -> Tuple[List[float], List[float]]:
+        """(min, max) corners of the axis-aligned bounding box"""
+        if not len(self.vertices):
+            return [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        return self.vertices.min(axis=0).tolist(), self.vertices.max(axis=0).tolist()
+    
+    def to_dict(self) -> Dict:
+        """Flat JSON arrays in Unity space, as Mesh.vertices/normals/triangles take them
+        
+        Mirrors x and reverses each triangle (see the module docstring).
+        """
+        mirror = np.array([-1.0, 1.0, 1.0], dtype=np.float32)
+        return {
+            "geometry_type": self.geometry_type,
+            "lod": self.lod,
+            "scale": self.scale,
+            "vertices": (self.vertices * mirror).ravel().tolist(),
+            "normals": (self.normals * mirror).ravel().tolist(),
+            "triangles": self.indices[:, ::-1].ravel().tolist()
+        }
+
+
+# (vertices, normals, indices) while building
+_Parts = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _segments(lod: int, minimum: int) -> int:
+    return max(minimum, BASE_SEGMENTS >> lod)
+
+
+def _grid_indices(rows: int, columns: int) -> np.ndarray:
+    """Two triangles per cell of a row-major (rows + 1) × (columns + 1) vertex grid"""
+    r, c = np.meshgrid(np.arange(rows), np.arange(columns), indexing="ij")
+    a = (r * (columns + 1) + c).ravel()
+    b = a + columns + 1
+    return np.concatenate([np.stack([a, a + 1, b], axis=1),
+                           np.stack([a + 1, b + 1, b], axis=1)])
+
+
+def _merge(parts: Sequence[_Parts]) -> _Parts:
+    offsets = np.cumsum([0] + [len(vertices) for vertices, _, _ in parts[:-1]])
+    return (np.concatenate([vertices for vertices, _, _ in parts]),
+            np.concatenate([normals for _, normals, _ in parts]),
+            np.concatenate([indices + offset for (_, _, indices), offset in zip(parts, offsets)]))
+
+
+def _double_sided(parts: _Parts) -> _Parts:
+    """Add a back face with flipped normals and winding"""
+    vertices, normals, indices = parts
+    return _merge([parts, (vertices, -normals, indices[:, ::-1])])
+
+
+def _rotate_upright(parts: _Parts) -> _Parts:
+    """Stand a shape built on the ground plane up: its z axis becomes y"""
+    vertices, normals, indices = parts
+    # Rotation of -90° about x: (x, y, z) -> (x, z, -y)
+    flip = np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]], dtype=np.float64)
+    return vertices @ flip, normals @ flip, indices
+
+
+def _uv_sphere(rings: int, segments: int, radius: float = 1.0,
+               center: Sequence[float] = (0.0, 0.0, 0.0)) -> _Parts:
+    theta = np.linspace(0.0, math.pi, rings + 1)[:, None]
+    phi = np.linspace(0.0, 2 * math.pi, segments + 1)[None, :]
+    normals = np.stack(np.broadcast_arrays(np.sin(theta) * np.cos(phi),
+                                           np.cos(theta),
+                                           -np.sin(theta) * np.sin(phi)), axis=-1).reshape(-1, 3)
+    indices = _grid_indices(rings, segments)
+    # Drop the triangles that collapse onto the poles
+    keep = np.ones(len(indices), dtype=bool)
+    keep[:segments] = False
+    keep[-segments:] = False
+    return normals * radius + np.asarray(center), normals, indices[keep][:, ::-1]
+
+
+def _torus(rings: int, segments: int, radius: float, tube: float) -> _Parts:
+    u = np.linspace(0.0, 2 * math.pi, segments + 1)[None, :]
+    v = np.linspace(0.0, 2 * math.pi, rings + 1)[:, None]
+    normals = np.stack(np.broadcast_arrays(np.cos(v) * np.cos(u),
+                                           np.sin(v),
+                                           -np.cos(v) * np.sin(u)), axis=-1).reshape(-1, 3)
+    centers = np.stack(np.broadcast_arrays(np.cos(u), 0.0 * v, -np.sin(u)),
+                       axis=-1).reshape(-1, 3)
+    return centers * radius + normals * tube, normals, _grid_indices(rings, segments)
+
+
+def _cylinder(segments: int, radius: float, y0: float, y1: float) -> _Parts:
+    phi = np.linspace(0.0, 2 * math.pi, segments + 1)
+    ring = np.stack([np.cos(phi), np.zeros_like(phi), -np.sin(phi)], axis=1)
+    side = (np.concatenate([ring * radius + [0.0, y1, 0.0], ring * radius + [0.0, y0, 0.0]]),
+            np.concatenate([ring, ring]),
+            _grid_indices(1, segments)[:, ::-1])
+    outline = np.stack([np.cos(phi[:-1]), -np.sin(phi[:-1])], axis=1) * radius
+    return _merge([side, _prism(outline, y0, y1, sides=False)])
+
+
+def _prism(outline: np.ndarray, y0: float, y1: float, sides: bool = True) -> _Parts:
+    """Extrude a star-shaped ground-plane outline (K×2 x, z, counter-clockwise
+    seen from above) from y0 to y1, with flat-shaded caps and sides"""
+    k = len(outline)
+    x, z = outline[:, 0], outline[:, 1]
+    parts = []
+    for y, up in ((y1, 1.0), (y0, -1.0)):
+        cap = np.zeros((k + 1, 3))
+        cap[1:, 0], cap[1:, 1], cap[1:, 2] = x, y, z
+        cap[0, 1] = y
+        normal = np.tile([0.0, up, 0.0], (k + 1, 1))
+        rim = np.arange(1, k + 1)
+        fan = np.stack([np.zeros(k, dtype=np.int64), rim, np.roll(rim, -1)], axis=1)
+        # The outline runs counter-clockwise seen from above; reverse the
+        # bottom cap so it faces down
+        parts.append((cap, normal, fan if up > 0 else fan[:, ::-1]))
+    if sides:
+        nx, nz = np.roll(x, -1), np.roll(z, -1)
+        edge = np.stack([nx - x, nz - z], axis=1)
+        outward = np.stack([-edge[:, 1], edge[:, 0]], axis=1)
+        outward /= np.linalg.norm(outward, axis=1, keepdims=True)
+        quads = np.stack([np.stack([x, np.full(k, y1), z], axis=1),
+                          np.stack([nx, np.full(k, y1), nz], axis=1),
+                          np.stack([nx, np.full(k, y0), nz], axis=1),
+                          np.stack([x, np.full(k, y0), z], axis=1)], axis=1).reshape(-1, 3)
+        normal = np.repeat(np.stack([outward[:, 0], np.zeros(k), outward[:, 1]], axis=1), 4, axis=0)
+        base = (np.arange(k) * 4)[:, None]
+        indices = np.concatenate([base + [0, 1, 2], base + [0, 2, 3]])
+        parts.append((quads, normal, indices[:, ::-1]))
+    return _merge(parts)
+
+
+def _polygon(sides: int, radius: float, rotation: float = 0.0) -> np.ndarray:
+    angle = rotation + np.arange(sides) * (2 * math.pi / sides)
+    return np.stack([np.cos(angle), -np.sin(angle)], axis=1) * radius
+
+
+def _ribbon(path: np.ndarray, side: np.ndarray, width: float) -> _Parts:
+    """Double-sided strip of width along a path, spread along side vectors"""
+    tangent = np.gradient(path, axis=0)
+    offset = side / np.linalg.norm(side, axis=-1, keepdims=True) * (width / 2)
+    offset = np.broadcast_to(offset, path.shape)
+    normal = np.cross(offset, tangent)
+    normal /= np.linalg.norm(normal, axis=1, keepdims=True)
+    vertices = np.concatenate([path + offset, path - offset])
+    normals = np.concatenate([normal, normal])
+    # Rows are the two edges, columns the path samples
+    return _double_sided((vertices, normals, _grid_indices(1, len(path) - 1)))
+
+
+def _triangle(lod: int, up: bool) -> _Parts:
+    outline = _polygon(3, 1.0, math.pi / 2 if up else -math.pi / 2)
+    return _rotate_upright(_prism(outline, -0.1, 0.1))
+
+
+def _circle(lod: int) -> _Parts:
+    segments = _segments(lod, 8)
+    return _torus(max(4, segments // 4), segments, 0.9, 0.1)
+
+
+def _spiral(lod: int) -> _Parts:
+    # Golden spiral: the radius grows by phi every quarter turn
+    samples = 3 * _segments(lod, 8)
+    theta = np.linspace(0.0, 3 * math.pi, samples)
+    growth = math.log((1 + math.sqrt(5)) / 2) / (math.pi / 2)
+    r = np.exp(growth * (theta - 3 * math.pi))
+    path = np.stack([r * np.cos(theta), np.zeros_like(theta), -r * np.sin(theta)], axis=1)
+    return _ribbon(path, np.array([0.0, 1.0, 0.0]), 0.2)
+
+
+def _hexagon(lod: int) -> _Parts:
+    return _prism(_polygon(6, 1.0), -0.1, 0.1)
+
+
+def _mandala(lod: int) -> _Parts:
+    # Eight-petalled rosette plate
+    points = _segments(lod, 16) * 2
+    angle = np.arange(points) * (2 * math.pi / points)
+    r = 0.75 + 0.25 * np.cos(8 * angle)
+    outline = np.stack([r * np.cos(angle), -r * np.sin(angle)], axis=1)
+    return _prism(outline, -0.05, 0.05)
+
+
+# Star positions for constellation: a seven-star asterism in the x/y plane
+_STARS = np.array([[-0.9, 0.35, 0.0], [-0.55, 0.45, 0.0], [-0.2, 0.3, 0.0], [0.1, 0.1, 0.0],
+                   [0.2, -0.4, 0.0], [0.85, -0.35, 0.0], [0.75, 0.1, 0.0]])
+
+
+def _constellation(lod: int) -> _Parts:
+    segments = _segments(lod, 12) // 2
+    rings = max(3, segments // 2)
+    return _merge([_uv_sphere(rings, segments, 0.08, star) for star in _STARS])
+
+
+def _mirror_plane(lod: int) -> _Parts:
+    vertices = np.array([[-1.0, -1.0, 0.0], [1.0, -1.0, 0.0], [1.0, 1.0, 0.0], [-1.0, 1.0, 0.0]])
+    normals = np.tile([0.0, 0.0, 1.0], (4, 1))
+    return _double_sided((vertices, normals, np.array([[0, 1, 2], [0, 2, 3]])))
+
+
+def _sphere(lod: int) -> _Parts:
+    segments = _segments(lod, 8)
+    return _uv_sphere(max(4, segments // 2), segments)
+
+
+def _vertical_axis(lod: int) -> _Parts:
+    return _cylinder(_segments(lod, 12) // 2, 0.05, -1.0, 1.0)
+
+
+def _flowing_curve(lod: int) -> _Parts:
+    samples = 2 * _segments(lod, 8)
+    x = np.linspace(-1.0, 1.0, samples)
+    path = np.stack([x, 0.3 * np.sin(2 * math.pi * x), 0.2 * np.sin(math.pi * x)], axis=1)
+    return _ribbon(path, np.array([0.0, 0.0, 1.0]), 0.15)
+
+
+MESH_BUILDERS: Dict[str, Callable[[int], _Parts]] = {
+    "triangle_upward": lambda lod: _triangle(lod, True),
+    "triangle_downward": lambda lod: _triangle(lod, False),
+    "circle": _circle,
+    "spiral": _spiral,
+    "hexagon": _hexagon,
+    "mandala": _mandala,
+    "constellation": _constellation,
+    "mirror_plane": _mirror_plane,
+    "sphere": _sphere,
+    "vertical_axis": _vertical_axis,
+    "flowing_curve": _flowing_curve
+}
+
+# Unknown geometry types render as a sphere, as they render white
+FALLBACK_GEOMETRY = "sphere"
+
+
+def generate_mesh(geometry_type: str, lod: int = 0, scale: float = 1.0) -> Mesh:
+    """Build the mesh for a geometry type (uncached)"""
+    if not 0 <= lod < LOD_LEVELS:
+        raise ValueError(f"lod must be between 0 and {LOD_LEVELS - 1}")
+    builder = MESH_BUILDERS.get(geometry_type, MESH_BUILDERS[FALLBACK_GEOMETRY])
+    vertices, normals, indices = builder(lod)
+    return Mesh(geometry_type, lod, float(scale),
+                np.ascontiguousarray(vertices * scale, dtype=np.float32),
+                np.ascontiguousarray(normals, dtype=np.float32),
+                np.ascontiguousarray(indices, dtype=np.uint32))
+
+
+class MeshGenerator:
+    """Memoizing mesh source with a bounded LRU cache
+    
+    Scaled meshes are derived from the cached scale 1 mesh of the same
+    type and LOD, so a new scale costs one multiply, not a rebuild.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int, float], Mesh]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _get(self, key: Tuple[str, int, float]) -> Optional[Mesh]:
+        with self._lock:
+            mesh = self._entries.get(key)
+            if mesh is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return mesh
+    
+    def _put(self, key: Tuple[str, int, float], mesh: Mesh):
+        for array in (mesh.vertices, mesh.normals, mesh.indices):
+            array.setflags(write=False)
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = mesh
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def mesh(self, geometry_type: str, lod: int = 0, scale: float = 1.0) -> Mesh:
+        """Mesh for (geometry_type, lod, scale), built on first request"""
+        key = (geometry_type, lod, float(scale))
+        mesh = self._get(key)
+        if mesh is not None:
+            return mesh
+        if key[2] == 1.0:
+            mesh = generate_mesh(geometry_type, lod)
+        else:
+            base = self.mesh(geometry_type, lod)
+            mesh = Mesh(geometry_type, lod, key[2], base.vertices * np.float32(key[2]),
+                        base.normals, base.indices)
+        self._put(key, mesh)
+        return mesh
+    
+    def lod_chain(self, geometry_type: str, scale: float = 1.0) -> List[Mesh]:
+        """Meshes for every LOD level, most detailed first (for a Unity LODGroup)"""
+        return [self.mesh(geometry_type, lod, scale) for lod in range(LOD_LEVELS)]
+    
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by exporters unless they are given their own
+MESH_GENERATOR = MeshGenerator()
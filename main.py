@@ -7,41 +7,130 @@ Demonstrates cohabitational architecture where:
 - Sacred Infrastructure (FIELD backend)
 
 All exist simultaneously, not as replacements.
+
+Run without arguments for the full demonstration, or pick one command:
+    
+    python main.py export-unity [-o unity_config.json] [--stream] [--compact] [--gzip] [--instanced]
+    python main.py export-glb [field_01 ...] [-d glb] [--lod 0]
+    python main.py export-field [-o field_config.json]
+    python main.py export-arch [-o architecture.json]
+    python main.py discover field_01 [field_05 ...]
+    python main.py overview
+
+Add --metrics (before the command) to serve Prometheus metrics for the
+bridge and MCP client on the metrics service port while the command runs.
+
+Subsystems (and their imports: numpy, aiohttp) are only loaded by the
+commands that use them, so single exports start quickly.
 """
 
+import argparse
+import gzip
 import json
-from typing import Dict, List
-from architecture import Architecture, Layer, Epoch
-from field_backend import FIELDConfig, MCPClient, MediaStorage, create_field_config
-from unity_ar import UnityARBridge, GeometryRenderer
+import os
+import sys
+from typing import List, Optional
+
+
+def _open_output(output_path: str, compress: bool = False):
+    """Open a text output file, gzip-compressed if requested"""
+    if compress:
+        return gzip.open(output_path, "wt", encoding="utf-8")
+    return open(output_path, "w")
 
 
 class DaysOfFuturePast:
     """Main application class for the AR discovery system"""
     
-    def __init__(self):
-        """Initialize the three-layer system"""
+    def __init__(self, catalog_path: str = None, quiet: bool = False):
+        """Initialize the three-layer system
+        
+        catalog_path: optional field catalog file to load fields from
+        quiet: skip the start-up banner
+        
+        Metrics are off until enable_metrics() is called.
+        
+        Each layer is built on first access, so callers only pay for the
+        subsystems they use.
+        """
+        self.catalog_path = catalog_path
+        self._architecture = None
+        self._field_config = None
+        self._mcp_client = None
+        self._media_storage = None
+        self._unity_bridge = None
+        self.metrics = None
+        self.metrics_server = None
+        
+        if quiet:
+            return
         print("Initializing Days of Future Past AR Discovery System...")
         print("Philosophy: Story=OS, geometry=grammar")
         print("Architecture: Cohabitational layers (simultaneous existence)\n")
+    
+    def enable_metrics(self, port: Optional[int] = None):
+        """Record bridge and MCP client metrics and serve them over HTTP
         
-        # Initialize architecture
-        self.architecture = Architecture()
-        
-        # Initialize FIELD backend
-        self.field_config = FIELDConfig()
-        self.mcp_client = MCPClient(self.field_config)
-        self.media_storage = MediaStorage()
-        
-        # Initialize Unity AR bridge
-        self.unity_bridge = UnityARBridge()
+        Starts the FIELD "metrics" service (localhost, its configured port
+        unless port is given). Call it before the bridge or MCP client is
+        first used; they are built with the registry.
+        """
+        from metrics import MetricsRegistry, MetricsServer
         
-        print("✓ Physical Reality layer (Melbourne) initialized")
-        print("✓ Digital Overlay layer (Unity AR) initialized")
-        print("✓ Sacred Infrastructure layer (FIELD backend) initialized\n")
+        service = self.field_config.services["metrics"]
+        if port is not None:
+            service["port"] = port
+        service["enabled"] = True
+        self.metrics = MetricsRegistry()
+        self.metrics_server = MetricsServer(self.metrics, service["port"]).start()
+        service["port"] = self.metrics_server.port
+        return self.metrics_server
+    
+    def close(self):
+        """Stop the metrics endpoint, if running"""
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+    
+    @property
+    def architecture(self):
+        if self._architecture is None:
+            from architecture import Architecture
+            self._architecture = Architecture(self.catalog_path)
+        return self._architecture
+    
+    @property
+    def field_config(self):
+        if self._field_config is None:
+            from field_backend import FIELDConfig
+            self._field_config = FIELDConfig()
+        return self._field_config
+    
+    @property
+    def mcp_client(self):
+        if self._mcp_client is None:
+            from field_backend import MCPClient
+            self._mcp_client = MCPClient(self.field_config, metrics=self.metrics)
+        return self._mcp_client
+    
+    @property
+    def media_storage(self):
+        if self._media_storage is None:
+            from field_backend import MediaStorage
+            self._media_storage = MediaStorage()
+        return self._media_storage
+    
+    @property
+    def unity_bridge(self):
+        if self._unity_bridge is None:
+            from unity_ar import UnityARBridge
+            self._unity_bridge = UnityARBridge(metrics=self.metrics)
+        return self._unity_bridge
     
     def display_system_overview(self):
         """Display complete system overview"""
+        from architecture import Epoch, Layer
+        
         print("=" * 80)
         print("DAYS OF FUTURE PAST - AR DISCOVERY SYSTEM")
         print("=" * 80)
@@ -81,23 +170,75 @@ class DaysOfFuturePast:
         
         print("\n" + "=" * 80)
     
-    def generate_field_ar_scenes(self):
-        """Generate AR scenes for all fields"""
+    def generate_field_ar_scenes(self, parallel: bool = False, workers: int = None,
+                                 chunk_size: int = None, executor: str = "auto",
+                                 incremental: bool = False):
+        """Generate AR scenes for all fields
+        
+        parallel: fan scene creation out over a worker pool
+        workers / chunk_size / executor: pool settings, see
+            UnityARBridge.create_field_scenes
+        incremental: only rebuild scenes whose field content changed
+        """
         print("\nGenerating Unity AR scenes for all fields...")
         print("-" * 80)
         
         scenes = {}
-        for field in self.architecture.fields:
-            scene = self.unity_bridge.create_field_scene(field.to_dict())
-            scenes[field.id] = scene
-            print(f"✓ Generated AR scene for {field.name}")
+        if incremental:
+            rebuilt = set(self.unity_bridge.rebuild_changed(
+                [field.to_dict() for field in self.architecture.fields]
+            ))
+            for field in self.architecture.fields:
+                scenes[field.id] = self.unity_bridge.get_scene(field.id)
+                if field.id in rebuilt:
+                    print(f"✓ Generated AR scene for {field.name}")
+            print(f"\nScenes rebuilt: {len(rebuilt)} "
+                  f"(unchanged: {len(scenes) - len(rebuilt)})")
+        elif parallel:
+            fields = self.architecture.fields
+            generated = self.unity_bridge.create_field_scenes(
+                [field.to_dict() for field in fields],
+                workers=workers,
+                chunk_size=chunk_size,
+                executor=executor
+            )
+            for field, scene in zip(fields, generated):
+                scenes[field.id] = scene
+                print(f"✓ Generated AR scene for {field.name}")
+        else:
+            for field in self.architecture.fields:
+                scene = self.unity_bridge.create_field_scene(field.to_dict())
+                scenes[field.id] = scene
+                print(f"✓ Generated AR scene for {field.name}")
         
         print(f"\nTotal scenes created: {len(scenes)}")
         return scenes
     
-    def export_unity_configuration(self, output_path: str = "unity_config.json"):
-        """Export Unity AR configuration"""
+    def export_unity_configuration(self, output_path: str = "unity_config.json",
+                                   stream: bool = False, compact: bool = False,
+                                   compress: bool = False, instanced: bool = False):
+        """Export Unity AR configuration
+        
+        stream: write each scene as soon as it is exported instead of
+            building the whole config in memory (returns a summary dict)
+        compact: omit indentation and whitespace
+        compress: gzip the output file
+        instanced: export scenes as per-prefab instance batches
+            (UnityARBridge.export_instanced)
+        """
         print(f"\nExporting Unity AR configuration to {output_path}...")
+        export_scene = (self.unity_bridge.export_instanced if instanced
+                        else self.unity_bridge.export_for_unity)
+        
+        if stream:
+            scene_count = self._stream_unity_configuration(output_path, compact, compress,
+                                                           export_scene)
+            print(f"✓ Unity configuration streamed successfully ({scene_count} scenes)")
+            return {
+                "project_name": "Days of Future Past AR",
+                "scene_count": scene_count,
+                "output_path": output_path
+            }
         
         config = {
             "project_name": "Days of Future Past AR",
@@ -105,18 +246,54 @@ class DaysOfFuturePast:
         }
         
         for field in self.architecture.fields:
-            scene_config = self.unity_bridge.export_for_unity(field.id)
+            scene_config = export_scene(field.id)
             if scene_config:
                 config["scenes"].append(scene_config)
         
-        with open(output_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        with _open_output(output_path, compress) as f:
+            if compact:
+                json.dump(config, f, separators=(",", ":"))
+            else:
+                json.dump(config, f, indent=2)
         
         print(f"✓ Unity configuration exported successfully")
         return config
     
+    def _stream_unity_configuration(self, output_path: str, compact: bool,
+                                    compress: bool, export_scene) -> int:
+        """Write the Unity config one scene at a time; output matches json.dump"""
+        if compact:
+            head = '{"project_name":%s,"scenes":[' % json.dumps("Days of Future Past AR")
+            separator, tail = ",", "]}"
+        else:
+            head = '{\n  "project_name": %s,\n  "scenes": [' % json.dumps("Days of Future Past AR")
+            separator, tail = ",", "\n  ]\n}"
+        
+        scene_count = 0
+        with _open_output(output_path, compress) as f:
+            f.write(head)
+            for field in self.architecture.fields:
+                scene_config = export_scene(field.id)
+                if not scene_config:
+                    continue
+                if scene_count:
+                    f.write(separator)
+                if compact:
+                    f.write(json.dumps(scene_config, separators=(",", ":")))
+                else:
+                    body = json.dumps(scene_config, indent=2)
+                    f.write("\n    " + body.replace("\n", "\n    "))
+                scene_count += 1
+            if scene_count or compact:
+                f.write(tail)
+            else:
+                f.write("]\n}")
+        return scene_count
+    
     def export_field_backend_config(self, output_path: str = "field_config.json"):
         """Export FIELD backend configuration"""
+        from field_backend import create_field_config
+        
         print(f"\nExporting FIELD backend configuration to {output_path}...")
         
         config = create_field_config()
@@ -143,16 +320,14 @@ class DaysOfFuturePast:
     
     def demonstrate_field_discovery(self, field_id: str):
         """Demonstrate discovering a specific field"""
+        from unity_ar import GeometryRenderer
+        
         print(f"\n{'='*80}")
         print(f"FIELD DISCOVERY DEMONSTRATION: {field_id}")
         print(f"{'='*80}")
         
         # Find the field
-        field = None
-        for f in self.architecture.fields:
-            if f.id == field_id:
-                field = f
-                break
+        field = self.architecture.get_field(field_id)
         
         if not field:
             print(f"Field {field_id} not found")
@@ -182,10 +357,11 @@ class DaysOfFuturePast:
         print(f"\n{'='*80}")
 
 
-def main():
-    """Main entry point"""
+def run_all(catalog_path: str = None, app: Optional[DaysOfFuturePast] = None):
+    """Full demonstration: overview, scenes, every export and discovery"""
     # Initialize system
-    app = DaysOfFuturePast()
+    if app is None:
+        app = DaysOfFuturePast(catalog_path)
     
     # Display overview
     app.display_system_overview()
@@ -215,5 +391,119 @@ def main():
     print("="*80 + "\n")
 
 
+def _cmd_overview(app: DaysOfFuturePast, args):
+    app.display_system_overview()
+
+
+def _cmd_export_unity(app: DaysOfFuturePast, args):
+    app.generate_field_ar_scenes(parallel=args.parallel, workers=args.workers)
+    app.export_unity_configuration(args.output, stream=args.stream,
+                                   compact=args.compact, compress=args.gzip,
+                                   instanced=args.instanced)
+
+
+def _cmd_export_glb(app: DaysOfFuturePast, args):
+    os.makedirs(args.directory, exist_ok=True)
+    bridge = app.unity_bridge
+    field_ids = args.field_ids or [field.id for field in app.architecture.fields]
+    files = written = 0
+    for field_id in field_ids:
+        field = app.architecture.get_field(field_id)
+        if field is None:
+            print(f"Field {field_id} not found")
+            continue
+        bridge.create_field_scene(field.to_dict())
+        written += bridge.write_glb(field_id, os.path.join(args.directory, f"{field_id}.glb"),
+                                    lod=args.lod)
+        files += 1
+    print(f"✓ Wrote {files} GLB scenes to {args.directory} ({written / 1024:.1f} KB)")
+
+
+def _cmd_export_field(app: DaysOfFuturePast, args):
+    app.export_field_backend_config(args.output)
+
+
+def _cmd_export_arch(app: DaysOfFuturePast, args):
+    app.export_full_architecture(args.output)
+
+
+def _cmd_discover(app: DaysOfFuturePast, args):
+    for field_id in args.field_ids:
+        field = app.architecture.get_field(field_id)
+        if field is not None:
+            # Only the requested scenes are built
+            app.unity_bridge.create_field_scene(field.to_dict())
+        app.demonstrate_field_discovery(field_id)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Days of Future Past AR discovery system. "
+                    "Without a command, runs the full demonstration."
+    )
+    parser.add_argument("--catalog", default=None,
+                        help="field catalog file to load fields from")
+    parser.add_argument("--metrics", action="store_true",
+                        help="serve Prometheus metrics on localhost while running")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="port for --metrics (default: the metrics service port, 8005)")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    
+    overview = commands.add_parser("overview", help="print layers, characters and fields")
+    overview.set_defaults(handler=_cmd_overview)
+    
+    export_unity = commands.add_parser("export-unity", help="build scenes and write the Unity config")
+    export_unity.add_argument("-o", "--output", default="unity_config.json")
+    export_unity.add_argument("--stream", action="store_true",
+                              help="write scenes one at a time")
+    export_unity.add_argument("--compact", action="store_true", help="no indentation")
+    export_unity.add_argument("--gzip", action="store_true", help="gzip the output")
+    export_unity.add_argument("--instanced", action="store_true",
+                              help="group markers into per-prefab instance batches")
+    export_unity.add_argument("--parallel", action="store_true",
+                              help="build scenes on a worker pool")
+    export_unity.add_argument("--workers", type=int, default=None)
+    export_unity.set_defaults(handler=_cmd_export_unity)
+    
+    export_glb = commands.add_parser("export-glb", help="write one binary glTF file per field")
+    export_glb.add_argument("field_ids", nargs="*", metavar="field_id",
+                            help="fields to export (default: all)")
+    export_glb.add_argument("-d", "--directory", default="glb")
+    export_glb.add_argument("--lod", type=int, default=0, choices=range(4),
+                            help="mesh detail, 0 (most detailed) to 3")
+    export_glb.set_defaults(handler=_cmd_export_glb)
+    
+    export_field = commands.add_parser("export-field", help="write the FIELD backend config")
+    export_field.add_argument("-o", "--output", default="field_config.json")
+    export_field.set_defaults(handler=_cmd_export_field)
+    
+    export_arch = commands.add_parser("export-arch", help="write the complete architecture")
+    export_arch.add_argument("-o", "--output", default="architecture.json")
+    export_arch.set_defaults(handler=_cmd_export_arch)
+    
+    discover = commands.add_parser("discover", help="show one or more fields and their AR scenes")
+    discover.add_argument("field_ids", nargs="+", metavar="field_id")
+    discover.set_defaults(handler=_cmd_discover)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    args = build_parser().parse_args(argv)
+    app = DaysOfFuturePast(args.catalog, quiet=args.command is not None)
+    if args.metrics:
+        server = app.enable_metrics(args.metrics_port)
+        print(f"Metrics: http://{server.host}:{server.port}/metrics")
+    try:
+        if args.command is None:
+            run_all(app=app)
+        else:
+            args.handler(app, args)
+    finally:
+        app.close()
+    return 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
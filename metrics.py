@@ -0,0 +1,345 @@
+"""
+Metrics
+
+Lightweight counters, gauges and latency histograms for the AR bridge and
+the MCP client, exported in the Prometheus text format from a local HTTP
+endpoint. Components take an optional registry; without one they skip
+instrumentation entirely, so disabled metrics cost a single None check.
+"""
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+import math
+import threading
+import weakref
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+# Seconds; spans sub-millisecond scene builds up to slow DOJO calls
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str],
+                   extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base for named metrics with optional labels"""
+    
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        self._function: Optional[Callable[[], float]] = None
+        # owner -> read(owner) for gauges summed over live owners (see Gauge.track)
+        self._owners: Optional["weakref.WeakKeyDictionary"] = None
+    
+    def _new_child(self):
+        raise NotImplementedError
+    
+    def labels(self, *values, **kwargs):
+        """Child metric for one combination of label values"""
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+    
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels; use .labels(...)")
+        return self.labels()
+    
+    def set_function(self, function: Callable[[], float]):
+        """Read the value from function at scrape time instead of storing it"""
+        if self.labelnames:
+            raise ValueError("callback metrics cannot have labels")
+        if self._owners is not None:
+            raise ValueError(f"{self.name} already sums tracked owners")
+        self._function = function
+    
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """(suffix, label string, value) rows for exposition"""
+        if self._function is not None:
+            return [("", "", self._function())]
+        if self._owners is not None:
+            return [("", "", sum(read(owner) for owner, read in list(self._owners.items())))]
+        rows = []
+        for key, child in sorted(self._children.items()):
+            rows.extend(self._child_samples(key, child))
+        return rows
+    
+    def _child_samples(self, key, child) -> List[Tuple[str, str, float]]:
+        return [("", _format_labels(self.labelnames, key), child.value)]
+    
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}",
+                 f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class _CounterValue:
+    __slots__ = ("value", "_lock")
+    
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1):
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue:
+    __slots__ = ("value", "_lock")
+    
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+    
+    def set(self, value: float):
+        self.value = value
+    
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+    
+    def dec(self, amount: float = 1):
+        with self._lock:
+            self.value -= amount
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+    
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    
+    kind = "counter"
+    
+    def _new_child(self):
+        return _CounterValue()
+    
+    def inc(self, amount: float = 1):
+        self._unlabelled().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    
+    kind = "gauge"
+    
+    def _new_child(self):
+        return _GaugeValue()
+    
+    def set(self, value: float):
+        self._unlabelled().set(value)
+    
+    def inc(self, amount: float = 1):
+        self._unlabelled().inc(amount)
+    
+    def dec(self, amount: float = 1):
+        self._unlabelled().dec(amount)
+    
+    def track(self, owner: object, read: Callable[[object], float]):
+        """Add read(owner) to the value at scrape time, for as long as owner lives
+        
+        Owners are held weakly, so several bridges or clients can share
+        one registry without keeping each other alive. read must take the
+        owner as its argument rather than closing over it. Only gauges can
+        be tracked: a counter summed this way would drop when an owner is
+        collected, which Prometheus reads as a reset.
+        """
+        if self.labelnames:
+            raise ValueError("callback metrics cannot have labels")
+        with self._lock:
+            if self._function is not None:
+                raise ValueError(f"{self.name} already has a callback")
+            if self._owners is None:
+                self._owners = weakref.WeakKeyDictionary()
+            self._owners[owner] = read
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets"""
+    
+    kind = "histogram"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != math.inf))
+    
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+    
+    def observe(self, value: float):
+        self._unlabelled().observe(value)
+    
+    def set_function(self, function: Callable[[], float]):
+        raise TypeError("histograms cannot be callback metrics")
+    
+    def _child_samples(self, key, child) -> List[Tuple[str, str, float]]:
+        rows = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), child.counts):
+            cumulative += count
+            rows.append(("_bucket",
+                         _format_labels(self.labelnames, key, ("le", _format_value(bound))),
+                         cumulative))
+        labels = _format_labels(self.labelnames, key)
+        rows.append(("_sum", labels, child.sum))
+        rows.append(("_count", labels, child.count))
+        return rows
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together
+    
+    Asking for an existing name returns the registered metric, so several
+    bridges or clients can share one registry: their histograms and
+    counters add up, and their tracked gauges report the sum over live
+    instances.
+    """
+    
+    def __init__(self, namespace: str = "dfp"):
+        self.namespace = namespace
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, metric_class, name: str, documentation: str,
+                  labelnames: Sequence[str], **kwargs) -> _Metric:
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = metric_class(full_name, documentation, labelnames, **kwargs)
+                self._metrics[full_name] = metric
+            elif not isinstance(metric, metric_class) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"metric {full_name} already registered differently")
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+    
+    def get(self, name: str) -> Optional[_Metric]:
+        """Metric by full name (including namespace), or None"""
+        return self._metrics.get(name)
+    
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+class MetricsServer:
+    """Serves a registry's /metrics over HTTP on a background thread"""
+    
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = "127.0.0.1"):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional["ThreadingHTTPServer"] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> "MetricsServer":
+        # http.server pulls in the email package; only pay for it when serving
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        registry = self.registry
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="metrics-server", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+    
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,439 @@
+"""
+Narrative Graph
+
+Relationship graph over Worldbuilding/NarrativeOntology.csv. Each row is a
+FIELD Bit; its RelatedIDs become directed edges. Ids are interned to ints
+and edges stored as CSR arrays (indptr/indices), so traversals expand a
+whole frontier at once with numpy instead of walking Python objects.
+
+The CSV is streamed row by row; only the interned columns and the edge
+list are kept, which keeps multi-million-row ontologies loadable.
+"""
+
+from array import array
+from itertools import compress, islice, repeat
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+import csv
+import gc
+import os
+
+import numpy as np
+
+
+DEFAULT_ONTOLOGY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     "Worldbuilding", "NarrativeOntology.csv")
+
+# Interned value for ids referenced in RelatedIDs but never defined as a row
+UNDEFINED = ""
+
+
+class _Interner:
+    """Assigns dense ints to strings in first-seen order"""
+    
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+    
+    def __call__(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+    
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _csr(sources: np.ndarray, targets: np.ndarray, node_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """indptr/indices for deduplicated edges, neighbors in ascending id order"""
+    if len(sources):
+        keys = np.sort(sources.astype(np.int64) * node_count + targets)
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        sources = (keys // node_count).astype(np.int32)
+        targets = (keys % node_count).astype(np.int32)
+    indptr = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=node_count), out=indptr[1:])
+    return indptr, targets.astype(np.int32, copy=False)
+
+
+class NarrativeGraph:
+    """Directed graph of FIELD Bits built from the narrative ontology
+    
+    Queries take and return Bit ids. Traversal filters (bit_types,
+    statuses) restrict which Bits may be entered; the start is always
+    included.
+    """
+    
+    def __init__(self, ids: List[str], names: List[str], bit_types: _Interner,
+                 bit_type_codes: np.ndarray, statuses: _Interner, status_codes: np.ndarray,
+                 epochs: _Interner, epoch_codes: np.ndarray, locations: List[str],
+                 sources: np.ndarray, targets: np.ndarray,
+                 descriptions: Optional[List[str]] = None,
+                 index: Optional[Dict[str, int]] = None,
+                 defined_count: Optional[int] = None):
+        self.ids = ids
+        # Bits with their own row come first; the rest are RelatedIDs references
+        self.defined_count = len(ids) if defined_count is None else defined_count
+        self.index: Dict[str, int] = index if index is not None else {
+            bit_id: i for i, bit_id in enumerate(ids)}
+        self.names = names
+        self.locations = locations
+        self.descriptions = descriptions
+        self._bit_types = bit_types
+        self._statuses = statuses
+        self._epochs = epochs
+        self.bit_type_codes = bit_type_codes
+        self.status_codes = status_codes
+        self.epoch_codes = epoch_codes
+        self.indptr, self.indices = _csr(sources, targets, len(ids))
+        self._reverse: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, bit_id: str) -> bool:
+        return bit_id in self.index
+    
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+    
+    def _node(self, bit_id: str) -> int:
+        node = self.index.get(bit_id)
+        if node is None:
+            raise KeyError(f"Unknown Bit id: {bit_id}")
+        return node
+    
+    def get(self, bit_id: str) -> Optional[Dict]:
+        """Row data for a Bit, or None"""
+        node = self.index.get(bit_id)
+        if node is None:
+            return None
+        data = {
+            "id": bit_id,
+            "name": self.names[node],
+            "bit_type": self._bit_types.values[self.bit_type_codes[node]],
+            "location": self.locations[node],
+            "epoch": self._epochs.values[self.epoch_codes[node]],
+            "related_ids": self.neighbors(bit_id),
+            "status": self._statuses.values[self.status_codes[node]]
+        }
+        if self.descriptions is not None:
+            data["description"] = self.descriptions[node]
+        return data
+    
+    def is_defined(self, bit_id: str) -> bool:
+        """Whether a Bit has its own row (not just a RelatedIDs reference)"""
+        node = self.index.get(bit_id)
+        return node is not None and node < self.defined_count
+    
+    def neighbors(self, bit_id: str) -> List[str]:
+        """Bits this Bit relates to"""
+        node = self._node(bit_id)
+        return [self.ids[i] for i in self.indices[self.indptr[node]:self.indptr[node + 1]].tolist()]
+    
+    def predecessors(self, bit_id: str) -> List[str]:
+        """Bits that relate to this Bit"""
+        if self._reverse is None:
+            sources = np.repeat(np.arange(len(self.ids), dtype=np.int32), np.diff(self.indptr))
+            self._reverse = _csr(self.indices, sources, len(self.ids))
+        indptr, indices = self._reverse
+        node = self._node(bit_id)
+        return [self.ids[i] for i in indices[indptr[node]:indptr[node + 1]].tolist()]
+    
+    def _codes(self, interner: _Interner, values: Optional[Iterable[str]]) -> List[int]:
+        return [interner.codes[value] for value in values if value in interner.codes]
+    
+    def mask(self, bit_types: Optional[Iterable[str]] = None,
+             statuses: Optional[Iterable[str]] = None,
+             epochs: Optional[Iterable[str]] = None) -> np.ndarray:
+        """Boolean mask over nodes matching every given filter"""
+        selected = np.ones(len(self.ids), dtype=bool)
+        for codes, interner, values in ((self.bit_type_codes, self._bit_types, bit_types),
+                                        (self.status_codes, self._statuses, statuses),
+                                        (self.epoch_codes, self._epochs, epochs)):
+            if values is not None:
+                selected &= np.isin(codes, self._codes(interner, values))
+        return selected
+    
+    def filter(self, bit_types: Optional[Iterable[str]] = None,
+               statuses: Optional[Iterable[str]] = None,
+               epochs: Optional[Iterable[str]] = None) -> List[str]:
+        """Ids of Bits matching BitType/Status/Epoch filters, in file order"""
+        return [self.ids[i] for i in np.flatnonzero(self.mask(bit_types, statuses, epochs)).tolist()]
+    
+    def _expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(source, target) pairs for every edge leaving the frontier"""
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return frontier[:0], self.indices[:0]
+        # Position of each edge: its node's start plus its rank within the node
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        return np.repeat(frontier, counts), self.indices[offsets]
+    
+    def _levels(self, start: str, max_depth: Optional[int], allowed: Optional[np.ndarray],
+                parents: Optional[np.ndarray] = None,
+                stop: Optional[int] = None) -> Iterator[np.ndarray]:
+        """Breadth-first frontiers (as node arrays), starting with [start]"""
+        root = self._node(start)
+        visited = np.zeros(len(self.ids), dtype=bool)
+        visited[root] = True
+        frontier = np.array([root], dtype=np.int32)
+        depth = 0
+        yield frontier
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            sources, targets = self._expand(frontier)
+            fresh = ~visited[targets]
+            if allowed is not None:
+                fresh &= allowed[targets]
+            sources, targets = sources[fresh], targets[fresh]
+            # Keep the first edge reaching each node, in discovery order
+            _, first = np.unique(targets, return_index=True)
+            first.sort()
+            frontier = targets[first]
+            if not len(frontier):
+                return
+            visited[frontier] = True
+            if parents is not None:
+                parents[frontier] = sources[first]
+            depth += 1
+            yield frontier
+            if stop is not None and visited[stop]:
+                return
+    
+    def bfs(self, start: str, max_depth: Optional[int] = None,
+            bit_types: Optional[Iterable[str]] = None,
+            statuses: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, int]]:
+        """(id, depth) in breadth-first order from start"""
+        allowed = None if bit_types is None and statuses is None else self.mask(bit_types, statuses)
+        for depth, frontier in enumerate(self._levels(start, max_depth, allowed)):
+            for node in frontier.tolist():
+                yield self.ids[node], depth
+    
+    def dfs(self, start: str, max_depth: Optional[int] = None,
+            bit_types: Optional[Iterable[str]] = None,
+            statuses: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, int]]:
+        """(id, depth) in depth-first preorder from start, neighbors in id order"""
+        allowed = None if bit_types is None and statuses is None else self.mask(bit_types, statuses)
+        visited = set()
+        stack = [(self._node(start), 0)]
+        indptr, indices = self.indptr, self.indices
+        while stack:
+            node, depth = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            yield self.ids[node], depth
+            if max_depth is not None and depth >= max_depth:
+                continue
+            neighbors = indices[indptr[node]:indptr[node + 1]]
+            if allowed is not None:
+                neighbors = neighbors[allowed[neighbors]]
+            # Reversed so the lowest neighbor is visited first
+            for neighbor in reversed(neighbors.tolist()):
+                if neighbor not in visited:
+                    stack.append((neighbor, depth + 1))
+    
+    def _reached(self, start: str, max_depth: Optional[int],
+                 bit_types: Optional[Iterable[str]],
+                 statuses: Optional[Iterable[str]]) -> List[str]:
+        allowed = None if bit_types is None and statuses is None else self.mask(bit_types, statuses)
+        levels = list(self._levels(start, max_depth, allowed))[1:]
+        if not levels:
+            return []
+        return [self.ids[node] for node in np.concatenate(levels).tolist()]
+    
+    def k_hop(self, start: str, k: int,
+              bit_types: Optional[Iterable[str]] = None,
+              statuses: Optional[Iterable[str]] = None) -> List[str]:
+        """Bits reachable from start in 1..k steps, nearest first"""
+        return self._reached(start, k, bit_types, statuses)
+    
+    def reachable(self, start: str, bit_types: Optional[Iterable[str]] = None,
+                  statuses: Optional[Iterable[str]] = None) -> List[str]:
+        """Every Bit reachable from start (e.g. what opens when T001 unlocks)"""
+        return self._reached(start, None, bit_types, statuses)
+    
+    def shortest_path(self, start: str, goal: str,
+                      bit_types: Optional[Iterable[str]] = None,
+                      statuses: Optional[Iterable[str]] = None) -> Optional[List[str]]:
+        """Fewest-hop path from start to goal (inclusive), or None"""
+        target = self._node(goal)
+        allowed = None if bit_types is None and statuses is None else self.mask(bit_types, statuses)
+        parents = np.full(len(self.ids), -1, dtype=np.int32)
+        root = self._node(start)
+        for _ in self._levels(start, None, allowed, parents, stop=target):
+            pass
+        if target != root and parents[target] < 0:
+            return None
+        path = [target]
+        while path[-1] != root:
+            path.append(int(parents[path[-1]]))
+        return [self.ids[node] for node in reversed(path)]
+
+
+# Rows parsed per batch; columns are transposed and interned a batch at a time
+CHUNK_ROWS = 65536
+
+
+def _intern_column(interner: _Interner, values: Iterable[str], codes: array):
+    values = list(map(str.strip, values))
+    for value in dict.fromkeys(values):
+        interner(value)
+    codes.extend(map(interner.codes.__getitem__, values))
+
+
+def _resolve_related(related: List[str], index: Dict[str, int],
+                     ids: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Edge arrays for each row's RelatedIDs, interning undefined references
+    
+    Each chunk's RelatedIDs are joined and split in one pass and looked
+    up with one map over the index; only references to undefined ids
+    (and blanks) are revisited in Python.
+    """
+    sources, targets = [], []
+    for offset in range(0, len(related), CHUNK_ROWS):
+        chunk = related[offset:offset + CHUNK_ROWS]
+        counts = np.fromiter(map(str.count, chunk, repeat(",")), dtype=np.int64,
+                             count=len(chunk)) + 1
+        parts = list(map(str.strip, ",".join(chunk).split(",")))
+        nodes = np.fromiter(map(index.get, parts, repeat(-1)), dtype=np.int64,
+                            count=len(parts))
+        for i in np.flatnonzero(nodes < 0).tolist():
+            part = parts[i]
+            if part:
+                # Referenced but never defined as a row
+                node = index.get(part)
+                if node is None:
+                    node = index[part] = len(ids)
+                    ids.append(part)
+                nodes[i] = node
+        present = nodes >= 0
+        sources.append(np.repeat(np.arange(offset, offset + len(chunk), dtype=np.int32),
+                                 counts)[present])
+        targets.append(nodes[present].astype(np.int32))
+    if not sources:
+        return np.zeros(0, np.int32), np.zeros(0, np.int32)
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+def load_ontology(source: Union[str, TextIO] = DEFAULT_ONTOLOGY_PATH,
+                  load_descriptions: bool = False) -> NarrativeGraph:
+    """Stream an ontology CSV into a NarrativeGraph
+    
+    source: path or open text file. Descriptions are skipped unless
+    load_descriptions is set, since they dominate the row size.
+    Defined Bits are numbered in file order; if an id appears on
+    several rows, the first row's attributes are kept and every row's
+    RelatedIDs are merged.
+    """
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8") as f:
+            return load_ontology(f, load_descriptions)
+    
+    # The loader only builds acyclic containers; pausing the cyclic GC
+    # avoids repeated full collections over millions of fresh rows
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _load_rows(csv.reader(source), load_descriptions)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _load_rows(reader: Iterator[List[str]], load_descriptions: bool) -> NarrativeGraph:
+    header = [column.strip() for column in next(reader, [])]
+    wanted = ["ID", "Name", "BitType", "Location", "Epoch", "RelatedIDs", "Status"]
+    if load_descriptions:
+        wanted.append("Description")
+    missing = [name for name in wanted if name not in header]
+    if missing:
+        raise ValueError(f"Ontology CSV is missing columns: {', '.join(missing)}")
+    columns = [header.index(name) for name in wanted]
+    width = max(columns) + 1
+    pick = itemgetter(*columns)
+    
+    row_ids: List[str] = []
+    names: List[str] = []
+    locations: List[str] = []
+    related: List[str] = []
+    descriptions: Optional[List[str]] = [] if load_descriptions else None
+    bit_types, statuses, epochs = _Interner(), _Interner(), _Interner()
+    type_codes, status_codes, epoch_codes = array("H"), array("H"), array("H")
+    
+    while True:
+        raw = list(islice(reader, CHUNK_ROWS))
+        if not raw:
+            break
+        try:
+            chunk = list(map(pick, raw))
+        except IndexError:
+            # Blank or short rows; only then filter row by row
+            chunk = [pick(row) for row in raw if len(row) >= width]
+            if not chunk:
+                continue
+        transposed = list(zip(*chunk))
+        chunk_ids = list(map(str.strip, transposed[0]))
+        if "" in chunk_ids:
+            chunk = [row for row, bit_id in zip(chunk, chunk_ids) if bit_id]
+            if not chunk:
+                continue
+            transposed = list(zip(*chunk))
+            chunk_ids = list(map(str.strip, transposed[0]))
+        row_ids.extend(chunk_ids)
+        names.extend(transposed[1])
+        _intern_column(bit_types, transposed[2], type_codes)
+        locations.extend(transposed[3])
+        _intern_column(epochs, transposed[4], epoch_codes)
+        related.extend(transposed[5])
+        _intern_column(statuses, transposed[6], status_codes)
+        if descriptions is not None:
+            descriptions.extend(transposed[7])
+    
+    index = dict(zip(row_ids, range(len(row_ids))))
+    if len(index) != len(row_ids):
+        # Duplicate ids: keep each id's first row, merge RelatedIDs into it
+        first: Dict[str, int] = {}
+        merged: Dict[int, List[str]] = {}
+        for row, bit_id in enumerate(row_ids):
+            node = first.setdefault(bit_id, row)
+            merged.setdefault(node, []).append(related[row])
+        keep = sorted(first.values())
+        row_ids = [row_ids[row] for row in keep]
+        names = [names[row] for row in keep]
+        locations = [locations[row] for row in keep]
+        related = [",".join(merged[row]) for row in keep]
+        if descriptions is not None:
+            descriptions = [descriptions[row] for row in keep]
+        type_codes = array("H", [type_codes[row] for row in keep])
+        status_codes = array("H", [status_codes[row] for row in keep])
+        epoch_codes = array("H", [epoch_codes[row] for row in keep])
+        index = dict(zip(row_ids, range(len(row_ids))))
+    
+    ids = row_ids
+    defined_count = len(ids)
+    sources, targets = _resolve_related(related, index, ids)
+    del related
+    undefined = len(ids) - len(names)
+    if undefined:
+        names.extend([""] * undefined)
+        locations.extend([""] * undefined)
+        if descriptions is not None:
+            descriptions.extend([""] * undefined)
+        type_codes.extend([bit_types(UNDEFINED)] * undefined)
+        status_codes.extend([statuses(UNDEFINED)] * undefined)
+        epoch_codes.extend([epochs(UNDEFINED)] * undefined)
+    
+    return NarrativeGraph(
+        ids, names,
+        bit_types, np.frombuffer(type_codes, dtype=np.uint16),
+        statuses, np.frombuffer(status_codes, dtype=np.uint16),
+        epochs, np.frombuffer(epoch_codes, dtype=np.uint16),
+        locations, sources, targets, descriptions,
+        index=index, defined_count=defined_count
+    )
@@ -0,0 +1,238 @@
+"""
+Epoch Prefetch
+
+Warms the content of the epoch players are about to enter, so the first
+player through a transition finds its AR scenes already built and its
+DOJO answers already cached instead of paying for them on arrival.
+
+The scheduler works from Architecture.get_fields_by_epoch. Only fields
+whose content hash changed are rebuilt, as in UnityARBridge.rebuild_changed.
+Scenes are built in chunks on one background thread, on a detached
+builder, so the event loop keeps serving players while the next epoch
+warms. Each chunk is committed to the bridge back on the event loop,
+which stays the only thread that touches the bridge.
+DOJO requests for cacheable endpoints are issued through the MCPClient
+(filling its response cache) with their own concurrency budget, so
+prefetching never takes all of the client's slots from live traffic.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import asyncio
+import time
+
+from architecture import Architecture, Epoch, Field
+from field_backend import DojoAPIEndpoint, MCPClient, MCPError, canonical_request_key
+from metrics import MetricsRegistry
+from unity_ar import ARScene, UnityARBridge, field_content_hash
+
+
+def default_field_requests(field: Field) -> List[Tuple[DojoAPIEndpoint, Dict]]:
+    """Cacheable DOJO requests a player entering a field will make"""
+    return [
+        (DojoAPIEndpoint.SACRED_MAPPING, {"pattern": field.sacred_pattern}),
+        (DojoAPIEndpoint.GEOMETRY_ANALYSIS, {"geometry_data": {
+            "field_id": field.id,
+            "types": sorted({node.geometry_type for node in field.geometry_nodes}),
+            "location": field.physical_location
+        }}),
+    ]
+
+
+class EpochPrefetcher:
+    """Background warm-up of scenes and DOJO caches for upcoming epochs
+    
+    Live code should fetch scenes through scene_for() (which records hits
+    and misses) and issue DOJO requests built by field_requests, so they
+    match the prefetched cache keys.
+    """
+    
+    def __init__(self, architecture: Architecture, bridge: UnityARBridge,
+                 client: Optional[MCPClient] = None, max_concurrency: int = 4,
+                 chunk_size: int = 64,
+                 field_requests: Callable[[Field], Iterable[Tuple[DojoAPIEndpoint, Dict]]]
+                 = default_field_requests,
+                 metrics: Optional[MetricsRegistry] = None):
+        """Initialize the scheduler
+        
+        max_concurrency: DOJO requests in flight for prefetching
+        chunk_size: scenes built per background job
+        field_requests: the DOJO requests to warm for each field
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.architecture = architecture
+        self.bridge = bridge
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.chunk_size = max(1, chunk_size)
+        self.field_requests = field_requests
+        self._tasks: Dict[Epoch, asyncio.Task] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.scene_hits = 0
+        self.scene_misses = 0
+        self.scenes_built = 0
+        self.requests_warmed = 0
+        self.request_errors = 0
+        self.metrics = metrics
+        if metrics is not None:
+            self._scene_hits_total = metrics.counter(
+                "prefetch_scene_hits_total", "Scene lookups served by a prefetched scene")
+            self._scene_misses_total = metrics.counter(
+                "prefetch_scene_misses_total", "Scene lookups that had to build the scene")
+            self._scenes_built_total = metrics.counter(
+                "prefetch_scenes_built_total", "Scenes (re)built by prefetching")
+            self._requests_total = metrics.counter(
+                "prefetch_requests_total", "DOJO requests issued by prefetching")
+            self._prefetch_seconds = metrics.histogram(
+                "prefetch_epoch_seconds", "Time to warm one epoch")
+    
+    @staticmethod
+    def next_epoch(epoch: Epoch) -> Optional[Epoch]:
+        """Epoch that follows epoch, or None after the last"""
+        epochs = list(Epoch)
+        index = epochs.index(epoch) + 1
+        return epochs[index] if index < len(epochs) else None
+    
+    def schedule(self, epoch: Epoch) -> "asyncio.Task":
+        """Start warming an epoch in the background (one run at a time per epoch)"""
+        task = self._tasks.get(epoch)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self.prefetch(epoch))
+            self._tasks[epoch] = task
+        return task
+    
+    def schedule_next(self, current: Epoch) -> Optional["asyncio.Task"]:
+        """Warm the epoch after current; call when players enter current"""
+        upcoming = self.next_epoch(current)
+        return self.schedule(upcoming) if upcoming is not None else None
+    
+    async def prefetch(self, epoch: Epoch) -> Dict:
+        """Warm every field of an epoch now; returns what was done"""
+        start = time.perf_counter()
+        fields = self.architecture.get_fields_by_epoch(epoch)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        loop = asyncio.get_running_loop()
+        builder = self.bridge.detached_builder()
+        built = 0
+        for i in range(0, len(fields), self.chunk_size):
+            chunk = fields[i:i + self.chunk_size]
+            known = {field.id: self.bridge.scene_hashes.get(field.id) for field in chunk
+                     if self.bridge.get_scene(field.id) is not None}
+            scenes = await loop.run_in_executor(
+                self._executor, self._build_scenes, builder, known, chunk)
+            built += len(self.bridge.commit_scenes(scenes))
+        self.scenes_built += built
+        if self.metrics is not None:
+            self._scenes_built_total.inc(built)
+        
+        requests = 0
+        if self.client is not None:
+            unique: Dict[Tuple[str, str], Tuple[DojoAPIEndpoint, Dict]] = {}
+            for field in fields:
+                for endpoint, payload in self.field_requests(field):
+                    if endpoint in MCPClient.CACHEABLE_ENDPOINTS:
+                        unique.setdefault(canonical_request_key(endpoint.value, payload),
+                                          (endpoint, payload))
+            requests = len(unique)
+            await self._warm_requests(list(unique.values()))
+        
+        elapsed = time.perf_counter() - start
+        if self.metrics is not None:
+            self._prefetch_seconds.observe(elapsed)
+        return {"epoch": epoch.value, "fields": len(fields), "scenes_built": built,
+                "requests": requests, "seconds": elapsed}
+    
+    @staticmethod
+    def _build_scenes(builder: UnityARBridge, known: Dict[str, Optional[str]],
+                      fields: Sequence[Field]) -> List[Tuple[str, ARScene]]:
+        """Worker thread: build the fields whose hash differs from known"""
+        built = []
+        for field in fields:
+            field_data = field.to_dict()
+            content_hash = field_content_hash(field_data)
+            if known.get(field.id) != content_hash:
+                built.append((content_hash, builder.create_field_scene(field_data)))
+        return built
+    
+    async def _warm_requests(self, requests: List[Tuple[DojoAPIEndpoint, Dict]]):
+        budget = asyncio.Semaphore(self.max_concurrency)
+        
+        async def warm(endpoint: DojoAPIEndpoint, payload: Dict):
+            async with budget:
+                try:
+                    await self.client.request(endpoint, payload)
+                except MCPError:
+                    # A failed warm-up only means the live request pays for it
+                    self.request_errors += 1
+                else:
+                    self.requests_warmed += 1
+                    if self.metrics is not None:
+                        self._requests_total.inc()
+        
+        await asyncio.gather(*(warm(endpoint, payload) for endpoint, payload in requests))
+    
+    async def transition_epoch(self, current: Epoch, next_epoch: Epoch) -> Dict:
+        """Move players to next_epoch with its content warm
+        
+        Waits for next_epoch's prefetch (starting it if it was never
+        scheduled) alongside the DOJO transition call, then starts warming
+        the epoch after it.
+        """
+        warming = self._tasks.get(next_epoch) or self.schedule(next_epoch)
+        if self.client is not None:
+            result, _ = await asyncio.gather(
+                self.client.transition_epoch(current.value, next_epoch.value), warming)
+        else:
+            await warming
+            result = {"current_epoch": current.value, "next_epoch": next_epoch.value}
+        self.schedule_next(next_epoch)
+        return result
+    
+    def scene_for(self, field_id: str) -> Optional[ARScene]:
+        """Scene for a player entering a field, built on demand after a miss"""
+        scene = self.bridge.get_scene(field_id)
+        if scene is not None:
+            self.scene_hits += 1
+            if self.metrics is not None:
+                self._scene_hits_total.inc()
+            return scene
+        field = self.architecture.get_field(field_id)
+        if field is None:
+            return None
+        self.scene_misses += 1
+        if self.metrics is not None:
+            self._scene_misses_total.inc()
+        self.bridge.rebuild_changed([field.to_dict()])
+        return self.bridge.get_scene(field_id)
+    
+    def stats(self) -> Dict:
+        """Scene hit rate, prefetch counters and the MCP cache hit rate"""
+        lookups = self.scene_hits + self.scene_misses
+        stats = {
+            "scene_hits": self.scene_hits,
+            "scene_misses": self.scene_misses,
+            "scene_hit_rate": self.scene_hits / lookups if lookups else 0.0,
+            "scenes_built": self.scenes_built,
+            "requests_warmed": self.requests_warmed,
+            "request_errors": self.request_errors,
+        }
+        if self.client is not None:
+            stats["mcp_cache"] = self.client.cache_stats()
+        return stats
+    
+    async def close(self):
+        """Cancel prefetches still running
+        
+        A scene chunk already building finishes on its thread; the wait
+        for it runs on the default executor so the event loop keeps going.
+        """
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
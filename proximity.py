@@ -0,0 +1,364 @@
+"""
+Proximity Triggers
+
+Turns batched player GPS updates into enter/exit events for the
+GeometryNodes of each Field. Positions are projected onto the local
+plane of a GPSToARConverter, nodes are bucketed in a uniform metre grid,
+and each batch is evaluated with numpy over the 3×3 cells around every
+player, so throughput does not depend on the total number of nodes.
+
+Hysteresis: a player enters a node's geofence within enter_radius_m and
+only exits beyond exit_radius_m, so GPS jitter around the boundary does
+not produce event storms.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from architecture import Architecture, Field
+from unity_ar import GPSToARConverter
+
+
+# Grid cell coordinates are offset into [0, 2**21) and packed into one int64
+_CELL_OFFSET = 1 << 20
+_CELL_LIMIT = (1 << 21) - 1
+# Node extents up to this many cells get a dense cell table instead of a
+# binary search over occupied cells
+DENSE_GRID_MAX_CELLS = 1 << 22
+# Inside-set keys pack (player index, node index) into one int64
+_NODE_BITS = 32
+_NODE_MASK = (1 << _NODE_BITS) - 1
+
+
+class ProximityEventType(Enum):
+    """Geofence transitions"""
+    ENTER = "enter"
+    EXIT = "exit"
+
+
+@dataclass
+class ProximityEvent:
+    """A player crossing a node geofence"""
+    event_type: ProximityEventType
+    player_id: Hashable
+    field_id: str
+    node_id: str
+    t: Optional[float]
+    distance_m: float
+    
+    def to_dict(self) -> Dict:
+        return {
+            "type": self.event_type.value,
+            "player_id": self.player_id,
+            "field_id": self.field_id,
+            "node_id": self.node_id,
+            "t": self.t,
+            "distance_m": self.distance_m
+        }
+
+
+class ProximityEngine:
+    """Geofence evaluation for GeometryNodes over streams of player positions
+    
+    Updates older than a player's last accepted update are ignored. When a
+    batch holds several updates for one player they are applied in time
+    order; within each step, exits are reported before enters.
+    """
+    
+    def __init__(self, converter: GPSToARConverter, enter_radius_m: float = 20.0,
+                 exit_radius_m: float = 30.0):
+        """Initialize with the converter whose local plane distances are measured in"""
+        if enter_radius_m <= 0:
+            raise ValueError("enter_radius_m must be positive")
+        if exit_radius_m < enter_radius_m:
+            raise ValueError("exit_radius_m must be at least enter_radius_m")
+        self.converter = converter
+        self.enter_radius_m = enter_radius_m
+        self.exit_radius_m = exit_radius_m
+        # Anything within the exit radius lies in the 3×3 cells around a player
+        self.cell_m = exit_radius_m
+        
+        self._node_ids: List[str] = []
+        self._node_fields: List[str] = []
+        self._node_lat: List[float] = []
+        self._node_lng: List[float] = []
+        self._node_active: List[bool] = []
+        self._node_index: Dict[Tuple[str, str], int] = {}
+        self._dirty = True
+        self._node_x = np.zeros(0)
+        self._node_z = np.zeros(0)
+        self._cell_keys = np.zeros(0, dtype=np.int64)
+        self._cell_start = np.zeros(0, dtype=np.int64)
+        self._cell_count = np.zeros(0, dtype=np.int64)
+        self._grid_nodes = np.zeros(0, dtype=np.int64)
+        # (min cell x, min cell z, width, height, starts, counts) when dense
+        self._dense: Optional[Tuple[int, int, int, int, np.ndarray, np.ndarray]] = None
+        
+        self._player_ids: List[Hashable] = []
+        self._player_index: Dict[Hashable, int] = {}
+        self._last_t = np.zeros(0)
+        # Sorted (player << 32 | node) keys of every player inside a geofence
+        self._inside = np.zeros(0, dtype=np.int64)
+    
+    @classmethod
+    def from_architecture(cls, architecture: Architecture, converter: GPSToARConverter,
+                          enter_radius_m: float = 20.0,
+                          exit_radius_m: float = 30.0) -> "ProximityEngine":
+        """Engine over the GPS nodes of every field in an architecture"""
+        engine = cls(converter, enter_radius_m, exit_radius_m)
+        for field in architecture.fields:
+            engine.add_field(field)
+        return engine
+    
+    @property
+    def node_count(self) -> int:
+        return sum(self._node_active)
+    
+    @property
+    def player_count(self) -> int:
+        return len(self._player_ids)
+    
+    def add_node(self, field_id: str, node_id: str, lat: float, lng: float) -> int:
+        """Add (or move) one geofenced node"""
+        key = (field_id, node_id)
+        index = self._node_index.get(key)
+        if index is None:
+            index = self._node_index[key] = len(self._node_ids)
+            self._node_ids.append(node_id)
+            self._node_fields.append(field_id)
+            self._node_lat.append(lat)
+            self._node_lng.append(lng)
+            self._node_active.append(True)
+        else:
+            self._node_lat[index] = lat
+            self._node_lng[index] = lng
+            self._node_active[index] = True
+        self._dirty = True
+        return index
+    
+    def add_field(self, field: Field) -> int:
+        """Add a field's physical (lat/lng) nodes; returns how many were added"""
+        added = 0
+        for node in field.geometry_nodes:
+            coords = node.coordinates
+            if "lat" in coords and "lng" in coords:
+                self.add_node(field.id, node.id, coords["lat"], coords["lng"])
+                added += 1
+        return added
+    
+    def remove_field(self, field_id: str, t: Optional[float] = None) -> List[ProximityEvent]:
+        """Remove a field's nodes, returning exits for players inside them"""
+        removed = [index for (owner, _), index in self._node_index.items()
+                   if owner == field_id and self._node_active[index]]
+        if not removed:
+            return []
+        for index in removed:
+            self._node_active[index] = False
+        self._dirty = True
+        gone = np.isin(self._inside & _NODE_MASK, removed)
+        keys = self._inside[gone]
+        self._inside = self._inside[~gone]
+        return [ProximityEvent(ProximityEventType.EXIT, self._player_ids[key >> _NODE_BITS],
+                               field_id, self._node_ids[key & _NODE_MASK], t, float("nan"))
+                for key in keys.tolist()]
+    
+    def remove_player(self, player_id: Hashable, t: Optional[float] = None) -> List[ProximityEvent]:
+        """Forget a player, returning exits for every geofence they were inside"""
+        player = self._player_index.get(player_id)
+        if player is None:
+            return []
+        mine = (self._inside >> _NODE_BITS) == player
+        keys = self._inside[mine]
+        self._inside = self._inside[~mine]
+        # Keep the index slot so packed keys stay valid; a later update restarts cleanly
+        self._last_t[player] = -np.inf
+        return [ProximityEvent(ProximityEventType.EXIT, player_id,
+                               self._node_fields[key & _NODE_MASK],
+                               self._node_ids[key & _NODE_MASK], t, float("nan"))
+                for key in keys.tolist()]
+    
+    def inside(self, player_id: Hashable) -> List[Tuple[str, str]]:
+        """(field_id, node_id) of every geofence a player is inside"""
+        player = self._player_index.get(player_id)
+        if player is None:
+            return []
+        lo, hi = np.searchsorted(self._inside, [player << _NODE_BITS, (player + 1) << _NODE_BITS])
+        return [(self._node_fields[node], self._node_ids[node])
+                for node in (self._inside[lo:hi] & _NODE_MASK).tolist()]
+    
+    def _cell_key(self, cx: np.ndarray, cz: np.ndarray) -> np.ndarray:
+        cx = np.clip(cx + _CELL_OFFSET, 0, _CELL_LIMIT)
+        cz = np.clip(cz + _CELL_OFFSET, 0, _CELL_LIMIT)
+        return (cx << 21) | cz
+    
+    def _build_grid(self):
+        """Bucket active nodes by cell: sorted cell keys with start/count into _grid_nodes"""
+        lat = np.array(self._node_lat, dtype=np.float64)
+        lng = np.array(self._node_lng, dtype=np.float64)
+        if len(lat):
+            positions = self.converter.gps_to_unity_batch(np.column_stack((lat, lng)))
+            self._node_x = positions[:, 0].copy()
+            self._node_z = positions[:, 2].copy()
+        active = np.flatnonzero(np.array(self._node_active, dtype=bool))
+        keys = self._cell_key(np.floor(self._node_x[active] / self.cell_m).astype(np.int64),
+                              np.floor(self._node_z[active] / self.cell_m).astype(np.int64))
+        order = np.argsort(keys, kind="stable")
+        self._grid_nodes = active[order]
+        self._cell_keys, self._cell_start, self._cell_count = np.unique(
+            keys[order], return_index=True, return_counts=True)
+        self._dense = None
+        if len(self._cell_keys):
+            cell_x = (self._cell_keys >> 21) - _CELL_OFFSET
+            cell_z = (self._cell_keys & _CELL_LIMIT) - _CELL_OFFSET
+            x0, z0 = int(cell_x.min()), int(cell_z.min())
+            width, height = int(cell_x.max()) - x0 + 1, int(cell_z.max()) - z0 + 1
+            if width * height <= DENSE_GRID_MAX_CELLS:
+                flat = (cell_x - x0) * height + (cell_z - z0)
+                starts = np.zeros(width * height, dtype=np.int64)
+                counts = np.zeros(width * height, dtype=np.int64)
+                starts[flat] = self._cell_start
+                counts[flat] = self._cell_count
+                self._dense = (x0, z0, width, height, starts, counts)
+        self._dirty = False
+    
+    def _intern_players(self, player_ids: Sequence[Hashable]) -> np.ndarray:
+        indexes = list(map(self._player_index.get, player_ids))
+        if None in indexes:
+            for i, index in enumerate(indexes):
+                if index is None:
+                    player_id = player_ids[i]
+                    index = self._player_index.get(player_id)
+                    if index is None:
+                        index = self._player_index[player_id] = len(self._player_ids)
+                        self._player_ids.append(player_id)
+                    indexes[i] = index
+            if len(self._last_t) < len(self._player_ids):
+                grown = np.full(max(len(self._player_ids), 2 * len(self._last_t)), -np.inf)
+                grown[:len(self._last_t)] = self._last_t
+                self._last_t = grown
+        return np.array(indexes, dtype=np.int64)
+    
+    def update(self, player_ids: Sequence[Hashable], lats, lngs, ts) -> List[ProximityEvent]:
+        """Apply a batch of (player_id, lat, lng, t) updates and return events"""
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        ts = np.asarray(ts, dtype=np.float64)
+        count = len(lats)
+        if not (len(player_ids) == len(lngs) == len(ts) == count):
+            raise ValueError("player_ids, lats, lngs and ts must have the same length")
+        if count == 0:
+            return []
+        if self._dirty:
+            self._build_grid()
+        players = self._intern_players(player_ids)
+        positions = self.converter.gps_to_unity_batch(np.column_stack((lats, lngs)))
+        xs = positions[:, 0]
+        zs = positions[:, 2]
+        
+        # Group by player in time order; step k applies each player's k-th update
+        order = np.lexsort((ts, players))
+        sorted_players = players[order]
+        starts = np.flatnonzero(np.concatenate(([True], sorted_players[1:] != sorted_players[:-1])))
+        if len(starts) == count:
+            steps = [order]
+        else:
+            rank = np.arange(count) - np.repeat(starts, np.diff(np.append(starts, count)))
+            steps = [order[rank == k] for k in range(int(rank.max()) + 1)]
+        
+        events: List[ProximityEvent] = []
+        for rows in steps:
+            events.extend(self._apply(players[rows], xs[rows], zs[rows], ts[rows]))
+        return events
+    
+    def _candidates(self, xs: np.ndarray, zs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(update row, node) pairs for nodes in the 3×3 cells around each update"""
+        if not len(self._cell_keys):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        cx = np.floor(xs / self.cell_m).astype(np.int64)
+        cz = np.floor(zs / self.cell_m).astype(np.int64)
+        rows_out, nodes_out = [], []
+        last = len(self._cell_keys) - 1
+        for dx in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                if self._dense is not None:
+                    x0, z0, width, height, dense_starts, dense_counts = self._dense
+                    jx = cx + (dx - x0)
+                    jz = cz + (dz - z0)
+                    rows = np.flatnonzero((jx >= 0) & (jx < width) & (jz >= 0) & (jz < height))
+                    flat = jx[rows] * height + jz[rows]
+                    counts = dense_counts[flat]
+                    occupied = counts > 0
+                    rows, flat, counts = rows[occupied], flat[occupied], counts[occupied]
+                    if not len(rows):
+                        continue
+                    starts = dense_starts[flat]
+                else:
+                    keys = self._cell_key(cx + dx, cz + dz)
+                    slots = np.minimum(np.searchsorted(self._cell_keys, keys), last)
+                    rows = np.flatnonzero(self._cell_keys[slots] == keys)
+                    if not len(rows):
+                        continue
+                    starts = self._cell_start[slots[rows]]
+                    counts = self._cell_count[slots[rows]]
+                offsets = (np.repeat(starts - (np.cumsum(counts) - counts), counts)
+                           + np.arange(int(counts.sum())))
+                rows_out.append(np.repeat(rows, counts))
+                nodes_out.append(self._grid_nodes[offsets])
+        if not rows_out:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(rows_out), np.concatenate(nodes_out)
+    
+    def _apply(self, players: np.ndarray, xs: np.ndarray, zs: np.ndarray,
+               ts: np.ndarray) -> List[ProximityEvent]:
+        """One step: every player appears at most once, in ascending order"""
+        fresh = ts >= self._last_t[players]
+        if not fresh.all():
+            players, xs, zs, ts = players[fresh], xs[fresh], zs[fresh], ts[fresh]
+            if not len(players):
+                return []
+        self._last_t[players] = ts
+        
+        rows, nodes = self._candidates(xs, zs)
+        dist2 = (self._node_x[nodes] - xs[rows]) ** 2 + (self._node_z[nodes] - zs[rows]) ** 2
+        near = dist2 <= self.exit_radius_m ** 2
+        rows, nodes, dist2 = rows[near], nodes[near], dist2[near]
+        near_keys = (players[rows] << _NODE_BITS) | nodes
+        entering = dist2 <= self.enter_radius_m ** 2
+        
+        inside = self._inside
+        in_step = np.isin(inside >> _NODE_BITS, players)
+        previous = inside[in_step]
+        staying = np.isin(previous, near_keys)
+        exits = previous[~staying]
+        new = np.flatnonzero(entering)
+        new = new[~np.isin(near_keys[new], previous)]
+        if not len(exits) and not len(new):
+            return []
+        self._inside = np.sort(np.concatenate((inside[~in_step], previous[staying], near_keys[new])))
+        
+        events = []
+        if len(exits):
+            exit_players = exits >> _NODE_BITS
+            exit_nodes = exits & _NODE_MASK
+            exit_rows = np.searchsorted(players, exit_players)
+            exit_dist = np.hypot(self._node_x[exit_nodes] - xs[exit_rows],
+                                 self._node_z[exit_nodes] - zs[exit_rows])
+            for player, node, t, distance in zip(exit_players.tolist(), exit_nodes.tolist(),
+                                                 ts[exit_rows].tolist(), exit_dist.tolist()):
+                events.append(ProximityEvent(ProximityEventType.EXIT, self._player_ids[player],
+                                             self._node_fields[node], self._node_ids[node],
+                                             t, distance))
+        if len(new):
+            enter_rows = rows[new]
+            for player, node, t, distance in zip(players[enter_rows].tolist(), nodes[new].tolist(),
+                                                 ts[enter_rows].tolist(),
+                                                 np.sqrt(dist2[new]).tolist()):
+                events.append(ProximityEvent(ProximityEventType.ENTER, self._player_ids[player],
+                                             self._node_fields[node], self._node_ids[node],
+                                             t, distance))
+        return events
@@ -0,0 +1,296 @@
+"""
+Binary Scene Format
+
+Compact alternative to the JSON produced by UnityARBridge.export_for_unity.
+Marker transforms are packed float arrays and every string is stored once
+in a string table, so devices can map the file and read markers without
+parsing JSON.
+
+Layout (little endian, sections 8-byte aligned):
+    header              HEADER struct, see below
+    string offsets      (string_count + 1) × uint32 into the string blob
+    string blob         UTF-8 bytes
+    marker records      marker_count × 4 × uint32
+                        (id, type, geometry_type, layer string indexes;
+                        ABSENT when the metadata key is missing)
+    transforms          marker_count × 10 × float32 (or float64)
+                        (position xyz, rotation xyzw, scale xyz)
+    extras              compact JSON: scene version, lighting, origin,
+                        settings, prefabs
+                        (deduplicated into a table plus per-entry refs) and
+                        any marker metadata beyond geometry_type/layer
+"""
+
+import json
+import struct
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from unity_ar import ARScene, MarkerBuffer
+
+
+MAGIC = b"DFPS"
+VERSION = 1
+FLAG_FLOAT64 = 0x1
+ABSENT = 0xFFFFFFFF
+
+# magic, version, flags, marker_count, string_count, field_id string,
+# strings offset, records offset, transforms offset, extras offset, extras size
+HEADER = struct.Struct("<4sHHIIIIIIII")
+RECORD = struct.Struct("<4I")
+TRANSFORM_WIDTH = 10
+
+
+def _align(n: int, alignment: int = 8) -> int:
+    return (n + alignment - 1) // alignment * alignment
+
+
+class _StringTable:
+    """Interns strings in first-seen order"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return ABSENT
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self._index[value] = index
+        return index
+
+    def encode(self) -> bytes:
+        encoded = [s.encode("utf-8") for s in self.strings]
+        offsets = [0]
+        for blob in encoded:
+            offsets.append(offsets[-1] + len(blob))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+def encode_scene(scene: ARScene, converter_origin: Dict, unity_settings: Dict,
+                 version: int = 0, double_precision: bool = False) -> bytes:
+    """Pack a scene (plus export context) into the binary format"""
+    strings = _StringTable()
+    field_index = strings.add(scene.field_id)
+    records = bytearray()
+    marker_metadata = {}
+
+    if isinstance(scene.markers, MarkerBuffer) and not double_precision:
+        buffer = scene.markers
+        count = len(buffer)
+        for i, extra in buffer.extra_metadata.items():
+            marker_metadata[str(i)] = dict(extra)
+        type_values = [strings.add(t.value) for t in buffer.marker_types]
+        geometry_values = [strings.add(g) for g in buffer.geometry_types]
+        layer_values = [strings.add(layer) for layer in buffer.layers]
+        type_index = buffer.type_index.tolist()
+        geometry_index = buffer.geometry_index.tolist()
+        layer_index = buffer.layer_index.tolist()
+        for i in range(count):
+            records += RECORD.pack(strings.add(buffer.ids[i]),
+                                   type_values[type_index[i]],
+                                   geometry_values[geometry_index[i]],
+                                   layer_values[layer_index[i]])
+        transforms = np.concatenate(
+            [buffer.positions, buffer.rotations, buffer.scales], axis=1
+        ).astype("<f4", copy=False).tobytes()
+    else:
+        count = len(scene.markers)
+        values = []
+        for i, marker in enumerate(scene.markers):
+            metadata = marker.metadata
+            records += RECORD.pack(strings.add(marker.id),
+                                   strings.add(marker.marker_type.value),
+                                   strings.add(metadata.get("geometry_type")),
+                                   strings.add(metadata.get("layer")))
+            extra = {k: v for k, v in metadata.items() if k not in ("geometry_type", "layer")}
+            if extra:
+                marker_metadata[str(i)] = extra
+            p, r, s = marker.position, marker.rotation, marker.scale
+            values.extend((p.x, p.y, p.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z))
+        code = "d" if double_precision else "f"
+        transforms = struct.pack(f"<{len(values)}{code}", *values)
+
+    prefab_table = []
+    prefab_refs = []
+    if scene.prefab_refs is not None:
+        # Already interned by the bridge; renumber densely for this scene
+        local: Dict[int, int] = {}
+        for ref, prefab in zip(scene.prefab_refs, scene.geometry_prefabs):
+            index = local.get(ref)
+            if index is None:
+                index = local[ref] = len(prefab_table)
+                prefab_table.append(prefab)
+            prefab_refs.append(index)
+    else:
+        prefab_index: Dict[str, int] = {}
+        for prefab in scene.geometry_prefabs:
+            key = json.dumps(prefab, sort_keys=True)
+            index = prefab_index.get(key)
+            if index is None:
+                index = prefab_index[key] = len(prefab_table)
+                prefab_table.append(prefab)
+            prefab_refs.append(index)
+
+    extras = {
+        "version": version,
+        "ambient_lighting": scene.ambient_lighting,
+        "prefab_table": prefab_table,
+        "prefab_refs": prefab_refs,
+        "converter_origin": converter_origin,
+        "unity_settings": unity_settings
+    }
+    if marker_metadata:
+        extras["marker_metadata"] = marker_metadata
+    extras_blob = json.dumps(extras, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    string_blob = strings.encode()
+
+    strings_offset = _align(HEADER.size)
+    records_offset = _align(strings_offset + len(string_blob))
+    transforms_offset = _align(records_offset + len(records))
+    extras_offset = _align(transforms_offset + len(transforms))
+
+    out = bytearray(extras_offset + len(extras_blob))
+    HEADER.pack_into(out, 0, MAGIC, VERSION,
+                     FLAG_FLOAT64 if double_precision else 0,
+                     count, len(strings.strings), field_index,
+                     strings_offset, records_offset, transforms_offset,
+                     extras_offset, len(extras_blob))
+    out[strings_offset:strings_offset + len(string_blob)] = string_blob
+    out[records_offset:records_offset + len(records)] = records
+    out[transforms_offset:transforms_offset + len(transforms)] = transforms
+    out[extras_offset:] = extras_blob
+    return bytes(out)
+
+
+class BinarySceneReader:
+    """Zero-copy reader over an encoded scene
+
+    Accepts bytes, bytearray, mmap or memoryview. Transforms and records
+    are memoryview casts into the original buffer; strings are decoded
+    only when a marker is read.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        view = memoryview(data)
+        if view.ndim != 1 or view.format not in ("B", "b", "c"):
+            view = view.cast("B")
+        if len(view) < HEADER.size:
+            raise ValueError("buffer too small for a binary scene")
+        (magic, version, flags, count, string_count, field_index,
+         strings_offset, records_offset, transforms_offset,
+         extras_offset, extras_size) = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("not a binary scene (bad magic)")
+        if version != VERSION:
+            raise ValueError(f"unsupported binary scene version {version}")
+
+        self._view = view
+        self.marker_count = count
+        self.double_precision = bool(flags & FLAG_FLOAT64)
+        offsets_size = (string_count + 1) * 4
+        self._string_offsets = view[strings_offset:strings_offset + offsets_size].cast("I")
+        self._string_blob_start = strings_offset + offsets_size
+        self._strings: Dict[int, str] = {}
+        self._records = view[records_offset:records_offset + count * RECORD.size].cast("I")
+        width = 8 if self.double_precision else 4
+        self._transforms = view[transforms_offset:
+                                transforms_offset + count * TRANSFORM_WIDTH * width].cast(
+            "d" if self.double_precision else "f")
+        # 2-D views for np.asarray(); both alias the original buffer
+        # (memoryview cannot take a zero-length shape, so empty scenes stay flat)
+        if count:
+            self.records = self._records.cast("B").cast("I", shape=[count, 4])
+            self.transforms = self._transforms.cast("B").cast(
+                self._transforms.format, shape=[count, TRANSFORM_WIDTH])
+        else:
+            self.records = self._records
+            self.transforms = self._transforms
+        self._extras_slice = (extras_offset, extras_offset + extras_size)
+        self._extras: Optional[Dict] = None
+        self.field_id = self.string(field_index)
+
+    def __len__(self) -> int:
+        return self.marker_count
+
+    def string(self, index: int) -> Optional[str]:
+        """Decode one string-table entry (cached)"""
+        if index == ABSENT:
+            return None
+        value = self._strings.get(index)
+        if value is None:
+            start = self._string_blob_start + self._string_offsets[index]
+            end = self._string_blob_start + self._string_offsets[index + 1]
+            value = str(self._view[start:end], "utf-8")
+            self._strings[index] = value
+        return value
+
+    @property
+    def extras(self) -> Dict:
+        """Scene-level JSON section, parsed on first access"""
+        if self._extras is None:
+            start, end = self._extras_slice
+            self._extras = json.loads(str(self._view[start:end], "utf-8"))
+        return self._extras
+
+    def geometry_prefabs(self) -> List[Dict]:
+        """Expand the prefab table back into one entry per prefab ref"""
+        table = self.extras["prefab_table"]
+        return [dict(table[ref]) for ref in self.extras["prefab_refs"]]
+
+    def transform(self, index: int):
+        """(position, rotation, scale) tuples for one marker"""
+        if not 0 <= index < self.marker_count:
+            raise IndexError("marker index out of range")
+        start = index * TRANSFORM_WIDTH
+        row = self._transforms[start:start + TRANSFORM_WIDTH].tolist()
+        return tuple(row[0:3]), tuple(row[3:7]), tuple(row[7:10])
+
+    def marker(self, index: int) -> Dict:
+        """Unity JSON for one marker, matching ARMarker.to_unity_json"""
+        if not 0 <= index < self.marker_count:
+            raise IndexError("marker index out of range")
+        id_ix, type_ix, geometry_ix, layer_ix = self._records[index * 4:index * 4 + 4].tolist()
+        (px, py, pz), (rx, ry, rz, rw), (sx, sy, sz) = self.transform(index)
+        metadata = {}
+        geometry_type = self.string(geometry_ix)
+        if geometry_type is not None:
+            metadata["geometry_type"] = geometry_type
+        layer = self.string(layer_ix)
+        if layer is not None:
+            metadata["layer"] = layer
+        if self.extras.get("marker_metadata"):
+            metadata.update(self.extras["marker_metadata"].get(str(index), {}))
+        return {
+            "id": self.string(id_ix),
+            "type": self.string(type_ix),
+            "transform": {
+                "position": {"x": px, "y": py, "z": pz},
+                "rotation": {"x": rx, "y": ry, "z": rz, "w": rw},
+                "scale": {"x": sx, "y": sy, "z": sz}
+            },
+            "metadata": metadata
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self.marker_count):
+            yield self.marker(i)
+
+    def to_dict(self) -> Dict:
+        """Rebuild the export_for_unity dictionary"""
+        extras = self.extras
+        return {
+            "scene": {
+                "field_id": self.field_id,
+                "markers": list(self),
+                "ambient_lighting": extras["ambient_lighting"],
+                "geometry_prefabs": self.geometry_prefabs()
+            },
+            "version": extras.get("version", 0),
+            "converter_origin": extras["converter_origin"],
+            "unity_settings": extras["unity_settings"]
+        }
@@ -0,0 +1,275 @@
+"""
+GLB Scene Export
+
+Packs an ARScene into one binary glTF 2.0 (GLB) file, so a device can
+preload a field with a single read and hand it to its glTF importer
+instead of assembling geometry from JSON.
+
+Each prefab used by the scene becomes one glTF mesh (generated by
+geometry_mesh) and one node that draws every marker using that prefab
+through EXT_mesh_gpu_instancing. All binary data shares five buffer
+views in the single BIN chunk:
+    vertices        interleaved float32 position + normal of every mesh
+    indices         uint16 (or uint32 for large meshes) triangle indices
+    translations    float32 xyz per marker, grouped by prefab
+    rotations       float32 xyzw per marker, grouped by prefab
+    scales          float32 xyz per marker, grouped by prefab
+
+Unity space is left-handed and glTF right-handed. Transforms are written
+mirrored on x (as Unity glTF importers expect, which mirror them back).
+Each node's extras hold its marker ids and layers in instance order, and
+its index into the prefab list in the scene's extras. Those also carry
+the field id, version, converter origin, Unity settings and ambient
+lighting.
+"""
+
+import json
+import struct
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from geometry_mesh import MESH_GENERATOR, Mesh, MeshGenerator
+from unity_ar import ARScene, marker_ids_and_layers, marker_transforms
+
+
+GLB_MAGIC = b"glTF"
+GLB_VERSION = 2
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+GLB_HEADER = struct.Struct("<4sII")
+CHUNK_HEADER = struct.Struct("<II")
+
+INSTANCING_EXTENSION = "EXT_mesh_gpu_instancing"
+
+# glTF constants
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+FLOAT = 5126
+UNSIGNED_SHORT = 5123
+UNSIGNED_INT = 5125
+
+
+def _align4(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def _linear_color(hex_color: str) -> List[float]:
+    """sRGB "#RRGGBB" to a linear glTF baseColorFactor"""
+    try:
+        channels = [int(hex_color[i:i + 2], 16) / 255.0 for i in (1, 3, 5)]
+    except (TypeError, ValueError):
+        channels = [1.0, 1.0, 1.0]
+    linear = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in channels]
+    return [round(c, 6) for c in linear] + [1.0]
+
+
+def _prefab_table(scene: ARScene) -> Tuple[List[Dict], np.ndarray]:
+    """Distinct prefabs of a scene and each marker's index into them"""
+    table: List[Dict] = []
+    local: Dict = {}
+    if scene.prefab_refs is not None:
+        keys = scene.prefab_refs
+    else:
+        keys = [json.dumps(prefab, sort_keys=True) for prefab in scene.geometry_prefabs]
+    refs = []
+    for key, prefab in zip(keys, scene.geometry_prefabs):
+        index = local.get(key)
+        if index is None:
+            index = local[key] = len(table)
+            table.append(prefab)
+        refs.append(index)
+    return table, np.asarray(refs, dtype=np.int64)
+
+
+def encode_glb(scene: ARScene, converter_origin: Dict, unity_settings: Dict,
+               version: int = 0, lod: int = 0,
+               meshes: Optional[MeshGenerator] = None) -> bytes:
+    """Pack a scene (plus export context) into a GLB file
+    
+    lod: geometry_mesh LOD level of the meshes (0 is the most detailed)
+    meshes: mesh source (default: the shared geometry_mesh.MESH_GENERATOR)
+    """
+    meshes = meshes or MESH_GENERATOR
+    positions, rotations, scales = marker_transforms(scene.markers)
+    ids, layers = marker_ids_and_layers(scene.markers)
+    count = len(ids)
+    table, refs = _prefab_table(scene)
+    refs = refs[:count]
+    
+    # Markers grouped by prefab; prefabs without markers are dropped
+    order = np.argsort(refs, kind="stable")
+    sorted_refs = refs[order]
+    used = np.unique(sorted_refs).tolist()
+    starts = np.searchsorted(sorted_refs, used).tolist() + [count]
+    
+    prefab_meshes: List[Mesh] = []
+    for ref in used:
+        prefab = table[ref]
+        prefab_meshes.append(meshes.mesh(prefab.get("geometry_type", ""), lod,
+                                         prefab.get("scale", 1.0)))
+    
+    # Lay out the BIN chunk: every view and accessor offset is known
+    # before any data is copied
+    vertex_offsets, index_offsets, index_types = [], [], []
+    vertex_size = index_size = 0
+    for mesh in prefab_meshes:
+        vertex_offsets.append(vertex_size)
+        vertex_size += mesh.vertex_count * 24
+        wide = mesh.vertex_count > 0xFFFF
+        index_types.append(UNSIGNED_INT if wide else UNSIGNED_SHORT)
+        index_offsets.append(index_size)
+        index_size += _align4(mesh.indices.size * (4 if wide else 2))
+    sections = [("vertices", vertex_size), ("indices", index_size),
+                ("translations", count * 12), ("rotations", count * 16),
+                ("scales", count * 12)]
+    views: List[Dict] = []
+    view_index: Dict[str, int] = {}
+    section_offset: Dict[str, int] = {}
+    bin_size = 0
+    for name, size in sections:
+        section_offset[name] = bin_size
+        if not size:
+            continue
+        view = {"buffer": 0, "byteOffset": bin_size, "byteLength": size, "name": name}
+        if name == "vertices":
+            view["byteStride"] = 24
+            view["target"] = ARRAY_BUFFER
+        elif name == "indices":
+            view["target"] = ELEMENT_ARRAY_BUFFER
+        view_index[name] = len(views)
+        views.append(view)
+        bin_size += size
+    
+    accessors: List[Dict] = []
+    
+    def accessor(view: str, offset: int, component: int, kind: str, n: int, **extra) -> int:
+        accessors.append(dict({"bufferView": view_index[view], "byteOffset": offset,
+                               "componentType": component, "count": n, "type": kind}, **extra))
+        return len(accessors) - 1
+    
+    gltf_meshes, materials, nodes = [], [], []
+    for i, (ref, mesh) in enumerate(zip(used, prefab_meshes)):
+        prefab = table[ref]
+        low, high = mesh.bounds()
+        position = accessor("vertices", vertex_offsets[i], FLOAT, "VEC3", mesh.vertex_count,
+                            min=low, max=high)
+        normal = accessor("vertices", vertex_offsets[i] + 12, FLOAT, "VEC3", mesh.vertex_count)
+        indices = accessor("indices", index_offsets[i], index_types[i], "SCALAR",
+                           mesh.indices.size)
+        materials.append({
+            "name": prefab.get("material", "Sacred_Geometry_Material"),
+            "pbrMetallicRoughness": {"baseColorFactor": _linear_color(prefab.get("color")),
+                                     "metallicFactor": 0.0, "roughnessFactor": 0.5},
+            "extras": {"shader": prefab.get("shader"), "color": prefab.get("color")}
+        })
+        gltf_meshes.append({
+            "name": f"{mesh.geometry_type}@lod{lod}",
+            "primitives": [{"attributes": {"POSITION": position, "NORMAL": normal},
+                            "indices": indices, "material": i}]
+        })
+        start, end = starts[i], starts[i + 1]
+        rows = order[start:end].tolist()
+        nodes.append({
+            "name": prefab.get("geometry_type", ""),
+            "mesh": i,
+            "extensions": {INSTANCING_EXTENSION: {"attributes": {
+                "TRANSLATION": accessor("translations", start * 12, FLOAT, "VEC3", end - start),
+                "ROTATION": accessor("rotations", start * 16, FLOAT, "VEC4", end - start),
+                "SCALE": accessor("scales", start * 12, FLOAT, "VEC3", end - start)
+            }}},
+            "extras": {"prefab": i, "marker_ids": [ids[r] for r in rows],
+                       "layers": [layers[r] for r in rows]}
+        })
+    
+    gltf = {
+        "asset": {"version": "2.0", "generator": "Days-of-Future-Past scene_gltf"},
+        "scene": 0,
+        "scenes": [{
+            "name": scene.field_id,
+            "nodes": list(range(len(nodes))),
+            "extras": {
+                "field_id": scene.field_id,
+                "version": version,
+                "converter_origin": converter_origin,
+                "unity_settings": unity_settings,
+                "ambient_lighting": scene.ambient_lighting,
+                "prefabs": [table[ref] for ref in used]
+            }
+        }],
+        "nodes": nodes,
+        "meshes": gltf_meshes,
+        "materials": materials,
+        "accessors": accessors,
+        "bufferViews": views,
+    }
+    # glTF does not allow empty top-level arrays
+    for key in ("nodes", "meshes", "materials", "accessors", "bufferViews"):
+        if not gltf[key]:
+            del gltf[key]
+    if nodes:
+        gltf["extensionsUsed"] = [INSTANCING_EXTENSION]
+        gltf["extensionsRequired"] = [INSTANCING_EXTENSION]
+    if bin_size:
+        gltf["buffers"] = [{"byteLength": bin_size}]
+    json_blob = json.dumps(gltf, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    json_size = _align4(len(json_blob))
+    
+    # One output buffer; the BIN sections are filled in place
+    json_start = GLB_HEADER.size + CHUNK_HEADER.size
+    bin_start = json_start + json_size + CHUNK_HEADER.size
+    total = bin_start + bin_size if bin_size else json_start + json_size
+    out = bytearray(total)
+    GLB_HEADER.pack_into(out, 0, GLB_MAGIC, GLB_VERSION, total)
+    CHUNK_HEADER.pack_into(out, GLB_HEADER.size, json_size, CHUNK_JSON)
+    out[json_start:json_start + len(json_blob)] = json_blob
+    out[json_start + len(json_blob):json_start + json_size] = b" " * (json_size - len(json_blob))
+    if not bin_size:
+        return bytes(out)
+    CHUNK_HEADER.pack_into(out, bin_start - CHUNK_HEADER.size, bin_size, CHUNK_BIN)
+    
+    def section(name: str, dtype: str, size: int, offset: int = 0) -> np.ndarray:
+        begin = bin_start + section_offset[name] + offset
+        return np.frombuffer(out, dtype=dtype, count=size // np.dtype(dtype).itemsize,
+                             offset=begin)
+    
+    for i, mesh in enumerate(prefab_meshes):
+        interleaved = section("vertices", "<f4", mesh.vertex_count * 24,
+                              vertex_offsets[i]).reshape(-1, 6)
+        interleaved[:, :3] = mesh.vertices
+        interleaved[:, 3:] = mesh.normals
+        wide = index_types[i] == UNSIGNED_INT
+        section("indices", "<u4" if wide else "<u2", mesh.indices.size * (4 if wide else 2),
+                index_offsets[i])[:] = mesh.indices.ravel()
+    if count:
+        # Unity (left-handed) to glTF (right-handed): mirror x
+        translations = section("translations", "<f4", count * 12).reshape(-1, 3)
+        translations[:] = positions[order]
+        translations[:, 0] *= -1.0
+        quaternions = section("rotations", "<f4", count * 16).reshape(-1, 4)
+        quaternions[:] = rotations[order]
+        quaternions[:, 1:3] *= -1.0
+        section("scales", "<f4", count * 12).reshape(-1, 3)[:] = scales[order]
+    return bytes(out)
+
+
+def read_glb(data: Union[bytes, bytearray, memoryview]) -> Tuple[Dict, memoryview]:
+    """Split a GLB file into its glTF JSON and a view of its BIN chunk"""
+    view = memoryview(data)
+    magic, glb_version, length = GLB_HEADER.unpack_from(view, 0)
+    if magic != GLB_MAGIC or glb_version != GLB_VERSION:
+        raise ValueError("not a glTF 2.0 binary file")
+    json_size, kind = CHUNK_HEADER.unpack_from(view, GLB_HEADER.size)
+    if kind != CHUNK_JSON:
+        raise ValueError("GLB file does not start with a JSON chunk")
+    json_start = GLB_HEADER.size + CHUNK_HEADER.size
+    gltf = json.loads(bytes(view[json_start:json_start + json_size]))
+    bin_header = json_start + json_size
+    if bin_header + CHUNK_HEADER.size > length:
+        return gltf, view[0:0]
+    bin_size, kind = CHUNK_HEADER.unpack_from(view, bin_header)
+    if kind != CHUNK_BIN:
+        raise ValueError("unexpected GLB chunk after JSON")
+    start = bin_header + CHUNK_HEADER.size
+    return gltf, view[start:start + bin_size]
@@ -0,0 +1,289 @@
+"""
+Scene Tile Pyramid
+
+Partitions AR markers from many field scenes into a quadtree of z/x/y
+tiles on the Unity ground plane (x east, z north), so a device only loads
+the tiles around its camera instead of whole regional scenes.
+
+Zoom 0 is one square tile covering every marker and each level splits
+tiles in four, slippy-map style: tile x grows east and tile y grows south.
+The deepest level holds every marker. Shallower levels are a thinned
+level of detail with at most one marker per cell of a lod_grid × lod_grid
+grid laid over each tile. The representative of a cell is its first
+marker, so every marker shown at one zoom is also shown at the next.
+
+Static layout written by export():
+    tileset.json          extent, origin, zoom range and tile counts
+    {z}/{x}/{y}.json      {"z", "x", "y", "bounds", "lod", "markers": [...]}
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import json
+import math
+import os
+
+import numpy as np
+
+from unity_ar import ARScene, MarkerBuffer
+
+
+TILESET_FORMAT = "dfp-tiles"
+TILESET_VERSION = 1
+
+
+class _Level:
+    """Markers of one zoom level, grouped by tile"""
+    
+    __slots__ = ("codes", "starts", "order")
+    
+    def __init__(self, codes: np.ndarray, starts: np.ndarray, order: np.ndarray):
+        # Sorted unique tile codes (x << 32 | y), offsets into order, marker indexes
+        self.codes = codes
+        self.starts = starts
+        self.order = order
+    
+    def members(self, code: int) -> Optional[np.ndarray]:
+        i = int(np.searchsorted(self.codes, code))
+        if i == len(self.codes) or self.codes[i] != code:
+            return None
+        return self.order[self.starts[i]:self.starts[i + 1]]
+
+
+class SceneTilePyramid:
+    """Quadtree (z/x/y) tiling of scene markers in Unity space"""
+    
+    def __init__(self, positions, marker_json: Callable[[int], Dict],
+                 leaf_size_m: float = 64.0, max_zoom: Optional[int] = None,
+                 lod_grid: int = 16, metadata: Optional[Dict] = None):
+        """Build every level from N×2 (x, z) marker positions
+        
+        marker_json: returns the Unity JSON for a marker index
+        leaf_size_m: smallest tile edge; sets max_zoom unless it is given
+        lod_grid: cells per tile edge when thinning shallower levels
+        metadata: extra keys for tileset.json (e.g. converter_origin)
+        """
+        if lod_grid < 1:
+            raise ValueError("lod_grid must be at least 1")
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        self.marker_json = marker_json
+        self.lod_grid = lod_grid
+        self.metadata = dict(metadata or {})
+        self.marker_count = len(positions)
+        
+        if self.marker_count:
+            low = positions.min(axis=0)
+            high = positions.max(axis=0)
+        else:
+            low = high = np.zeros(2)
+        # Power-of-two extent keeps tile edges on round metre values
+        self.extent = 2.0 ** math.ceil(math.log2(max(float((high - low).max()), leaf_size_m, 1.0)))
+        center = (low + high) / 2.0
+        self.min_x = float(center[0]) - self.extent / 2.0
+        self.max_z = float(center[1]) + self.extent / 2.0
+        if max_zoom is None:
+            max_zoom = max(0, int(math.floor(math.log2(self.extent / leaf_size_m))))
+        if not 0 <= max_zoom <= 24:
+            raise ValueError("max_zoom must be between 0 and 24")
+        self.max_zoom = max_zoom
+        
+        # Offsets from the north-west corner, in units of the whole extent
+        u = (positions[:, 0] - self.min_x) / self.extent
+        v = (self.max_z - positions[:, 1]) / self.extent
+        self._levels = [self._build_level(u, v, zoom) for zoom in range(max_zoom + 1)]
+    
+    @classmethod
+    def from_scenes(cls, scenes: Sequence[ARScene], **kwargs) -> "SceneTilePyramid":
+        """Tile the markers of several scenes; tile markers carry their field_id"""
+        scenes = list(scenes)
+        counts = [len(scene.markers) for scene in scenes]
+        positions = np.empty((sum(counts), 2), dtype=np.float64)
+        offset = 0
+        for scene, count in zip(scenes, counts):
+            if isinstance(scene.markers, MarkerBuffer):
+                positions[offset:offset + count] = scene.markers.positions[:, [0, 2]]
+            elif count:
+                positions[offset:offset + count] = [
+                    (marker.position.x, marker.position.z) for marker in scene.markers]
+            offset += count
+        scene_starts = np.cumsum([0] + counts)
+        cache: Dict[int, List[Dict]] = {}
+        
+        def marker_json(index: int) -> Dict:
+            s = int(np.searchsorted(scene_starts, index, side="right")) - 1
+            markers = cache.get(s)
+            if markers is None:
+                scene = scenes[s]
+                markers = cache[s] = [dict(marker, field_id=scene.field_id)
+                                      for marker in scene.to_dict()["markers"]]
+            return markers[index - scene_starts[s]]
+        
+        return cls(positions, marker_json, **kwargs)
+    
+    def _build_level(self, u: np.ndarray, v: np.ndarray, zoom: int) -> _Level:
+        tiles = 1 << zoom
+        if zoom < self.max_zoom:
+            # Keep the first marker of each LOD cell
+            cells = tiles * self.lod_grid
+            cx = np.clip((u * cells).astype(np.int64), 0, cells - 1)
+            cy = np.clip((v * cells).astype(np.int64), 0, cells - 1)
+            cell = cx * cells + cy
+            order = np.argsort(cell, kind="stable")
+            sorted_cells = cell[order]
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = sorted_cells[1:] != sorted_cells[:-1]
+            members = np.sort(order[first])
+        else:
+            members = np.arange(len(u), dtype=np.int64)
+        tx = np.clip((u[members] * tiles).astype(np.int64), 0, tiles - 1)
+        ty = np.clip((v[members] * tiles).astype(np.int64), 0, tiles - 1)
+        code = (tx << 32) | ty
+        order = np.argsort(code, kind="stable")
+        code = code[order]
+        boundary = np.flatnonzero(code[1:] != code[:-1]) + 1 if len(code) else np.empty(0, np.int64)
+        starts = np.concatenate(([0], boundary, [len(code)])).astype(np.int64)
+        return _Level(code[starts[:-1]], starts, members[order])
+    
+    def tile_size(self, zoom: int) -> float:
+        """Edge length in metres of tiles at a zoom level"""
+        return self.extent / (1 << zoom)
+    
+    def tile_bounds(self, zoom: int, x: int, y: int) -> Dict:
+        size = self.tile_size(zoom)
+        min_x = self.min_x + x * size
+        max_z = self.max_z - y * size
+        return {"min_x": min_x, "min_z": max_z - size, "max_x": min_x + size, "max_z": max_z}
+    
+    def tile_count(self, zoom: int) -> int:
+        """Non-empty tiles at a zoom level"""
+        return len(self._levels[zoom].codes)
+    
+    def tiles(self, zoom: int) -> Iterator[Tuple[int, int, int]]:
+        """(z, x, y) of every non-empty tile at a zoom level"""
+        for code in self._levels[zoom].codes.tolist():
+            yield (zoom, code >> 32, code & 0xFFFFFFFF)
+    
+    def tile_markers(self, zoom: int, x: int, y: int) -> np.ndarray:
+        """Marker indexes in one tile (empty for empty tiles)"""
+        if not 0 <= zoom <= self.max_zoom:
+            return np.empty(0, dtype=np.int64)
+        members = self._levels[zoom].members((x << 32) | y)
+        return members if members is not None else np.empty(0, dtype=np.int64)
+    
+    def tile(self, zoom: int, x: int, y: int) -> Dict:
+        """Tile payload with marker JSON; {} for empty tiles"""
+        members = self.tile_markers(zoom, x, y)
+        if not len(members):
+            return {}
+        marker_json = self.marker_json
+        return {
+            "z": zoom, "x": x, "y": y,
+            "bounds": self.tile_bounds(zoom, x, y),
+            "lod": zoom < self.max_zoom,
+            "markers": [marker_json(i) for i in members.tolist()]
+        }
+    
+    def zoom_for_radius(self, view_radius: float, lod_bias: int = 0) -> int:
+        """Zoom whose tiles are between one and two view radii across
+        
+        A view circle then overlaps at most 3×3 tiles. lod_bias > 0 asks
+        for finer tiles (more detail, more requests).
+        """
+        if view_radius <= 0:
+            return self.max_zoom
+        zoom = int(math.floor(math.log2(self.extent / view_radius))) + lod_bias
+        return min(self.max_zoom, max(0, zoom))
+    
+    def query(self, x: float, z: float, view_radius: float,
+              lod_bias: int = 0) -> Tuple[int, List[Tuple[int, int, int]]]:
+        """Zoom level and non-empty tiles within view_radius of a camera
+        
+        x, z: camera position on the Unity ground plane. Tiles are culled
+        by their distance to the camera, not just their bounding square.
+        """
+        zoom = self.zoom_for_radius(view_radius, lod_bias)
+        tiles = 1 << zoom
+        size = self.tile_size(zoom)
+        level = self._levels[zoom]
+        radius = max(view_radius, 0.0)
+        
+        x0 = max(0, int(math.floor((x - radius - self.min_x) / size)))
+        x1 = min(tiles - 1, int(math.floor((x + radius - self.min_x) / size)))
+        y0 = max(0, int(math.floor((self.max_z - z - radius) / size)))
+        y1 = min(tiles - 1, int(math.floor((self.max_z - z + radius) / size)))
+        visible = []
+        for tx in range(x0, x1 + 1):
+            left = self.min_x + tx * size
+            dx = max(left - x, 0.0, x - (left + size))
+            for ty in range(y0, y1 + 1):
+                top = self.max_z - ty * size
+                dz = max(z - top, 0.0, (top - size) - z)
+                if dx * dx + dz * dz > radius * radius:
+                    continue
+                if level.members((tx << 32) | ty) is not None:
+                    visible.append((zoom, tx, ty))
+        return zoom, visible
+    
+    def tileset(self) -> Dict:
+        """Metadata describing the pyramid (the tileset.json payload)"""
+        tileset = {
+            "format": TILESET_FORMAT,
+            "version": TILESET_VERSION,
+            "extent": self.extent,
+            "origin": {"x": self.min_x, "z": self.max_z},
+            "min_zoom": 0,
+            "max_zoom": self.max_zoom,
+            "lod_grid": self.lod_grid,
+            "marker_count": self.marker_count,
+            "tile_counts": [self.tile_count(zoom) for zoom in range(self.max_zoom + 1)]
+        }
+        tileset.update(self.metadata)
+        return tileset
+    
+    def export(self, directory: str, min_zoom: int = 0,
+               max_zoom: Optional[int] = None) -> Dict:
+        """Write tileset.json and every non-empty {z}/{x}/{y}.json tile
+        
+        Returns the tileset metadata with the number of tiles written.
+        """
+        max_zoom = self.max_zoom if max_zoom is None else min(max_zoom, self.max_zoom)
+        marker_json = self.marker_json
+        # Each marker is encoded once and reused by every tile that shows it
+        encoded: Dict[int, str] = {}
+        written = 0
+        for zoom in range(min_zoom, max_zoom + 1):
+            level = self._levels[zoom]
+            lod = "true" if zoom < self.max_zoom else "false"
+            codes = level.codes.tolist()
+            starts = level.starts.tolist()
+            last_x = None
+            for i, code in enumerate(codes):
+                x, y = code >> 32, code & 0xFFFFFFFF
+                if x != last_x:
+                    column = os.path.join(directory, str(zoom), str(x))
+                    os.makedirs(column, exist_ok=True)
+                    last_x = x
+                parts = []
+                for index in level.order[starts[i]:starts[i + 1]].tolist():
+                    text = encoded.get(index)
+                    if text is None:
+                        text = encoded[index] = json.dumps(marker_json(index),
+                                                           separators=(",", ":"))
+                    parts.append(text)
+                header = json.dumps({"z": zoom, "x": x, "y": y,
+                                     "bounds": self.tile_bounds(zoom, x, y)},
+                                    separators=(",", ":"))
+                with open(os.path.join(column, f"{y}.json"), "w", encoding="utf-8") as f:
+                    f.write(header[:-1])
+                    f.write(f',"lod":{lod},"markers":[')
+                    f.write(",".join(parts))
+                    f.write("]}")
+                written += 1
+        
+        tileset = self.tileset()
+        tileset["min_zoom"] = min_zoom
+        tileset["max_zoom"] = max_zoom
+        tileset["tiles_written"] = written
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "tileset.json"), "w", encoding="utf-8") as f:
+            json.dump(tileset, f, indent=2)
+        return tileset
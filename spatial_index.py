@@ -0,0 +1,204 @@
+"""
+Spatial Index for the Physical Reality layer
+
+Uniform latitude/longitude grid with haversine distances.
+Answers nearest-k and radius queries without scanning every field,
+so the architecture can grow from a handful of Melbourne fields to
+tens of thousands of fields across several cities.
+"""
+
+import heapq
+import math
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180.0
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in meters between two GPS points"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = (math.sin(dphi / 2.0) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2.0) ** 2)
+    return 2.0 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GeoGridIndex:
+    """Bucketed lat/lng grid supporting incremental inserts and removals"""
+
+    def __init__(self, cell_deg: float = 0.01):
+        """Initialize with cell size in degrees (0.01° ≈ 1.1 km of latitude)"""
+        if cell_deg <= 0:
+            raise ValueError("cell_deg must be positive")
+        self.cell_deg = cell_deg
+        self._lng_cells = int(math.ceil(360.0 / cell_deg))
+        self._cells: Dict[Tuple[int, int], Dict[Hashable, Tuple[float, float, object]]] = {}
+        self._locations: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._locations
+
+    def _cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        row = int(math.floor(lat / self.cell_deg))
+        col = int(math.floor((lng + 180.0) / self.cell_deg)) % self._lng_cells
+        return (row, col)
+
+    def insert(self, key: Hashable, lat: float, lng: float, item: object = None):
+        """Insert or move an entry; ``item`` defaults to the key itself"""
+        if key in self._locations:
+            self.remove(key)
+        cell = self._cell_of(lat, lng)
+        self._cells.setdefault(cell, {})[key] = (lat, lng, key if item is None else item)
+        self._locations[key] = cell
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove an entry, returning False if it was not indexed"""
+        cell = self._locations.pop(key, None)
+        if cell is None:
+            return False
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+        return True
+
+    def _ring(self, row: int, col: int, r: int) -> Iterator[Tuple[int, int]]:
+        """Yield the cells on the square ring at Chebyshev distance r"""
+        if r == 0:
+            yield (row, col)
+            return
+        span = min(2 * r + 1, self._lng_cells)
+        for dr in (-r, r):
+            for dc in range(-r, -r + span):
+                yield (row + dr, (col + dc) % self._lng_cells)
+        if 2 * r - 1 >= self._lng_cells:
+            return  # the previous ring already wrapped the full longitude band
+        side_cols = sorted({(col - r) % self._lng_cells, (col + r) % self._lng_cells})
+        for dr in range(-r + 1, r):
+            for side in side_cols:
+                yield (row + dr, side)
+
+    def _ring_min_distance(self, lat: float, r: int) -> float:
+        """Lower bound in meters for any point on ring r+1 or beyond"""
+        if r <= 0:
+            return 0.0
+        far_lat = min(90.0, abs(lat) + (r + 1) * self.cell_deg)
+        lat_m = r * self.cell_deg * METERS_PER_DEGREE
+        lng_m = lat_m * math.cos(math.radians(far_lat))
+        return min(lat_m, lng_m)
+
+    def _ring_index(self, row: int, col: int, cell: Tuple[int, int]) -> int:
+        """Chebyshev ring of ``cell`` around (row, col), wrapping longitude"""
+        dcol = abs(cell[1] - col) % self._lng_cells
+        dcol = min(dcol, self._lng_cells - dcol)
+        return max(abs(cell[0] - row), dcol)
+
+    def nearest(self, lat: float, lng: float, k: int = 1) -> List[Tuple[float, object]]:
+        """Return up to k (distance_m, item) pairs ordered by distance"""
+        if k <= 0 or not self._locations:
+            return []
+        row, col = self._cell_of(lat, lng)
+        best: List[Tuple[float, int, object]] = []  # max-heap on -distance
+        counter = [0, 0]  # items seen, tie-breaker
+
+        def scan(bucket):
+            for p_lat, p_lng, item in bucket.values():
+                counter[0] += 1
+                counter[1] += 1
+                d = haversine_m(lat, lng, p_lat, p_lng)
+                if len(best) < k:
+                    heapq.heappush(best, (-d, counter[1], item))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, counter[1], item))
+
+        def done(r: int) -> bool:
+            if counter[0] >= len(self._locations):
+                return True
+            return len(best) == k and -best[0][0] <= self._ring_min_distance(lat, r)
+
+        # Dense neighbourhoods: walk square rings outward from the query cell
+        r = 0
+        finished = False
+        while max(1, 8 * r) <= len(self._cells):
+            for cell in self._ring(row, col, r):
+                bucket = self._cells.get(cell)
+                if bucket:
+                    scan(bucket)
+            if done(r):
+                finished = True
+                break
+            r += 1
+
+        # Sparse worlds: visit remaining occupied cells in ring order instead
+        if not finished:
+            pending = []
+            for cell in self._cells:
+                ring = self._ring_index(row, col, cell)
+                if ring >= r:
+                    pending.append((ring, cell))
+            pending.sort()
+            for ring, cell in pending:
+                if len(best) == k and -best[0][0] <= self._ring_min_distance(lat, ring - 1):
+                    break
+                scan(self._cells[cell])
+
+        return [(-neg, item) for neg, _, item in sorted(best, key=lambda e: (-e[0], e[1]))]
+
+    def within(self, lat: float, lng: float, radius_m: float) -> List[Tuple[float, object]]:
+        """Return all (distance_m, item) pairs within radius_m, nearest first"""
+        if radius_m < 0 or not self._locations:
+            return []
+        lat_span = radius_m / METERS_PER_DEGREE
+        far_lat = min(90.0, abs(lat) + lat_span)
+        cos_lat = math.cos(math.radians(far_lat))
+        if cos_lat < 1e-9:
+            lng_span = 360.0
+        else:
+            lng_span = min(360.0, lat_span / cos_lat)
+
+        row_lo = int(math.floor((lat - lat_span) / self.cell_deg))
+        row_hi = int(math.floor((lat + lat_span) / self.cell_deg))
+        col_lo = int(math.floor((lng - lng_span + 180.0) / self.cell_deg))
+        col_hi = int(math.floor((lng + lng_span + 180.0) / self.cell_deg))
+        if col_hi - col_lo + 1 >= self._lng_cells:
+            cols = range(self._lng_cells)
+        else:
+            cols = [c % self._lng_cells for c in range(col_lo, col_hi + 1)]
+
+        results = []
+        # Sparse worlds: walking occupied cells beats walking a huge window
+        if (row_hi - row_lo + 1) * len(cols) > len(self._cells):
+            col_set = set(cols)
+            cells = [c for c in self._cells
+                     if row_lo <= c[0] <= row_hi and c[1] in col_set]
+        else:
+            cells = [(r, c) for r in range(row_lo, row_hi + 1) for c in cols]
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if not bucket:
+                continue
+            for p_lat, p_lng, item in bucket.values():
+                d = haversine_m(lat, lng, p_lat, p_lng)
+                if d <= radius_m:
+                    results.append((d, item))
+        results.sort(key=lambda e: e[0])
+        return results
+
+    def clear(self):
+        """Drop every entry"""
+        self._cells.clear()
+        self._locations.clear()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """Return the item stored under key, if any"""
+        cell = self._locations.get(key)
+        if cell is None:
+            return None
+        return self._cells[cell][key][2]
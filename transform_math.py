@@ -0,0 +1,170 @@
+"""
+Transform Math
+
+Batched vector and quaternion kernels for marker transforms. Every
+function takes N×3 vectors or N×4 (x, y, z, w) quaternions, or single
+ones, and broadcasts like NumPy, so orienting or moving thousands of
+markers is one call instead of a Python loop per marker.
+
+Conventions follow Unity: left-handed, y up, z forward. q1 * q2 applies
+q2 first, and look rotations turn +z toward the forward vector. Results
+are float64 arrays. Vector3 and Quaternion in unity_ar do the same math
+for single values in plain Python, which is faster for one marker.
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+
+ArrayLike = Union[np.ndarray, Sequence[float], Sequence[Sequence[float]]]
+
+IDENTITY = np.array([0.0, 0.0, 0.0, 1.0])
+UP = np.array([0.0, 1.0, 0.0])
+
+# Below this length a direction is treated as zero
+_EPSILON = 1e-9
+
+
+def normalize(vectors: ArrayLike) -> np.ndarray:
+    """Unit vectors (or quaternions) along the last axis; zero rows stay zero"""
+    vectors = np.asarray(vectors, dtype=np.float64)
+    length = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, length, out=np.zeros_like(vectors), where=length > _EPSILON)
+
+
+def distances(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Euclidean distance between matching rows of a and b"""
+    difference = np.asarray(a, dtype=np.float64) - np.asarray(b, dtype=np.float64)
+    return np.sqrt(np.einsum("...i,...i->...", difference, difference))
+
+
+def pairwise_distances(a: ArrayLike, b: Optional[ArrayLike] = None) -> np.ndarray:
+    """N×M matrix of distances between every row of a and every row of b
+    
+    With b omitted, distances within a (zero diagonal). Uses the
+    |a|² + |b|² - 2a·b expansion on coordinates centred on a's mean,
+    which keeps it accurate for Unity positions far from the origin.
+    """
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 3)
+    same = b is None
+    b = a if same else np.asarray(b, dtype=np.float64).reshape(-1, 3)
+    center = a.mean(axis=0) if len(a) else np.zeros(3)
+    a = a - center
+    b = a if same else b - center
+    squared = (np.einsum("ij,ij->i", a, a)[:, None] + np.einsum("ij,ij->i", b, b)[None, :]
+               - 2.0 * (a @ b.T))
+    np.maximum(squared, 0.0, out=squared)
+    if same:
+        np.fill_diagonal(squared, 0.0)
+    return np.sqrt(squared, out=squared)
+
+
+def quat_multiply(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Hamilton product a * b (rotate by b, then by a)"""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    ax, ay, az, aw = np.moveaxis(a, -1, 0)
+    bx, by, bz, bw = np.moveaxis(b, -1, 0)
+    return np.stack([aw * bx + ax * bw + ay * bz - az * by,
+                     aw * by - ax * bz + ay * bw + az * bx,
+                     aw * bz + ax * by - ay * bx + az * bw,
+                     aw * bw - ax * bx - ay * by - az * bz], axis=-1)
+
+
+def quat_conjugate(q: ArrayLike) -> np.ndarray:
+    """Inverse rotation of unit quaternions"""
+    q = np.array(q, dtype=np.float64)
+    q[..., :3] *= -1.0
+    return q
+
+
+def quat_rotate(q: ArrayLike, vectors: ArrayLike) -> np.ndarray:
+    """Rotate vectors by unit quaternions (Unity's q * v)"""
+    q = np.asarray(q, dtype=np.float64)
+    vectors = np.asarray(vectors, dtype=np.float64)
+    u = q[..., :3]
+    t = 2.0 * np.cross(u, vectors)
+    return vectors + q[..., 3:] * t + np.cross(u, t)
+
+
+def look_rotation(forward: ArrayLike, up: ArrayLike = UP) -> np.ndarray:
+    """Rotations turning +z toward forward with +y as close to up as possible
+    
+    Matches Unity's Quaternion.LookRotation. Zero forward vectors give the
+    identity; forward parallel to up falls back to +z (or +x) as up.
+    """
+    forward = normalize(forward)
+    up = np.broadcast_to(np.asarray(up, dtype=np.float64), forward.shape)
+    right = np.cross(up, forward)
+    length = np.linalg.norm(right, axis=-1, keepdims=True)
+    parallel = length[..., 0] <= _EPSILON
+    if np.any(parallel):
+        # Any up that is not parallel to forward will do
+        fallback = np.where(np.abs(forward[..., 2:3]) < 0.9, [0.0, 0.0, 1.0], [1.0, 0.0, 0.0])
+        right = np.where(parallel[..., None], np.cross(fallback, forward), right)
+        length = np.linalg.norm(right, axis=-1, keepdims=True)
+    right = np.divide(right, length, out=np.zeros_like(right), where=length > _EPSILON)
+    up = np.cross(forward, right)
+    
+    # Rotation matrix with columns right, up, forward to quaternion. Each
+    # row uses the formula built on its largest component, for stability.
+    m00, m10, m20 = np.moveaxis(right, -1, 0)
+    m01, m11, m21 = np.moveaxis(up, -1, 0)
+    m02, m12, m22 = np.moveaxis(forward, -1, 0)
+    squares = np.stack([1.0 + m00 - m11 - m22, 1.0 - m00 + m11 - m22,
+                        1.0 - m00 - m11 + m22, 1.0 + m00 + m11 + m22], axis=-1)
+    s = 2.0 * np.sqrt(np.maximum(squares, _EPSILON))
+    sx, sy, sz, sw = np.moveaxis(s, -1, 0)
+    candidates = np.stack([
+        np.stack([sx / 4, (m01 + m10) / sx, (m02 + m20) / sx, (m21 - m12) / sx], axis=-1),
+        np.stack([(m01 + m10) / sy, sy / 4, (m12 + m21) / sy, (m02 - m20) / sy], axis=-1),
+        np.stack([(m02 + m20) / sz, (m12 + m21) / sz, sz / 4, (m10 - m01) / sz], axis=-1),
+        np.stack([(m21 - m12) / sw, (m02 - m20) / sw, (m10 - m01) / sw, sw / 4], axis=-1),
+    ], axis=-2)
+    best = np.argmax(squares, axis=-1)[..., None, None]
+    q = np.take_along_axis(candidates, best, axis=-2)[..., 0, :]
+    zero = np.linalg.norm(forward, axis=-1) <= _EPSILON
+    if np.any(zero):
+        q = np.where(zero[..., None], IDENTITY, q)
+    return normalize(q)
+
+
+def look_at(positions: ArrayLike, targets: ArrayLike, up: ArrayLike = UP) -> np.ndarray:
+    """Rotations turning markers at positions toward targets"""
+    return look_rotation(np.asarray(targets, dtype=np.float64)
+                         - np.asarray(positions, dtype=np.float64), up)
+
+
+def quat_slerp(a: ArrayLike, b: ArrayLike, t: Union[float, ArrayLike]) -> np.ndarray:
+    """Spherical interpolation from a (t = 0) to b (t = 1) along the shorter arc"""
+    a = normalize(a)
+    b = normalize(b)
+    t = np.asarray(t, dtype=np.float64)[..., None]
+    dot = np.einsum("...i,...i->...", a, b)[..., None]
+    b = np.where(dot < 0.0, -b, b)
+    dot = np.abs(dot)
+    # Nearly equal rotations: fall back to normalized linear interpolation
+    close = dot > 0.9995
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.where(close, 1.0, np.sin(theta))
+    wa = np.where(close, 1.0 - t, np.sin((1.0 - t) * theta) / sin_theta)
+    wb = np.where(close, t, np.sin(t * theta) / sin_theta)
+    return normalize(wa * a + wb * b)
+
+
+def apply_transform(positions: ArrayLike, rotations: ArrayLike, scales: ArrayLike,
+                    translation: ArrayLike = (0.0, 0.0, 0.0),
+                    rotation: ArrayLike = IDENTITY,
+                    scale: Union[float, ArrayLike] = 1.0):
+    """Move marker transforms into a parent (field-level) frame
+    
+    Returns (positions, rotations, scales) after scaling, then rotating,
+    then translating by the parent transform. A uniform scale is exact;
+    a per-axis scale is applied to marker scales component-wise.
+    """
+    scale = np.asarray(scale, dtype=np.float64)
+    positions = quat_rotate(rotation, np.asarray(positions, dtype=np.float64) * scale)
+    positions += np.asarray(translation, dtype=np.float64)
+    return (positions, quat_multiply(rotation, rotations),
+            np.asarray(scales, dtype=np.float64) * scale)
@@ -5,10 +5,24 @@ Digital Overlay connecting physical reality to AR visualization.
 Manages AR markers, 3D transformations, and real-time geometry rendering.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from enum import Enum
+import hashlib
+import json
 import math
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from metrics import MetricsRegistry
+from spatial_index import GeoGridIndex
+import transform_math
 
 
 class ARMarkerType(Enum):
@@ -29,6 +43,9 @@ class Vector3:
     def to_dict(self) -> Dict:
         return {"x": self.x, "y": self.y, "z": self.z}
     
+    def to_tuple(self) -> Tuple[float, float, float]:
+        return (self.x, self.y, self.z)
+    
     def distance_to(self, other: 'Vector3') -> float:
         """Calculate Euclidean distance to another vector"""
         dx = self.x - other.x
@@ -37,9 +54,28 @@ class Vector3:
         return math.sqrt(dx*dx + dy*dy + dz*dz)
 
 
+# Scalar helpers for single vectors; transform_math has the batched kernels
+_EPSILON = 1e-9
+
+
+def _cross(a: Tuple, b: Tuple) -> Tuple[float, float, float]:
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _unit(v: Tuple[float, ...]) -> Tuple[float, ...]:
+    length = math.sqrt(sum(c * c for c in v))
+    if length <= _EPSILON:
+        return tuple(0.0 for _ in v)
+    return tuple(c / length for c in v)
+
+
 @dataclass
 class Quaternion:
-    """Quaternion for Unity rotation"""
+    """Quaternion for Unity rotation
+    
+    Single-value math is plain Python; use transform_math to rotate or
+    orient many markers at once.
+    """
     x: float
     y: float
     z: float
@@ -47,6 +83,83 @@ class Quaternion:
     
     def to_dict(self) -> Dict:
         return {"x": self.x, "y": self.y, "z": self.z, "w": self.w}
+    
+    def to_tuple(self) -> Tuple[float, float, float, float]:
+        return (self.x, self.y, self.z, self.w)
+    
+    def __mul__(self, other: 'Quaternion') -> 'Quaternion':
+        """Rotation by other, then by self (Unity's a * b)"""
+        ax, ay, az, aw = self.x, self.y, self.z, self.w
+        bx, by, bz, bw = other.x, other.y, other.z, other.w
+        return Quaternion(aw * bx + ax * bw + ay * bz - az * by,
+                          aw * by - ax * bz + ay * bw + az * bx,
+                          aw * bz + ax * by - ay * bx + az * bw,
+                          aw * bw - ax * bx - ay * by - az * bz)
+    
+    def rotate(self, vector: Vector3) -> Vector3:
+        """Rotate a vector (Unity's q * v)"""
+        u = (self.x, self.y, self.z)
+        v = vector.to_tuple()
+        t = tuple(2.0 * c for c in _cross(u, v))
+        ut = _cross(u, t)
+        return Vector3(v[0] + self.w * t[0] + ut[0],
+                       v[1] + self.w * t[1] + ut[1],
+                       v[2] + self.w * t[2] + ut[2])
+    
+    def slerp(self, other: 'Quaternion', t: float) -> 'Quaternion':
+        """Spherical interpolation toward other"""
+        a = _unit(self.to_tuple())
+        b = _unit(other.to_tuple())
+        dot = sum(p * q for p, q in zip(a, b))
+        if dot < 0.0:
+            # Take the shorter arc
+            b = tuple(-q for q in b)
+            dot = -dot
+        if dot > 0.9995:
+            # Nearly equal rotations: normalized linear interpolation
+            wa, wb = 1.0 - t, t
+        else:
+            theta = math.acos(min(dot, 1.0))
+            sin_theta = math.sin(theta)
+            wa = math.sin((1.0 - t) * theta) / sin_theta
+            wb = math.sin(t * theta) / sin_theta
+        return Quaternion(*_unit(tuple(wa * p + wb * q for p, q in zip(a, b))))
+    
+    @staticmethod
+    def look_rotation(forward: Vector3, up: Optional[Vector3] = None) -> 'Quaternion':
+        """Rotation turning +z toward forward (Unity's Quaternion.LookRotation)
+        
+        up defaults to +y. Zero forward vectors give the identity.
+        """
+        forward = _unit(forward.to_tuple())
+        if forward == (0.0, 0.0, 0.0):
+            return Quaternion(0.0, 0.0, 0.0, 1.0)
+        up = (0.0, 1.0, 0.0) if up is None else up.to_tuple()
+        right = _unit(_cross(up, forward))
+        if right == (0.0, 0.0, 0.0):
+            # Forward parallel to up: any other up will do
+            fallback = (0.0, 0.0, 1.0) if abs(forward[2]) < 0.9 else (1.0, 0.0, 0.0)
+            right = _unit(_cross(fallback, forward))
+        up = _cross(forward, right)
+        
+        # Rotation matrix with columns right, up, forward to quaternion,
+        # using the formula built on the largest component for stability
+        m00, m10, m20 = right
+        m01, m11, m21 = up
+        m02, m12, m22 = forward
+        squares = (1.0 + m00 - m11 - m22, 1.0 - m00 + m11 - m22,
+                   1.0 - m00 - m11 + m22, 1.0 + m00 + m11 + m22)
+        best = squares.index(max(squares))
+        s = 2.0 * math.sqrt(max(squares[best], _EPSILON))
+        if best == 0:
+            q = (s / 4, (m01 + m10) / s, (m02 + m20) / s, (m21 - m12) / s)
+        elif best == 1:
+            q = ((m01 + m10) / s, s / 4, (m12 + m21) / s, (m02 - m20) / s)
+        elif best == 2:
+            q = ((m02 + m20) / s, (m12 + m21) / s, s / 4, (m10 - m01) / s)
+        else:
+            q = ((m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s, s / 4)
+        return Quaternion(*_unit(q))
 
 
 @dataclass
@@ -73,18 +186,265 @@ class ARMarker:
         }
 
 
+class MarkerBuffer:
+    """Struct-of-arrays storage for many AR markers
+    
+    Transforms live in contiguous float32 arrays (N×3 position, N×4
+    rotation, N×3 scale); ids are interned strings and marker types,
+    geometry types and layers are small-integer indexes into shared
+    tables. Indexing or iterating yields ARMarker views built on demand,
+    so existing callers keep working. Views are snapshots: write through
+    set_transform() rather than mutating a view.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        capacity = max(1, capacity)
+        self._count = 0
+        self._positions = np.zeros((capacity, 3), dtype=np.float32)
+        self._rotations = np.zeros((capacity, 4), dtype=np.float32)
+        self._scales = np.zeros((capacity, 3), dtype=np.float32)
+        self._type_index = np.zeros(capacity, dtype=np.uint16)
+        self._geometry_index = np.zeros(capacity, dtype=np.uint16)
+        self._layer_index = np.zeros(capacity, dtype=np.uint16)
+        self.ids: List[str] = []
+        self.marker_types: List[ARMarkerType] = []
+        self.geometry_types: List[str] = []
+        self.layers: List[str] = []
+        self._marker_type_lookup: Dict[ARMarkerType, int] = {}
+        self._geometry_lookup: Dict[str, int] = {}
+        self._layer_lookup: Dict[str, int] = {}
+        # Metadata beyond geometry_type/layer, kept sparsely by row
+        self._extra_metadata: Dict[int, Dict] = {}
+    
+    @classmethod
+    def from_markers(cls, markers: Sequence[ARMarker]) -> 'MarkerBuffer':
+        """Pack existing ARMarker objects into a buffer"""
+        buffer = cls(len(markers))
+        for marker in markers:
+            buffer.append_marker(marker)
+        return buffer
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("marker index out of range")
+        return self._view(index)
+    
+    def __iter__(self) -> Iterator[ARMarker]:
+        for i in range(self._count):
+            yield self._view(i)
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """N×3 float32 positions (a view, not a copy)"""
+        return self._positions[:self._count]
+    
+    @property
+    def rotations(self) -> np.ndarray:
+        """N×4 float32 (x, y, z, w) rotations (a view, not a copy)"""
+        return self._rotations[:self._count]
+    
+    @property
+    def scales(self) -> np.ndarray:
+        """N×3 float32 scales (a view, not a copy)"""
+        return self._scales[:self._count]
+    
+    @property
+    def type_index(self) -> np.ndarray:
+        """Per-marker index into marker_types"""
+        return self._type_index[:self._count]
+    
+    @property
+    def geometry_index(self) -> np.ndarray:
+        """Per-marker index into geometry_types"""
+        return self._geometry_index[:self._count]
+    
+    @property
+    def layer_index(self) -> np.ndarray:
+        """Per-marker index into layers"""
+        return self._layer_index[:self._count]
+    
+    @property
+    def extra_metadata(self) -> Dict[int, Dict]:
+        """Metadata beyond geometry_type/layer, by row (sparse)"""
+        return self._extra_metadata
+    
+    @staticmethod
+    def _intern(table: List, lookup: Dict, value) -> int:
+        index = lookup.get(value)
+        if index is None:
+            index = len(table)
+            if index > 0xFFFF:
+                raise ValueError("MarkerBuffer supports at most 65536 distinct values per table")
+            table.append(value)
+            lookup[value] = index
+        return index
+    
+    def _grow(self):
+        capacity = len(self._positions) * 2
+        for name in ("_positions", "_rotations", "_scales",
+                     "_type_index", "_geometry_index", "_layer_index"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._count] = old[:self._count]
+            setattr(self, name, new)
+    
+    def append(self, marker_id: str, marker_type: ARMarkerType,
+               position: Tuple[float, float, float],
+               rotation: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0),
+               scale: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+               geometry_type: str = "", layer: str = "",
+               extra_metadata: Optional[Dict] = None) -> int:
+        """Append one marker and return its row index"""
+        if self._count == len(self._positions):
+            self._grow()
+        row = self._count
+        self._positions[row] = position
+        self._rotations[row] = rotation
+        self._scales[row] = scale
+        self._type_index[row] = self._intern(
+            self.marker_types, self._marker_type_lookup, marker_type)
+        self._geometry_index[row] = self._intern(
+            self.geometry_types, self._geometry_lookup, sys.intern(geometry_type))
+        self._layer_index[row] = self._intern(
+            self.layers, self._layer_lookup, sys.intern(layer))
+        self.ids.append(sys.intern(marker_id))
+        if extra_metadata:
+            self._extra_metadata[row] = dict(extra_metadata)
+        self._count += 1
+        return row
+    
+    def append_marker(self, marker: ARMarker) -> int:
+        """Append a copy of an ARMarker"""
+        metadata = dict(marker.metadata)
+        geometry_type = metadata.pop("geometry_type", "")
+        layer = metadata.pop("layer", "")
+        return self.append(
+            marker.id,
+            marker.marker_type,
+            (marker.position.x, marker.position.y, marker.position.z),
+            (marker.rotation.x, marker.rotation.y, marker.rotation.z, marker.rotation.w),
+            (marker.scale.x, marker.scale.y, marker.scale.z),
+            geometry_type,
+            layer,
+            metadata
+        )
+    
+    def set_transform(self, index: int, position: Optional[Tuple[float, float, float]] = None,
+                      rotation: Optional[Tuple[float, float, float, float]] = None,
+                      scale: Optional[Tuple[float, float, float]] = None):
+        """Overwrite parts of one marker's transform in place"""
+        if not 0 <= index < self._count:
+            raise IndexError("marker index out of range")
+        if position is not None:
+            self._positions[index] = position
+        if rotation is not None:
+            self._rotations[index] = rotation
+        if scale is not None:
+            self._scales[index] = scale
+    
+    def look_at(self, target: Tuple[float, float, float],
+                up: Tuple[float, float, float] = (0.0, 1.0, 0.0)):
+        """Turn every marker's +z toward target (e.g. a character anchor) in place"""
+        self.rotations[:] = transform_math.look_at(self.positions, target, up)
+    
+    def apply_transform(self, translation: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+                        rotation: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0),
+                        scale: float = 1.0):
+        """Move every marker by a field-level transform in place"""
+        positions, rotations, scales = transform_math.apply_transform(
+            self.positions, self.rotations, self.scales, translation, rotation, scale)
+        self.positions[:] = positions
+        self.rotations[:] = rotations
+        self.scales[:] = scales
+    
+    def _metadata(self, index: int) -> Dict:
+        metadata = {
+            "geometry_type": self.geometry_types[self._geometry_index[index]],
+            "layer": self.layers[self._layer_index[index]]
+        }
+        extra = self._extra_metadata.get(index)
+        if extra:
+            metadata.update(extra)
+        return metadata
+    
+    def _view(self, index: int) -> ARMarker:
+        px, py, pz = self._positions[index].tolist()
+        rx, ry, rz, rw = self._rotations[index].tolist()
+        sx, sy, sz = self._scales[index].tolist()
+        return ARMarker(
+            id=self.ids[index],
+            marker_type=self.marker_types[self._type_index[index]],
+            position=Vector3(px, py, pz),
+            rotation=Quaternion(rx, ry, rz, rw),
+            scale=Vector3(sx, sy, sz),
+            metadata=self._metadata(index)
+        )
+    
+    def to_unity_json(self) -> List[Dict]:
+        """Unity JSON for every marker, without building ARMarker views"""
+        n = self._count
+        positions = self.positions.tolist()
+        rotations = self.rotations.tolist()
+        scales = self.scales.tolist()
+        type_values = [marker_type.value for marker_type in self.marker_types]
+        type_index = self._type_index[:n].tolist()
+        geometry_index = self._geometry_index[:n].tolist()
+        layer_index = self._layer_index[:n].tolist()
+        result = []
+        for i in range(n):
+            px, py, pz = positions[i]
+            rx, ry, rz, rw = rotations[i]
+            sx, sy, sz = scales[i]
+            metadata = {
+                "geometry_type": self.geometry_types[geometry_index[i]],
+                "layer": self.layers[layer_index[i]]
+            }
+            extra = self._extra_metadata.get(i)
+            if extra:
+                metadata.update(extra)
+            result.append({
+                "id": self.ids[i],
+                "type": type_values[type_index[i]],
+                "transform": {
+                    "position": {"x": px, "y": py, "z": pz},
+                    "rotation": {"x": rx, "y": ry, "z": rz, "w": rw},
+                    "scale": {"x": sx, "y": sy, "z": sz}
+                },
+                "metadata": metadata
+            })
+        return result
+
+
 @dataclass
 class ARScene:
-    """AR scene configuration for a field"""
+    """AR scene configuration for a field
+    
+    geometry_prefabs has one entry per marker. When prefab_refs is set,
+    entry i is the shared registry definition prefab_refs[i] (read-only).
+    """
     field_id: str
-    markers: List[ARMarker]
+    markers: Union[List[ARMarker], MarkerBuffer]
     ambient_lighting: Dict
     geometry_prefabs: List[Dict]
+    prefab_refs: Optional[List[int]] = None
+    # Name of the regional origin whose frame the markers are in (None: default)
+    origin: Optional[str] = None
     
     def to_dict(self) -> Dict:
+        if isinstance(self.markers, MarkerBuffer):
+            markers = self.markers.to_unity_json()
+        else:
+            markers = [marker.to_unity_json() for marker in self.markers]
         return {
             "field_id": self.field_id,
-            "markers": [marker.to_unity_json() for marker in self.markers],
+            "markers": markers,
             "ambient_lighting": self.ambient_lighting,
             "geometry_prefabs": self.geometry_prefabs
         }
@@ -125,6 +485,84 @@ class GeometryRenderer:
             "material": "Sacred_Geometry_Material",
             "shader": "Custom/HolographicGeometry"
         }
+    
+    @staticmethod
+    def create_geometry_mesh(geometry_type: str, lod: int = 0, scale: float = 1.0):
+        """Procedural mesh for a geometry type (memoized, see geometry_mesh)"""
+        from geometry_mesh import MESH_GENERATOR
+        return MESH_GENERATOR.mesh(geometry_type, lod, scale)
+
+
+class PrefabRegistry:
+    """Interns prefab definitions by content
+    
+    Each distinct definition is stored once and identified by its index,
+    so scenes can reference prefabs by index and share the definition
+    dicts instead of repeating them per node.
+    """
+    
+    def __init__(self):
+        self.definitions: List[Dict] = []
+        self._index: Dict[Tuple, int] = {}
+        self._geometry_index: Dict[Tuple[str, float], int] = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.definitions)
+    
+    def __getitem__(self, index: int) -> Dict:
+        return self.definitions[index]
+    
+    @staticmethod
+    def _key(prefab: Dict) -> Tuple:
+        try:
+            return tuple(sorted(prefab.items()))
+        except TypeError:
+            # Nested values: fall back to canonical JSON
+            return (json.dumps(prefab, sort_keys=True),)
+    
+    def intern(self, prefab: Dict) -> int:
+        """Index of a definition equal to prefab, registering it if new"""
+        key = self._key(prefab)
+        index = self._index.get(key)
+        if index is None:
+            with self._lock:
+                index = self._index.get(key)
+                if index is None:
+                    index = len(self.definitions)
+                    self.definitions.append(dict(prefab))
+                    self._index[key] = index
+        return index
+    
+    def geometry(self, geometry_type: str, scale: float = 1.0) -> int:
+        """Index of GeometryRenderer's prefab for a geometry type"""
+        index = self._geometry_index.get((geometry_type, scale))
+        if index is None:
+            index = self.intern(GeometryRenderer.create_geometry_prefab(geometry_type, scale))
+            self._geometry_index[(geometry_type, scale)] = index
+        return index
+    
+    def to_list(self) -> List[Dict]:
+        """Every definition, each with its registry index"""
+        return [dict(definition, index=index)
+                for index, definition in enumerate(self.definitions)]
+
+
+# Shared by every bridge unless one is given its own
+PREFAB_REGISTRY = PrefabRegistry()
+
+# Graphics.DrawMeshInstanced draws at most this many instances per call
+MAX_INSTANCES_PER_BATCH = 1023
+
+
+def meters_per_degree(latitude: float) -> Tuple[float, float]:
+    """Meters per degree of (latitude, longitude) on the WGS84 ellipsoid"""
+    phi = math.radians(latitude)
+    meters_per_lat = (111132.92 - 559.82 * math.cos(2 * phi)
+                      + 1.175 * math.cos(4 * phi) - 0.0023 * math.cos(6 * phi))
+    meters_per_lng = (111412.84 * math.cos(phi) - 93.5 * math.cos(3 * phi)
+                      + 0.118 * math.cos(5 * phi))
+    return meters_per_lat, meters_per_lng
 
 
 class GPSToARConverter:
@@ -134,67 +572,320 @@ class GPSToARConverter:
         """Initialize with origin point (reference location)"""
         self.origin_lat = origin_lat
         self.origin_lng = origin_lng
+        # Local tangent plane scaled at the origin's latitude
+        self.meters_per_lat, self.meters_per_lng = meters_per_degree(origin_lat)
     
     def gps_to_unity(self, lat: float, lng: float, altitude: float = 0.0) -> Vector3:
         """Convert GPS coordinates to Unity world coordinates"""
-        # Approximate conversion (meters per degree at Melbourne's latitude)
-        meters_per_lat = 111320.0
-        meters_per_lng = 88834.0  # At ~38° S latitude
-        
         # Calculate offset from origin
-        x = (lng - self.origin_lng) * meters_per_lng
-        z = (lat - self.origin_lat) * meters_per_lat
+        x = (lng - self.origin_lng) * self.meters_per_lng
+        z = (lat - self.origin_lat) * self.meters_per_lat
         y = altitude
         
         return Vector3(x, y, z)
     
     def unity_to_gps(self, position: Vector3) -> Tuple[float, float, float]:
         """Convert Unity world coordinates back to GPS"""
-        meters_per_lat = 111320.0
-        meters_per_lng = 88834.0
-        
-        lat = self.origin_lat + (position.z / meters_per_lat)
-        lng = self.origin_lng + (position.x / meters_per_lng)
+        lat = self.origin_lat + (position.z / self.meters_per_lat)
+        lng = self.origin_lng + (position.x / self.meters_per_lng)
         altitude = position.y
         
         return (lat, lng, altitude)
+    
+    def gps_to_unity_batch(self, coords) -> np.ndarray:
+        """Convert an N×2 (lat, lng) or N×3 (lat, lng, alt) array to N×3 (x, y, z)"""
+        coords = np.asarray(coords, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError(f"expected an N×2 or N×3 array, got shape {coords.shape}")
+        out = np.empty((coords.shape[0], 3), dtype=np.float64)
+        np.subtract(coords[:, 1], self.origin_lng, out=out[:, 0])
+        out[:, 0] *= self.meters_per_lng
+        if coords.shape[1] == 3:
+            out[:, 1] = coords[:, 2]
+        else:
+            out[:, 1] = 0.0
+        np.subtract(coords[:, 0], self.origin_lat, out=out[:, 2])
+        out[:, 2] *= self.meters_per_lat
+        return out
+    
+    def unity_to_gps_batch(self, positions) -> np.ndarray:
+        """Convert an N×3 (x, y, z) array back to N×3 (lat, lng, alt)"""
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError(f"expected an N×3 array, got shape {positions.shape}")
+        out = np.empty_like(positions)
+        np.divide(positions[:, 2], self.meters_per_lat, out=out[:, 0])
+        out[:, 0] += self.origin_lat
+        np.divide(positions[:, 0], self.meters_per_lng, out=out[:, 1])
+        out[:, 1] += self.origin_lng
+        out[:, 2] = positions[:, 1]
+        return out
+
+
+class OriginRegistry:
+    """Named regional AR origins with nearest-origin lookup
+    
+    Each origin has one GPSToARConverter, built on first use and cached,
+    so scenes in every city are converted around a nearby origin and keep
+    small, float32-exact Unity coordinates.
+    """
+    
+    def __init__(self, origins: Optional[Dict[str, Tuple[float, float]]] = None,
+                 cell_deg: float = 1.0):
+        """Initialize with {name: (lat, lng)}; cell_deg sizes the lookup grid"""
+        self._index = GeoGridIndex(cell_deg)
+        self._origins: Dict[str, Tuple[float, float]] = {}
+        self._converters: Dict[str, GPSToARConverter] = {}
+        for name, (lat, lng) in (origins or {}).items():
+            self.add(name, lat, lng)
+    
+    def __len__(self) -> int:
+        return len(self._origins)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._origins
+    
+    def add(self, name: str, lat: float, lng: float):
+        """Add an origin, or move an existing one"""
+        self._origins[name] = (lat, lng)
+        self._converters.pop(name, None)
+        self._index.insert(name, lat, lng, name)
+    
+    def nearest(self, lat: float, lng: float) -> Optional[str]:
+        """Name of the origin closest to a GPS point (None when empty)"""
+        found = self._index.nearest(lat, lng, k=1)
+        return found[0][1] if found else None
+    
+    def converter(self, name: str) -> GPSToARConverter:
+        """Cached converter for an origin"""
+        converter = self._converters.get(name)
+        if converter is None:
+            lat, lng = self._origins[name]
+            converter = self._converters[name] = GPSToARConverter(lat, lng)
+        return converter
+    
+    def to_dict(self) -> Dict[str, Tuple[float, float]]:
+        """{name: (lat, lng)}, e.g. to rebuild the registry in a worker process"""
+        return dict(self._origins)
+
+
+def marker_transforms(markers: Union[List[ARMarker], MarkerBuffer]
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """N×3 positions, N×4 rotations (xyzw) and N×3 scales of a scene's markers"""
+    if isinstance(markers, MarkerBuffer):
+        return markers.positions, markers.rotations, markers.scales
+    positions = np.array([(m.position.x, m.position.y, m.position.z) for m in markers],
+                         dtype=np.float64).reshape(-1, 3)
+    rotations = np.array([(m.rotation.x, m.rotation.y, m.rotation.z, m.rotation.w)
+                          for m in markers], dtype=np.float64).reshape(-1, 4)
+    scales = np.array([(m.scale.x, m.scale.y, m.scale.z) for m in markers],
+                      dtype=np.float64).reshape(-1, 3)
+    return positions, rotations, scales
+
+
+def marker_ids_and_layers(markers: Union[List[ARMarker], MarkerBuffer]
+                          ) -> Tuple[List[str], List[str]]:
+    """Marker ids and layer names, in marker order"""
+    if isinstance(markers, MarkerBuffer):
+        layer_names = markers.layers
+        return markers.ids, [layer_names[i] for i in markers.layer_index.tolist()]
+    return [m.id for m in markers], [m.metadata.get("layer", "") for m in markers]
+
+
+def field_content_hash(field_data: Dict) -> str:
+    """Stable content hash of a field dict (key order independent)"""
+    canonical = json.dumps(field_data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("ascii")).hexdigest()
+
+
+def _diff_keyed(old_items: List[Dict], new_items: List[Dict], key: str) -> Dict:
+    old = {item[key]: item for item in old_items}
+    new = {item[key]: item for item in new_items}
+    return {
+        "added": [item for item_key, item in new.items() if item_key not in old],
+        "updated": [item for item_key, item in new.items()
+                    if item_key in old and old[item_key] != item],
+        "removed": [item_key for item_key in old if item_key not in new]
+    }
+
+
+def diff_markers(old_markers: List[Dict], new_markers: List[Dict]) -> Dict:
+    """Marker-level delta between two lists of Unity marker JSON, matched by id"""
+    return _diff_keyed(old_markers, new_markers, "id")
+
+
+def diff_prefabs(old_prefabs: List[Dict], new_prefabs: List[Dict]) -> Dict:
+    """Prefab delta matched by geometry_type (one prefab per type)"""
+    return _diff_keyed(old_prefabs, new_prefabs, "geometry_type")
+
+
+def _create_scene_chunk(origin_lat: float, origin_lng: float, compact_markers: bool,
+                        origins: Optional[Dict[str, Tuple[float, float]]],
+                        field_chunk: List[Dict]) -> List[ARScene]:
+    """Pool worker: build scenes for a chunk of fields with a private bridge"""
+    bridge = UnityARBridge(origin_lat, origin_lng, compact_markers=compact_markers,
+                           origins=origins)
+    return [bridge.create_field_scene(field_data) for field_data in field_chunk]
 
 
 class UnityARBridge:
     """Bridge between FIELD backend and Unity AR"""
     
-    def __init__(self, origin_lat: float = -37.8179, origin_lng: float = 144.9690):
-        """Initialize with Melbourne's Federation Square as origin"""
+    # Below this many fields, "auto" uses threads to avoid process start-up cost
+    PROCESS_POOL_MIN_FIELDS = 256
+    
+    UNITY_SETTINGS = {
+        "ar_foundation_version": "5.0+",
+        "tracking_mode": "WorldTracking",
+        "plane_detection": True,
+        "image_tracking": True
+    }
+    
+    def __init__(self, origin_lat: float = -37.8179, origin_lng: float = 144.9690,
+                 compact_markers: bool = False,
+                 metrics: Optional[MetricsRegistry] = None,
+                 history_size: int = 8,
+                 prefab_registry: Optional[PrefabRegistry] = None,
+                 origins: Optional[Union[OriginRegistry, Dict[str, Tuple[float, float]]]] = None):
+        """Initialize with Melbourne's Federation Square as origin
+        
+        compact_markers: store scene markers in a float32 MarkerBuffer
+            instead of a list of ARMarker objects
+        metrics: registry to record scene build/export latency and the
+            active scene count in; None disables instrumentation
+        history_size: past scene versions kept per field for diff_for_unity
+        prefab_registry: where scene prefabs are interned (default: the
+            shared PREFAB_REGISTRY)
+        origins: regional origins ({name: (lat, lng)} or an OriginRegistry).
+            Each field is built around the origin nearest its location;
+            without origins every field uses origin_lat/origin_lng.
+        """
         self.converter = GPSToARConverter(origin_lat, origin_lng)
+        if origins is None or isinstance(origins, OriginRegistry):
+            self.origins = origins
+        else:
+            self.origins = OriginRegistry(origins)
+        self.prefabs = PREFAB_REGISTRY if prefab_registry is None else prefab_registry
+        self.compact_markers = compact_markers
         self.active_scenes: Dict[str, ARScene] = {}
+        # Content hash each active scene was built from (see rebuild_changed)
+        self.scene_hashes: Dict[str, str] = {}
+        # Bumped every time a field's scene is (re)built
+        self.scene_versions: Dict[str, int] = {}
+        self.history_size = max(1, history_size)
+        self._scene_history: Dict[str, Deque[Tuple[int, ARScene]]] = {}
+        # field_id -> (version, {since_version: patch JSON}) for the current
+        # version; stored serialized so no caller can change a shared patch
+        self._diff_cache: Dict[str, Tuple[int, Dict[int, str]]] = {}
+        self.metrics = metrics
+        if metrics is not None:
+            self._scene_seconds = metrics.histogram(
+                "bridge_create_scene_seconds", "Time to build one field AR scene")
+            self._batch_seconds = metrics.histogram(
+                "bridge_create_scenes_batch_seconds", "Time to build a pooled batch of scenes")
+            self._scenes_created = metrics.counter(
+                "bridge_scenes_created_total", "Field AR scenes built")
+            self._export_seconds = metrics.histogram(
+                "bridge_export_seconds", "Time to export one scene", ["format"])
+            metrics.gauge("bridge_active_scenes", "Scenes held in active_scenes").track(
+                self, lambda bridge: len(bridge.active_scenes))
     
     def create_field_scene(self, field_data: Dict) -> ARScene:
         """Create AR scene from field data"""
-        markers = []
+        if self.metrics is None:
+            return self._build_field_scene(field_data)
+        start = time.perf_counter()
+        scene = self._build_field_scene(field_data)
+        self._scene_seconds.observe(time.perf_counter() - start)
+        self._scenes_created.inc()
+        return scene
+    
+    def add_origin(self, name: str, lat: float, lng: float):
+        """Add a regional origin; scenes built from now on may use it"""
+        if self.origins is None:
+            self.origins = OriginRegistry()
+        self.origins.add(name, lat, lng)
+    
+    def origin_for_field(self, field_data: Dict) -> Optional[str]:
+        """Regional origin nearest a field (None: the default origin)
+        
+        Located by the field's physical_location, or else its first GPS node.
+        """
+        if not self.origins:
+            return None
+        location = field_data.get("physical_location") or {}
+        if "lat" not in location or "lng" not in location:
+            location = next((node["coordinates"] for node in field_data.get("geometry_nodes", [])
+                             if "lat" in node.get("coordinates", {})
+                             and "lng" in node.get("coordinates", {})), None)
+            if location is None:
+                return None
+        return self.origins.nearest(location["lat"], location["lng"])
+    
+    def converter_for(self, origin: Optional[str]) -> GPSToARConverter:
+        """Converter of a regional origin, or the default converter for None"""
+        if origin is None:
+            return self.converter
+        return self.origins.converter(origin)
+    
+    def converter_origin(self, field_id: str) -> Dict:
+        """Origin of a field's scene frame: {"lat", "lng"}, plus "name" if regional"""
+        scene = self.get_scene(field_id)
+        origin = scene.origin if scene is not None else None
+        converter = self.converter_for(origin)
+        exported = {"lat": converter.origin_lat, "lng": converter.origin_lng}
+        if origin is not None:
+            exported["name"] = origin
+        return exported
+    
+    def _build_field_scene(self, field_data: Dict) -> ARScene:
+        nodes = field_data.get("geometry_nodes", [])
+        markers = MarkerBuffer(len(nodes)) if self.compact_markers else []
+        origin = self.origin_for_field(field_data)
+        converter = self.converter_for(origin)
+        
+        # Convert all physical reality coordinates in one batch
+        gps_rows = []
+        gps_coords = []
+        for i, node in enumerate(nodes):
+            coords = node.get("coordinates", {})
+            if "lat" in coords and "lng" in coords:
+                gps_rows.append(i)
+                gps_coords.append((coords["lat"], coords["lng"], coords.get("alt", 0.0)))
+        converted = {}
+        if gps_coords:
+            unity_coords = converter.gps_to_unity_batch(gps_coords).tolist()
+            converted = dict(zip(gps_rows, unity_coords))
         
         # Create markers for each geometry node
-        for node in field_data.get("geometry_nodes", []):
+        for i, node in enumerate(nodes):
             coords = node.get("coordinates", {})
             
-            if "lat" in coords and "lng" in coords:
+            if i in converted:
                 # Physical reality coordinates
-                unity_pos = self.converter.gps_to_unity(
-                    coords["lat"], 
-                    coords["lng"],
-                    coords.get("alt", 0.0)
-                )
+                position = converted[i]
             else:
                 # Already in Unity coordinates
-                unity_pos = Vector3(
+                position = (
                     coords.get("x", 0.0),
                     coords.get("y", 0.0),
                     coords.get("z", 0.0)
                 )
             
+            if self.compact_markers:
+                markers.append(
+                    node.get("id", ""),
+                    ARMarkerType.GEOMETRY_NODE,
+                    position,
+                    geometry_type=node.get("geometry_type", ""),
+                    layer=node.get("layer", "")
+                )
+                continue
+            
             marker = ARMarker(
                 id=node.get("id", ""),
                 marker_type=ARMarkerType.GEOMETRY_NODE,
-                position=unity_pos,
+                position=Vector3(*position),
                 rotation=Quaternion(0, 0, 0, 1),  # Identity rotation
                 scale=Vector3(1, 1, 1),
                 metadata={
@@ -204,6 +895,9 @@ class UnityARBridge:
             )
             markers.append(marker)
         
+        prefab_refs = [self.prefabs.geometry(node.get("geometry_type", "circle"))
+                       for node in nodes]
+        definitions = self.prefabs.definitions
         scene = ARScene(
             field_id=field_data.get("id", ""),
             markers=markers,
@@ -212,36 +906,350 @@ class UnityARBridge:
                 "color": "#FFFFFF",
                 "ambient_mode": "Skybox"
             },
-            geometry_prefabs=[
-                GeometryRenderer.create_geometry_prefab(
-                    node.get("geometry_type", "circle")
-                )
-                for node in field_data.get("geometry_nodes", [])
-            ]
+            geometry_prefabs=[definitions[ref] for ref in prefab_refs],
+            prefab_refs=prefab_refs,
+            origin=origin
         )
         
-        self.active_scenes[scene.field_id] = scene
+        self._store_scene(scene)
         return scene
     
+    def _store_scene(self, scene: ARScene):
+        """Make scene the active version for its field"""
+        field_id = scene.field_id
+        self.active_scenes[field_id] = scene
+        # Built outside rebuild_changed: its content hash is unknown
+        self.scene_hashes.pop(field_id, None)
+        version = self.scene_versions.get(field_id, 0) + 1
+        self.scene_versions[field_id] = version
+        history = self._scene_history.get(field_id)
+        if history is None:
+            history = self._scene_history[field_id] = deque(maxlen=self.history_size)
+        history.append((version, scene))
+    
+    def create_field_scenes(self, fields: List[Dict], workers: Optional[int] = None,
+                            chunk_size: Optional[int] = None,
+                            executor: str = "auto") -> List[ARScene]:
+        """Create AR scenes for many fields on a worker pool
+        
+        executor: "process", "thread", or "auto" (threads for small jobs).
+        Scenes are merged into active_scenes in input order, so the result
+        is identical to calling create_field_scene serially.
+        """
+        if executor not in ("auto", "process", "thread"):
+            raise ValueError(f"Unknown executor: {executor}")
+        if not fields:
+            return []
+        workers = max(1, workers or os.cpu_count() or 1)
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(fields) // (workers * 4)))
+        if executor == "auto":
+            executor = "thread" if len(fields) < self.PROCESS_POOL_MIN_FIELDS else "process"
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        
+        chunks = [fields[i:i + chunk_size] for i in range(0, len(fields), chunk_size)]
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        origin_lat = self.converter.origin_lat
+        origin_lng = self.converter.origin_lng
+        origins = self.origins.to_dict() if self.origins else None
+        
+        scenes: List[ARScene] = []
+        with pool_class(max_workers=workers) as pool:
+            # map() yields in submission order, keeping the merge deterministic
+            for chunk_scenes in pool.map(_create_scene_chunk,
+                                         [origin_lat] * len(chunks),
+                                         [origin_lng] * len(chunks),
+                                         [self.compact_markers] * len(chunks),
+                                         [origins] * len(chunks),
+                                         chunks):
+                scenes.extend(chunk_scenes)
+        
+        for scene in scenes:
+            if executor == "process" or self.prefabs is not PREFAB_REGISTRY:
+                # Workers interned into the shared registry (their own, in processes)
+                scene.prefab_refs = [self.prefabs.intern(prefab)
+                                     for prefab in scene.geometry_prefabs]
+                scene.geometry_prefabs = [self.prefabs[ref] for ref in scene.prefab_refs]
+            self._store_scene(scene)
+        if self.metrics is not None:
+            self._batch_seconds.observe(time.perf_counter() - start)
+            self._scenes_created.inc(len(scenes))
+        return scenes
+    
+    def rebuild_changed(self, fields: List[Dict]) -> List[str]:
+        """Rebuild only the scenes whose field content changed
+        
+        Returns the ids of the fields whose scenes were (re)built, in input
+        order. Fields with an unchanged content hash keep their scene.
+        """
+        rebuilt = []
+        for field_data in fields:
+            field_id = field_data.get("id", "")
+            content_hash = field_content_hash(field_data)
+            if (self.scene_hashes.get(field_id) == content_hash
+                    and field_id in self.active_scenes):
+                continue
+            self.create_field_scene(field_data)
+            self.scene_hashes[field_id] = content_hash
+            rebuilt.append(field_id)
+        return rebuilt
+    
+    def detached_builder(self) -> "UnityARBridge":
+        """Private bridge with this one's origins, marker storage and prefabs
+        
+        The bridge itself is not thread-safe. To build scenes on another
+        thread, create them on a detached builder there and hand them to
+        commit_scenes on the thread that owns this bridge.
+        """
+        return UnityARBridge(self.converter.origin_lat, self.converter.origin_lng,
+                             compact_markers=self.compact_markers,
+                             prefab_registry=self.prefabs,
+                             origins=self.origins.to_dict() if self.origins else None)
+    
+    def commit_scenes(self, built: List[Tuple[str, ARScene]]) -> List[str]:
+        """Store (content hash, scene) pairs built on a detached_builder
+        
+        Returns the ids of the fields whose scenes were stored, in order.
+        A field already holding a scene with the same content hash keeps it.
+        """
+        stored = []
+        for content_hash, scene in built:
+            field_id = scene.field_id
+            if (self.scene_hashes.get(field_id) == content_hash
+                    and field_id in self.active_scenes):
+                continue
+            self._store_scene(scene)
+            self.scene_hashes[field_id] = content_hash
+            stored.append(field_id)
+        if self.metrics is not None and stored:
+            self._scenes_created.inc(len(stored))
+        return stored
+    
     def get_scene(self, field_id: str) -> ARScene:
         """Get active AR scene by field ID"""
         return self.active_scenes.get(field_id)
     
     def export_for_unity(self, field_id: str) -> Dict:
         """Export scene configuration for Unity"""
+        if self.metrics is None:
+            return self._export_scene(field_id)
+        start = time.perf_counter()
+        exported = self._export_scene(field_id)
+        self._export_seconds.labels("json").observe(time.perf_counter() - start)
+        return exported
+    
+    def _export_scene(self, field_id: str) -> Dict:
         scene = self.get_scene(field_id)
         if scene:
             return {
                 "scene": scene.to_dict(),
-                "converter_origin": {
-                    "lat": self.converter.origin_lat,
-                    "lng": self.converter.origin_lng
-                },
-                "unity_settings": {
-                    "ar_foundation_version": "5.0+",
-                    "tracking_mode": "WorldTracking",
-                    "plane_detection": True,
-                    "image_tracking": True
-                }
+                "version": self.scene_versions.get(field_id, 0),
+                "converter_origin": self.converter_origin(field_id),
+                "unity_settings": dict(self.UNITY_SETTINGS)
             }
         return {}
+    
+    def export_instanced(self, field_id: str) -> Dict:
+        """Export a scene as per-prefab GPU instance batches
+        
+        Same scene as export_for_unity, but each prefab is listed once
+        (with its registry index) and markers are grouped by prefab into
+        batches of at most MAX_INSTANCES_PER_BATCH. Each batch has flat
+        position (xyz), rotation (xyzw) and scale (xyz) arrays ready for
+        DrawMeshInstanced, plus marker ids and layers. Returns {} for
+        unknown fields.
+        """
+        if self.metrics is None:
+            return self._export_instanced(field_id)
+        start = time.perf_counter()
+        exported = self._export_instanced(field_id)
+        self._export_seconds.labels("instanced").observe(time.perf_counter() - start)
+        return exported
+    
+    def _export_instanced(self, field_id: str) -> Dict:
+        scene = self.get_scene(field_id)
+        if not scene:
+            return {}
+        refs = scene.prefab_refs
+        if refs is None:
+            refs = [self.prefabs.intern(prefab) for prefab in scene.geometry_prefabs]
+        positions, rotations, scales = marker_transforms(scene.markers)
+        ids, layers = marker_ids_and_layers(scene.markers)
+        
+        prefab_refs = np.asarray(refs[:len(ids)], dtype=np.int64)
+        order = np.argsort(prefab_refs, kind="stable")
+        sorted_refs = prefab_refs[order]
+        starts = np.flatnonzero(np.diff(sorted_refs)) + 1
+        bounds = [0] + starts.tolist() + [len(order)]
+        batches = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if start == end:
+                continue
+            prefab = int(sorted_refs[start])
+            for chunk in range(start, end, MAX_INSTANCES_PER_BATCH):
+                rows = order[chunk:min(end, chunk + MAX_INSTANCES_PER_BATCH)]
+                row_list = rows.tolist()
+                batches.append({
+                    "prefab": prefab,
+                    "count": len(row_list),
+                    "marker_ids": [ids[i] for i in row_list],
+                    "layers": [layers[i] for i in row_list],
+                    "positions": positions[rows].ravel().tolist(),
+                    "rotations": rotations[rows].ravel().tolist(),
+                    "scales": scales[rows].ravel().tolist()
+                })
+        return {
+            "scene": {
+                "field_id": scene.field_id,
+                "prefabs": [dict(self.prefabs[ref], index=ref)
+                            for ref in sorted(set(prefab_refs.tolist()))],
+                "batches": batches,
+                "ambient_lighting": scene.ambient_lighting
+            },
+            "version": self.scene_versions.get(field_id, 0),
+            "converter_origin": self.converter_origin(field_id),
+            "unity_settings": dict(self.UNITY_SETTINGS)
+        }
+    
+    def diff_for_unity(self, field_id: str, since_version: int) -> Dict:
+        """Patch from since_version to the current scene of a field
+        
+        Returns {"field_id", "version", "base_version", "full": False,
+        "markers": {added, updated, removed}, "prefabs": {added, updated,
+        removed}} plus "ambient_lighting" when it changed. If since_version
+        has been evicted from the history (or was never issued), returns
+        {"full": True, "snapshot": <export_for_unity>} instead. Returns {}
+        for unknown fields. Patches are decoded afresh from a cached JSON
+        copy on every call, so callers may change them freely.
+        """
+        if self.get_scene(field_id) is None:
+            return {}
+        version = self.scene_versions[field_id]
+        cached_version, patches = self._diff_cache.get(field_id, (None, None))
+        if cached_version != version:
+            patches = {}
+            self._diff_cache[field_id] = (version, patches)
+        cached = patches.get(since_version)
+        if cached is not None:
+            return json.loads(cached)
+        patch = self._diff_scene(field_id, since_version, version)
+        if patch["full"]:
+            # Snapshots are not cached; they would pin a full export per field
+            return patch
+        # The fresh patch still shares prefab and lighting dicts with the scene
+        cached = patches[since_version] = json.dumps(patch, separators=(",", ":"))
+        return json.loads(cached)
+    
+    def _diff_scene(self, field_id: str, since_version: int, version: int) -> Dict:
+        patch = {"field_id": field_id, "version": version, "base_version": since_version}
+        base = None
+        for past_version, past_scene in self._scene_history[field_id]:
+            if past_version == since_version:
+                base = past_scene
+                break
+        if base is None or base.origin != self.active_scenes[field_id].origin:
+            # Evicted, or rebuilt in another origin's frame: every position moved
+            patch["full"] = True
+            patch["snapshot"] = self.export_for_unity(field_id)
+            return patch
+        
+        patch["full"] = False
+        old = base.to_dict()
+        new = self.active_scenes[field_id].to_dict() if since_version != version else old
+        patch["markers"] = diff_markers(old["markers"], new["markers"])
+        patch["prefabs"] = diff_prefabs(old["geometry_prefabs"], new["geometry_prefabs"])
+        if old["ambient_lighting"] != new["ambient_lighting"]:
+            patch["ambient_lighting"] = new["ambient_lighting"]
+        return patch
+    
+    def build_tiles(self, field_ids: Optional[List[str]] = None,
+                    origin: Optional[str] = None, **kwargs):
+        """Tile pyramid over the markers of several active scenes
+        
+        field_ids: scenes to include (default: every active scene).
+        origin: only scenes in this regional origin's frame. Tiles share
+            one frame, so scenes from several origins need one pyramid each.
+        kwargs go to scene_tiles.SceneTilePyramid (leaf_size_m, max_zoom,
+        lod_grid).
+        """
+        from scene_tiles import SceneTilePyramid
+        
+        if field_ids is None:
+            scenes = list(self.active_scenes.values())
+        else:
+            scenes = [self.active_scenes[field_id] for field_id in field_ids
+                      if field_id in self.active_scenes]
+        if origin is not None:
+            scenes = [scene for scene in scenes if scene.origin == origin]
+        frames = {scene.origin for scene in scenes}
+        if len(frames) > 1:
+            raise ValueError("scenes use different regional origins; pass origin=")
+        frame = frames.pop() if frames else origin
+        converter = self.converter_for(frame)
+        metadata = {"converter_origin": {"lat": converter.origin_lat,
+                                         "lng": converter.origin_lng}}
+        if frame is not None:
+            metadata["converter_origin"]["name"] = frame
+        return SceneTilePyramid.from_scenes(scenes, metadata=metadata, **kwargs)
+    
+    def export_tiles(self, directory: str, field_ids: Optional[List[str]] = None,
+                     origin: Optional[str] = None, **kwargs) -> Dict:
+        """Precompute every tile of build_tiles() to directory for static serving"""
+        return self.build_tiles(field_ids, origin, **kwargs).export(directory)
+    
+    def export_binary(self, field_id: str, double_precision: bool = False) -> bytes:
+        """Export scene configuration in the compact binary format
+        
+        Same content as export_for_unity; read it back with
+        scene_binary.BinarySceneReader. Returns b"" for unknown fields.
+        """
+        from scene_binary import encode_scene
+        
+        scene = self.get_scene(field_id)
+        if not scene:
+            return b""
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        encoded = encode_scene(
+            scene,
+            self.converter_origin(field_id),
+            dict(self.UNITY_SETTINGS),
+            version=self.scene_versions.get(field_id, 0),
+            double_precision=double_precision
+        )
+        if self.metrics is not None:
+            self._export_seconds.labels("binary").observe(time.perf_counter() - start)
+        return encoded
+    
+    def export_glb(self, field_id: str, lod: int = 0) -> bytes:
+        """Export a scene as a binary glTF (GLB) file
+        
+        Generated meshes for each prefab plus every marker transform in
+        one buffer, drawn with EXT_mesh_gpu_instancing; see scene_gltf.
+        lod picks the geometry_mesh LOD level. Returns b"" for unknown
+        fields.
+        """
+        from scene_gltf import encode_glb
+        
+        scene = self.get_scene(field_id)
+        if not scene:
+            return b""
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        encoded = encode_glb(
+            scene,
+            self.converter_origin(field_id),
+            dict(self.UNITY_SETTINGS),
+            version=self.scene_versions.get(field_id, 0),
+            lod=lod
+        )
+        if self.metrics is not None:
+            self._export_seconds.labels("glb").observe(time.perf_counter() - start)
+        return encoded
+    
+    def write_glb(self, field_id: str, path: str, lod: int = 0) -> int:
+        """Write export_glb(field_id) to path in one write; returns the bytes written"""
+        encoded = self.export_glb(field_id, lod)
+        if not encoded:
+            return 0
+        with open(path, "wb") as f:
+            f.write(encoded)
+        return len(encoded)